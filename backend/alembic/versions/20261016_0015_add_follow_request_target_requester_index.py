@@ -0,0 +1,26 @@
+"""Add reverse-direction lookup index for follow requests."""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "20261016_0015"
+down_revision: str | None = "20260221_0014"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_follow_requests_target_requester",
+        "follow_requests",
+        ["target_id", "requester_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_follow_requests_target_requester",
+        table_name="follow_requests",
+    )
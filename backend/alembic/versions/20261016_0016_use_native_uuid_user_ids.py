@@ -0,0 +1,84 @@
+"""Store user identifiers as native PostgreSQL uuid columns."""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "20261016_0016"
+down_revision: str | None = "20261016_0015"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+USER_ID_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("follows", "follower_id"),
+    ("follows", "followee_id"),
+    ("posts", "author_id"),
+    ("comments", "author_id"),
+    ("likes", "user_id"),
+    ("refresh_tokens", "user_id"),
+    ("dismissed_notifications", "user_id"),
+    ("saved_posts", "user_id"),
+    ("follow_requests", "requester_id"),
+    ("follow_requests", "target_id"),
+    ("user_blocks", "blocker_id"),
+    ("user_blocks", "blocked_id"),
+)
+
+
+def _user_foreign_keys(bind: sa.engine.Connection) -> list[tuple[str, str, list[str]]]:
+    inspector = sa.inspect(bind)
+    foreign_keys: list[tuple[str, str, list[str]]] = []
+    for table_name in sorted({table for table, _column in USER_ID_COLUMNS}):
+        for foreign_key in inspector.get_foreign_keys(table_name):
+            if foreign_key["referred_table"] != "users":
+                continue
+            name = foreign_key["name"]
+            if name is None:  # pragma: no cover - PostgreSQL always names FKs
+                continue
+            foreign_keys.append(
+                (table_name, name, list(foreign_key["constrained_columns"]))
+            )
+    return foreign_keys
+
+
+def _convert_user_id_columns(target_type: str) -> None:
+    bind = op.get_bind()
+    foreign_keys = _user_foreign_keys(bind)
+    for table_name, constraint_name, _columns in foreign_keys:
+        op.drop_constraint(constraint_name, table_name, type_="foreignkey")
+
+    for table_name, column_name in (("users", "id"), *USER_ID_COLUMNS):
+        op.execute(
+            sa.text(
+                f'ALTER TABLE "{table_name}" ALTER COLUMN "{column_name}" '
+                f'TYPE {target_type} USING "{column_name}"::{target_type}'
+            )
+        )
+
+    for table_name, constraint_name, columns in foreign_keys:
+        op.create_foreign_key(
+            constraint_name,
+            table_name,
+            "users",
+            columns,
+            ["id"],
+            ondelete="CASCADE",
+        )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        # Test suite uses SQLite, which keeps the textual identifiers.
+        return
+
+    _convert_user_id_columns("uuid")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        return
+
+    _convert_user_id_columns("varchar(36)")
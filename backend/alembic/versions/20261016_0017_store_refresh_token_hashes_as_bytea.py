@@ -0,0 +1,38 @@
+"""Store refresh-token digests as raw bytes on PostgreSQL."""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "20261016_0017"
+down_revision: str | None = "20261016_0016"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        # Test suite uses SQLite, which keeps the hex digests as text.
+        return
+
+    op.execute(
+        sa.text(
+            'ALTER TABLE "refresh_tokens" ALTER COLUMN "token_hash" '
+            "TYPE bytea USING decode(\"token_hash\", 'hex')"
+        )
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        return
+
+    op.execute(
+        sa.text(
+            'ALTER TABLE "refresh_tokens" ALTER COLUMN "token_hash" '
+            "TYPE varchar(128) USING encode(\"token_hash\", 'hex')"
+        )
+    )
@@ -0,0 +1,40 @@
+"""Cover dismissed notification ids in the per-user ordering index."""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "20261016_0018"
+down_revision: str | None = "20261016_0017"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # INCLUDE lets the listing query read notification ids straight from the
+    # index; a backward scan already serves the DESC ordering. SQLite ignores
+    # the PostgreSQL-only option and keeps the plain composite index.
+    op.drop_index(
+        "ix_dismissed_notifications_user_dismissed_at_id",
+        table_name="dismissed_notifications",
+    )
+    op.create_index(
+        "ix_dismissed_notifications_user_dismissed_at_id",
+        "dismissed_notifications",
+        ["user_id", "dismissed_at", "id"],
+        unique=False,
+        postgresql_include=["notification_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_dismissed_notifications_user_dismissed_at_id",
+        table_name="dismissed_notifications",
+    )
+    op.create_index(
+        "ix_dismissed_notifications_user_dismissed_at_id",
+        "dismissed_notifications",
+        ["user_id", "dismissed_at", "id"],
+        unique=False,
+    )
@@ -0,0 +1,30 @@
+"""Add partial index over each user's active refresh tokens."""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "20261016_0019"
+down_revision: str | None = "20261016_0018"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    active_predicate = sa.text("revoked_at IS NULL")
+    op.create_index(
+        "ix_refresh_tokens_user_active_issued_at",
+        "refresh_tokens",
+        ["user_id", "issued_at"],
+        unique=False,
+        postgresql_where=active_predicate,
+        sqlite_where=active_predicate,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_refresh_tokens_user_active_issued_at",
+        table_name="refresh_tokens",
+    )
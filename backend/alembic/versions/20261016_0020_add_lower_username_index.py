@@ -0,0 +1,28 @@
+"""Index lower(username) for case-insensitive identity lookups."""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "20261016_0020"
+down_revision: str | None = "20261016_0019"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # lower(email) is already covered by ux_users_email_lower and the login
+    # alias by its unique constraint; this closes the last lower() probe in
+    # registration and login lookups. Not unique: legacy usernames may differ
+    # only by case.
+    op.create_index(
+        "ix_users_username_lower",
+        "users",
+        [sa.text("lower(username)")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_username_lower", table_name="users")
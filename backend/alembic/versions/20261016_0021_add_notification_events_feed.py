@@ -0,0 +1,225 @@
+"""Add trigger-maintained notification_events feed table."""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "20261016_0021"
+down_revision: str | None = "20261016_0020"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+USER_ID_TYPE = sa.String(length=36).with_variant(
+    postgresql.UUID(as_uuid=False), "postgresql"
+)
+EVENT_COLUMNS = (
+    "recipient_id, kind, post_id, comment_id, actor_id, "
+    "notification_id, legacy_notification_id, occurred_at"
+)
+
+# Shared by the backfill and the triggers: {row} is NEW inside a trigger or
+# the source table for the backfill, and {source} the matching FROM list.
+# Self-comments and self-likes never notify, so they are not stored.
+COMMENT_EVENT_SELECT = """
+    SELECT posts.author_id, 'comment', {row}.post_id, {row}.id, {row}.author_id,
+           'comment-' || {row}.post_id || '-' || {row}.id, NULL, {row}.created_at
+    FROM {source}
+    WHERE posts.id = {row}.post_id AND posts.author_id <> {row}.author_id
+"""
+LIKE_EVENT_SELECT = """
+    SELECT posts.author_id, 'like', {row}.post_id, NULL, {row}.user_id,
+           'like-' || {row}.post_id || '-' || {row}.user_id,
+           'like-' || {row}.post_id, {row}.updated_at
+    FROM {source}
+    WHERE posts.id = {row}.post_id AND posts.author_id <> {row}.user_id
+"""
+DELETE_COMMENT_EVENT = (
+    "DELETE FROM notification_events WHERE kind = 'comment' AND comment_id = OLD.id"
+)
+DELETE_LIKE_EVENT = (
+    "DELETE FROM notification_events "
+    "WHERE kind = 'like' AND post_id = OLD.post_id AND actor_id = OLD.user_id"
+)
+UPDATE_LIKE_EVENT = (
+    "UPDATE notification_events SET occurred_at = NEW.updated_at "
+    "WHERE kind = 'like' AND post_id = NEW.post_id AND actor_id = NEW.user_id"
+)
+
+
+def _insert_events(select_sql: str, *, row: str = "NEW", source: str = "posts") -> str:
+    return f"INSERT INTO notification_events ({EVENT_COLUMNS})" + select_sql.format(
+        row=row,
+        source=source,
+    )
+
+
+def _create_postgresql_triggers() -> None:
+    op.execute(
+        sa.text(
+            f"""
+            CREATE FUNCTION notification_events_sync_comment() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                IF TG_OP = 'DELETE' THEN
+                    {DELETE_COMMENT_EVENT};
+                    RETURN OLD;
+                END IF;
+                {_insert_events(COMMENT_EVENT_SELECT)};
+                RETURN NEW;
+            END
+            $$
+            """
+        )
+    )
+    op.execute(
+        sa.text(
+            f"""
+            CREATE FUNCTION notification_events_sync_like() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                IF TG_OP = 'DELETE' THEN
+                    {DELETE_LIKE_EVENT};
+                    RETURN OLD;
+                ELSIF TG_OP = 'UPDATE' THEN
+                    {UPDATE_LIKE_EVENT};
+                    RETURN NEW;
+                END IF;
+                {_insert_events(LIKE_EVENT_SELECT)};
+                RETURN NEW;
+            END
+            $$
+            """
+        )
+    )
+    op.execute(
+        sa.text(
+            "CREATE TRIGGER trg_comments_notification_events "
+            "AFTER INSERT OR DELETE ON comments FOR EACH ROW "
+            "EXECUTE FUNCTION notification_events_sync_comment()"
+        )
+    )
+    op.execute(
+        sa.text(
+            "CREATE TRIGGER trg_likes_notification_events "
+            "AFTER INSERT OR DELETE OR UPDATE OF updated_at ON likes FOR EACH ROW "
+            "EXECUTE FUNCTION notification_events_sync_like()"
+        )
+    )
+
+
+def _create_sqlite_triggers() -> None:
+    triggers = (
+        (
+            "trg_comments_notification_events_insert",
+            "AFTER INSERT ON comments",
+            _insert_events(COMMENT_EVENT_SELECT),
+        ),
+        (
+            "trg_comments_notification_events_delete",
+            "AFTER DELETE ON comments",
+            DELETE_COMMENT_EVENT,
+        ),
+        (
+            "trg_likes_notification_events_insert",
+            "AFTER INSERT ON likes",
+            _insert_events(LIKE_EVENT_SELECT),
+        ),
+        (
+            "trg_likes_notification_events_update",
+            "AFTER UPDATE OF updated_at ON likes",
+            UPDATE_LIKE_EVENT,
+        ),
+        (
+            "trg_likes_notification_events_delete",
+            "AFTER DELETE ON likes",
+            DELETE_LIKE_EVENT,
+        ),
+    )
+    for name, timing, body in triggers:
+        op.execute(sa.text(f"CREATE TRIGGER {name} {timing} BEGIN {body}; END"))
+
+
+def upgrade() -> None:
+    op.create_table(
+        "notification_events",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("recipient_id", USER_ID_TYPE, nullable=False),
+        sa.Column("kind", sa.String(length=16), nullable=False),
+        sa.Column("post_id", sa.Integer(), nullable=False),
+        sa.Column("comment_id", sa.Integer(), nullable=True),
+        sa.Column("actor_id", USER_ID_TYPE, nullable=False),
+        sa.Column("notification_id", sa.String(length=191), nullable=False),
+        sa.Column("legacy_notification_id", sa.String(length=191), nullable=True),
+        sa.Column("occurred_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["recipient_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["actor_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["post_id"], ["posts.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["comment_id"], ["comments.id"], ondelete="CASCADE"),
+    )
+    op.create_index(
+        "ix_notification_events_recipient_occurred_at",
+        "notification_events",
+        ["recipient_id", "occurred_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_notification_events_post_actor",
+        "notification_events",
+        ["post_id", "actor_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_notification_events_comment_id",
+        "notification_events",
+        ["comment_id"],
+        unique=False,
+    )
+
+    op.execute(
+        sa.text(
+            _insert_events(
+                COMMENT_EVENT_SELECT, row="comments", source="comments, posts"
+            )
+        )
+    )
+    op.execute(
+        sa.text(_insert_events(LIKE_EVENT_SELECT, row="likes", source="likes, posts"))
+    )
+
+    if op.get_bind().dialect.name == "postgresql":
+        _create_postgresql_triggers()
+    else:
+        _create_sqlite_triggers()
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(sa.text("DROP TRIGGER trg_likes_notification_events ON likes"))
+        op.execute(
+            sa.text("DROP TRIGGER trg_comments_notification_events ON comments")
+        )
+        op.execute(sa.text("DROP FUNCTION notification_events_sync_like()"))
+        op.execute(sa.text("DROP FUNCTION notification_events_sync_comment()"))
+    else:
+        for name in (
+            "trg_likes_notification_events_delete",
+            "trg_likes_notification_events_update",
+            "trg_likes_notification_events_insert",
+            "trg_comments_notification_events_delete",
+            "trg_comments_notification_events_insert",
+        ):
+            op.execute(sa.text(f"DROP TRIGGER {name}"))
+
+    op.drop_index(
+        "ix_notification_events_comment_id", table_name="notification_events"
+    )
+    op.drop_index(
+        "ix_notification_events_post_actor", table_name="notification_events"
+    )
+    op.drop_index(
+        "ix_notification_events_recipient_occurred_at",
+        table_name="notification_events",
+    )
+    op.drop_table("notification_events")
@@ -0,0 +1,41 @@
+"""Cover the full stream sort key in the notification_events index."""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "20261016_0022"
+down_revision: str | None = "20261016_0021"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # The stream orders by occurred_at, post_id, comment_id, actor_id (all
+    # DESC). With every tiebreaker in the index, a backward scan returns rows
+    # in final order, so the LIMIT stops early instead of sorting the
+    # recipient's events. The backward scan of ASC NULLS LAST matches
+    # PostgreSQL's DESC NULLS FIRST for comment_id.
+    op.drop_index(
+        "ix_notification_events_recipient_occurred_at",
+        table_name="notification_events",
+    )
+    op.create_index(
+        "ix_notification_events_recipient_sort",
+        "notification_events",
+        ["recipient_id", "occurred_at", "post_id", "comment_id", "actor_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_notification_events_recipient_sort",
+        table_name="notification_events",
+    )
+    op.create_index(
+        "ix_notification_events_recipient_occurred_at",
+        "notification_events",
+        ["recipient_id", "occurred_at"],
+        unique=False,
+    )
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.deps import _require_user_id, get_current_user, get_db
@@ -30,6 +30,7 @@ from services.notifications.stream import (
     MAX_STREAM_NOTIFICATIONS,
     load_notification_stream,
 )
+from services.notifications.stream_cache import get_notification_stream_cache
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
@@ -55,14 +56,34 @@ async def get_notification_stream(
     follow_limit: Annotated[int, Query(ge=1, le=MAX_STREAM_FOLLOW_ITEMS)] = DEFAULT_STREAM_FOLLOW_ITEMS,
     session: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> NotificationStreamResponse:
+) -> Response:
     user_id = _require_user_id(current_user, detail="User record missing identifier")
-    return await load_notification_stream(
+    stream_cache = get_notification_stream_cache()
+    cached_payload, cache_version = await stream_cache.get(
+        user_id,
+        limit=limit,
+        follow_limit=follow_limit,
+    )
+    if cached_payload is not None:
+        return Response(content=cached_payload, media_type="application/json")
+
+    stream = await load_notification_stream(
         session,
         user_id,
         limit=limit,
         follow_limit=follow_limit,
     )
+    # The stream is serialized once and sent as-is, skipping FastAPI's
+    # response_model re-validation; the same bytes go to the cache.
+    payload = stream.model_dump_json().encode()
+    await stream_cache.set(
+        user_id,
+        limit=limit,
+        follow_limit=follow_limit,
+        version=cache_version,
+        payload=payload,
+    )
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("/dismissed", response_model=DismissNotificationResponse)
@@ -73,7 +94,7 @@ async def dismiss_notification(
 ) -> DismissNotificationResponse:
     user_id = _require_user_id(current_user, detail="User record missing identifier")
     try:
-        return await dismiss_notification_for_user(
+        dismissed = await dismiss_notification_for_user(
             session,
             user_id,
             notification_id=payload.notification_id,
@@ -83,6 +104,8 @@ async def dismiss_notification(
             status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
             detail=str(exc),
         ) from exc
+    await get_notification_stream_cache().invalidate(user_id)
+    return dismissed
 
 
 @router.post("/dismissed/bulk", response_model=DismissNotificationsBulkResponse)
@@ -104,4 +127,5 @@ async def dismiss_notifications_bulk(
             detail=str(exc),
         ) from exc
 
+    await get_notification_stream_cache().invalidate(user_id)
     return DismissNotificationsBulkResponse(processed_count=processed_count)
@@ -31,6 +31,7 @@ from services import (
     upload_image_bytes,
 )
 from services.account_blocks import build_not_blocked_either_direction_filter
+from services.notifications.stream_cache import get_notification_stream_cache
 from services.post_policy import (
     build_author_view_filter,
     require_post_interaction_access,
@@ -462,6 +463,7 @@ async def delete_post(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete post",
         ) from exc
+    await get_notification_stream_cache().invalidate(viewer_id)
 
     try:
         await asyncio.to_thread(delete_object, object_key)
@@ -544,7 +546,7 @@ async def create_comment(
 ) -> CommentResponse:
     viewer_id = _require_user_id(current_user, detail="User record missing identifier")
 
-    await require_post_interaction_access(
+    post_author_id = await require_post_interaction_access(
         session,
         viewer_id=viewer_id,
         post_id=post_id,
@@ -564,6 +566,8 @@ async def create_comment(
     session.add(comment)
     await session.commit()
     await session.refresh(comment)
+    if post_author_id != viewer_id:
+        await get_notification_stream_cache().invalidate(post_author_id)
 
     author_name = current_user.name
     author_username = current_user.username
@@ -587,7 +591,7 @@ async def delete_comment(
     post_author_column = cast(ColumnElement[str], Post.author_id)
     comment_author_column = cast(ColumnElement[str], Comment.author_id)
     result = await session.execute(
-        select(comment_entity)
+        select(comment_entity, post_author_column)
         .join(Post, _eq(Post.id, Comment.post_id))
         .where(
             _eq(Comment.post_id, post_id),
@@ -599,9 +603,11 @@ async def delete_comment(
         )
         .limit(1)
     )
-    comment = result.scalar_one_or_none()
-    if comment is None:
+    row = result.one_or_none()
+    if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found")
+    comment, post_author_id = row
+    comment_author_id = comment.author_id
 
     await session.delete(comment)
     try:
@@ -612,6 +618,8 @@ async def delete_comment(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete comment",
         ) from exc
+    if post_author_id != comment_author_id:
+        await get_notification_stream_cache().invalidate(post_author_id)
 
     return {"detail": "Deleted"}
 
@@ -776,7 +784,7 @@ async def like_post(
 ) -> dict[str, Any]:
     viewer_id = _require_user_id(current_user, detail="User record missing identifier")
 
-    await require_post_interaction_access(
+    post_author_id = await require_post_interaction_access(
         session,
         viewer_id=viewer_id,
         post_id=post_id,
@@ -800,6 +808,9 @@ async def like_post(
             await session.rollback()
             if not is_unique_violation(exc):
                 raise
+        else:
+            if post_author_id != viewer_id:
+                await get_notification_stream_cache().invalidate(post_author_id)
     like_count = await _get_like_count(session, post_id, viewer_id=viewer_id)
     return {"detail": "Liked", "like_count": like_count}
 
@@ -812,7 +823,7 @@ async def unlike_post(
 ) -> dict[str, Any]:
     viewer_id = _require_user_id(current_user, detail="User record missing identifier")
 
-    await require_post_interaction_access(
+    post_author_id = await require_post_interaction_access(
         session,
         viewer_id=viewer_id,
         post_id=post_id,
@@ -830,5 +841,7 @@ async def unlike_post(
     if like_obj is not None:
         await session.delete(like_obj)
         await session.commit()
+        if post_author_id != viewer_id:
+            await get_notification_stream_cache().invalidate(post_author_id)
     like_count = await _get_like_count(session, post_id, viewer_id=viewer_id)
     return {"detail": "Unliked", "like_count": like_count}
@@ -23,8 +23,7 @@ from .pagination import MAX_PAGE_SIZE, set_next_offset_header
 from .post_views import collect_like_meta
 from services.account_privacy import (
     can_view_account_content,
-    is_follow_request_pending,
-    is_following,
+    get_follow_state,
 )
 from services.auth import DEFAULT_AVATAR_OBJECT_KEY
 from services.account_blocks import (
@@ -43,6 +42,7 @@ from services import (
     read_upload_file,
     upload_image_bytes,
 )
+from services.notifications.stream_cache import get_notification_stream_cache
 
 router = APIRouter(tags=["users"])
 MAX_PROFILE_NAME_LENGTH = 80
@@ -58,6 +58,25 @@ async def _find_user_by_username(
     return result.scalar_one_or_none()
 
 
+async def _find_user_id_pair_by_username(
+    session: AsyncSession,
+    first_username: str,
+    second_username: str,
+) -> tuple[str | None, str | None]:
+    """Resolve two usernames to user ids with a single IN lookup."""
+    user_id_column = cast(ColumnElement[str], User.id)
+    username_column = cast(ColumnElement[str], User.username)
+    result = await session.execute(
+        select(username_column, user_id_column).where(
+            username_column.in_((first_username, second_username))
+        )
+    )
+    ids_by_username: dict[str, str] = {
+        username: user_id for username, user_id in result.all()
+    }
+    return ids_by_username.get(first_username), ids_by_username.get(second_username)
+
+
 def _raise_user_not_found() -> NoReturn:
     raise HTTPException(
         status_code=status.HTTP_404_NOT_FOUND,
@@ -65,6 +84,20 @@ def _raise_user_not_found() -> NoReturn:
     )
 
 
+def _raise_forbidden() -> NoReturn:
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Forbidden",
+    )
+
+
+def _raise_follow_request_not_found() -> NoReturn:
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Follow request not found",
+    )
+
+
 async def _resolve_target_user_context(
     session: AsyncSession,
     *,
@@ -326,14 +359,15 @@ async def update_me(
         updated = True
 
     if updated:
+        made_public_user_id: str | None = None
         if previous_is_private and not current_user.is_private:
-            current_user_id = _require_user_id(
+            made_public_user_id = _require_user_id(
                 current_user,
                 detail="User record missing identifier",
             )
             await session.execute(
                 delete(FollowRequest).where(
-                    _eq(FollowRequest.target_id, current_user_id),
+                    _eq(FollowRequest.target_id, made_public_user_id),
                 )
             )
         session.add(current_user)
@@ -354,6 +388,10 @@ async def update_me(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to update profile",
             ) from exc
+        if made_public_user_id is not None:
+            # Pending requests were dropped above; the cached stream still
+            # lists them.
+            await get_notification_stream_cache().invalidate(made_public_user_id)
         await session.refresh(current_user)
         if (
             uploaded_avatar_key is not None
@@ -476,6 +514,8 @@ async def block_user(
         blocker_id=blocker_id,
         blocked_id=blocked_id,
     )
+    if created:
+        await get_notification_stream_cache().invalidate(blocker_id, blocked_id)
     return BlockMutationResponse(
         detail="User blocked" if created else "Already blocked",
         blocked=True,
@@ -511,6 +551,8 @@ async def unblock_user(
         blocker_id=blocker_id,
         blocked_id=blocked_id,
     )
+    if removed:
+        await get_notification_stream_cache().invalidate(blocker_id, blocked_id)
     return BlockMutationResponse(
         detail="User unblocked" if removed else "User was not blocked",
         blocked=False,
@@ -543,18 +585,15 @@ async def follow_user(
             detail="Cannot follow this user",
         )
 
-    if await is_following(
+    follow_state = await get_follow_state(
         session,
         follower_id=follower_id,
         followee_id=followee_id,
-    ):
+    )
+    if follow_state.is_following:
         return FollowMutationResponse(detail="Already following", state="following")
 
-    has_pending_request = await is_follow_request_pending(
-        session,
-        requester_id=follower_id,
-        target_id=followee_id,
-    )
+    has_pending_request = follow_state.is_requested
 
     if followee.is_private:
         if has_pending_request:
@@ -568,6 +607,7 @@ async def follow_user(
             if is_unique_violation(exc):
                 return FollowMutationResponse(detail="Follow request pending", state="requested")
             raise
+        await get_notification_stream_cache().invalidate(followee_id)
         return FollowMutationResponse(detail="Follow request sent", state="requested")
 
     if has_pending_request:
@@ -586,6 +626,7 @@ async def follow_user(
         if is_unique_violation(exc):
             return FollowMutationResponse(detail="Already following", state="following")
         raise
+    await get_notification_stream_cache().invalidate(followee_id)
     return FollowMutationResponse(detail="Followed", state="following")
 
 
@@ -612,16 +653,13 @@ async def unfollow_user(
             detail="Cannot modify follow relationship for this user",
         )
 
-    follow_deleted = await is_following(
+    follow_state = await get_follow_state(
         session,
         follower_id=follower_id,
         followee_id=followee_id,
     )
-    request_deleted = await is_follow_request_pending(
-        session,
-        requester_id=follower_id,
-        target_id=followee_id,
-    )
+    follow_deleted = follow_state.is_following
+    request_deleted = follow_state.is_requested
 
     await session.execute(
         delete(Follow).where(
@@ -636,6 +674,7 @@ async def unfollow_user(
         )
     )
     await session.commit()
+    await get_notification_stream_cache().invalidate(followee_id)
     if follow_deleted:
         return FollowMutationResponse(detail="Unfollowed", state="none")
     if request_deleted:
@@ -671,17 +710,14 @@ async def get_follow_status(
                 is_blocked_by=False,
             )
 
-        following_status = await is_following(
+        follow_state = await get_follow_state(
             session,
             follower_id=viewer_id,
             followee_id=target_id,
         )
+        following_status = follow_state.is_following
         if target_user.is_private and not following_status:
-            is_requested = await is_follow_request_pending(
-                session,
-                requester_id=viewer_id,
-                target_id=target_id,
-            )
+            is_requested = follow_state.is_requested
 
     return FollowStatusResponse(
         is_following=following_status,
@@ -858,39 +894,33 @@ async def list_follow_requests(
     return [UserProfilePublic.model_validate(user) for user in requests]
 
 
-@router.post(
-    "/users/{username}/follow-requests/{requester_username}/approve",
-    status_code=status.HTTP_200_OK,
-)
-async def approve_follow_request(
-    username: str,
+async def _resolve_follow_request_actors(
+    session: AsyncSession,
+    *,
+    current_user: User,
+    target_username: str,
     requester_username: str,
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db),
-) -> dict[str, str]:
-    target_user = await _find_user_by_username(session, username)
-    requester = await _find_user_by_username(session, requester_username)
-    if target_user is None or requester is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    self_request_detail: str | None = None,
+) -> tuple[str, str]:
+    """Authorize an approve/decline call and return (requester_id, target_id)."""
+    target_user_id, requester_id = await _find_user_id_pair_by_username(
+        session,
+        target_username,
+        requester_username,
+    )
+    if target_user_id is None or requester_id is None:
+        _raise_user_not_found()
 
     current_user_id = _require_user_id(
         current_user,
         detail="User record missing identifier",
     )
-    target_user_id = _require_user_id(
-        target_user,
-        detail="User record missing identifier",
-    )
-    requester_id = _require_user_id(
-        requester,
-        detail="User record missing identifier",
-    )
     if current_user_id != target_user_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
-    if requester_id == target_user_id:
+        _raise_forbidden()
+    if self_request_detail is not None and requester_id == target_user_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot approve your own follow request",
+            detail=self_request_detail,
         )
     block_state = await get_block_state(
         session,
@@ -902,24 +932,51 @@ async def approve_follow_request(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Cannot process follow request for blocked user",
         )
+    return requester_id, target_user_id
 
-    has_request = await is_follow_request_pending(
-        session,
-        requester_id=requester_id,
-        target_id=target_user_id,
-    )
-    if not has_request:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Follow request not found",
-        )
 
-    await session.execute(
-        delete(FollowRequest).where(
+async def _delete_follow_request(
+    session: AsyncSession,
+    *,
+    requester_id: str,
+    target_id: str,
+) -> bool:
+    """Delete a pending follow request, returning whether one existed."""
+    result = await session.execute(
+        delete(FollowRequest)
+        .where(
             _eq(FollowRequest.requester_id, requester_id),
-            _eq(FollowRequest.target_id, target_user_id),
+            _eq(FollowRequest.target_id, target_id),
         )
+        .returning(cast(ColumnElement[str], FollowRequest.requester_id))
+    )
+    return result.first() is not None
+
+
+@router.post(
+    "/users/{username}/follow-requests/{requester_username}/approve",
+    status_code=status.HTTP_200_OK,
+)
+async def approve_follow_request(
+    username: str,
+    requester_username: str,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
+) -> dict[str, str]:
+    requester_id, target_user_id = await _resolve_follow_request_actors(
+        session,
+        current_user=current_user,
+        target_username=username,
+        requester_username=requester_username,
+        self_request_detail="Cannot approve your own follow request",
     )
+
+    if not await _delete_follow_request(
+        session,
+        requester_id=requester_id,
+        target_id=target_user_id,
+    ):
+        _raise_follow_request_not_found()
     session.add(Follow(follower_id=requester_id, followee_id=target_user_id))
     try:
         await session.commit()
@@ -934,8 +991,10 @@ async def approve_follow_request(
             )
         )
         await session.commit()
+        await get_notification_stream_cache().invalidate(target_user_id)
         return {"detail": "Already following"}
 
+    await get_notification_stream_cache().invalidate(target_user_id)
     return {"detail": "Follow request approved"}
 
 
@@ -949,52 +1008,19 @@ async def decline_follow_request(
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_db),
 ) -> dict[str, str]:
-    target_user = await _find_user_by_username(session, username)
-    requester = await _find_user_by_username(session, requester_username)
-    if target_user is None or requester is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-
-    current_user_id = _require_user_id(
-        current_user,
-        detail="User record missing identifier",
-    )
-    target_user_id = _require_user_id(
-        target_user,
-        detail="User record missing identifier",
-    )
-    requester_id = _require_user_id(
-        requester,
-        detail="User record missing identifier",
-    )
-    if current_user_id != target_user_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
-    block_state = await get_block_state(
+    requester_id, target_user_id = await _resolve_follow_request_actors(
         session,
-        viewer_id=target_user_id,
-        target_id=requester_id,
+        current_user=current_user,
+        target_username=username,
+        requester_username=requester_username,
     )
-    if block_state.is_blocked or block_state.is_blocked_by:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Cannot process follow request for blocked user",
-        )
 
-    has_request = await is_follow_request_pending(
+    if not await _delete_follow_request(
         session,
         requester_id=requester_id,
         target_id=target_user_id,
-    )
-    if not has_request:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Follow request not found",
-        )
-
-    await session.execute(
-        delete(FollowRequest).where(
-            _eq(FollowRequest.requester_id, requester_id),
-            _eq(FollowRequest.target_id, target_user_id),
-        )
-    )
+    ):
+        _raise_follow_request_not_found()
     await session.commit()
+    await get_notification_stream_cache().invalidate(target_user_id)
     return {"detail": "Follow request declined"}
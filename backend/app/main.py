@@ -32,6 +32,7 @@ def create_app() -> FastAPI:
         limiter_factory=get_rate_limiter,
         exempt_paths=("/healthz",),
         exempt_prefixes=("/docs", "/openapi.json", "/redoc"),
+        overlap_safe_methods=settings.rate_limit_overlap_safe_methods,
     )
 
     app.include_router(api_router)
@@ -22,6 +22,9 @@ _password_hasher = PasswordHasher(
 )
 
 
+_ARGON2_HASH_PREFIX = "$argon2"
+
+
 def hash_password(password: str) -> str:
     """Return an Argon2id hash for the supplied password."""
     if not password:
@@ -31,6 +34,10 @@ def hash_password(password: str) -> str:
 
 def verify_password(password: str, hashed_password: str) -> bool:
     """Check whether a password matches a stored Argon2id hash."""
+    # Empty or foreign-format hashes can never verify; reject them before the
+    # hasher parses the string and raises.
+    if not hashed_password or not hashed_password.startswith(_ARGON2_HASH_PREFIX):
+        return False
     try:
         return _password_hasher.verify(hashed_password, password)
     except (VerifyMismatchError, InvalidHash):
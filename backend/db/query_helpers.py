@@ -1,9 +1,20 @@
 """Shared SQLAlchemy column expression helpers."""
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
 from typing import Any, cast
 
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.sql import ColumnElement
+from sqlalchemy.sql.dml import Insert
+
+# Typed loosely: both dialect inserts have on_conflict_do_nothing, but their
+# inferred common base (the core Insert) does not.
+_CONFLICT_AWARE_INSERTS: dict[str, Callable[[Any], Any]] = {
+    "postgresql": postgresql_insert,
+    "sqlite": sqlite_insert,
+}
 
 
 def _eq(column: Any, value: Any) -> ColumnElement[bool]:
@@ -24,3 +35,20 @@ def _ilike(column: Any, pattern: str) -> ColumnElement[bool]:
 
 def _is_not_null(column: Any) -> ColumnElement[bool]:
     return cast(ColumnElement[bool], column.isnot(None))
+
+
+def insert_ignoring_conflicts(
+    dialect_name: str,
+    model: Any,
+    *,
+    index_elements: Sequence[str],
+) -> Insert:
+    """Return an INSERT that skips rows conflicting on ``index_elements``."""
+    insert_factory = _CONFLICT_AWARE_INSERTS.get(dialect_name)
+    if insert_factory is None:
+        raise NotImplementedError(
+            f"ON CONFLICT inserts are not supported for dialect {dialect_name!r}"
+        )
+    return insert_factory(model).on_conflict_do_nothing(
+        index_elements=list(index_elements)
+    )
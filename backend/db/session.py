@@ -6,7 +6,25 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 
 from core.config import settings
 
-async_engine = create_async_engine(settings.database_url, echo=settings.debug)
+
+def _build_connect_args(database_url: str, statement_cache_size: int) -> dict[str, int]:
+    """Size asyncpg's server-side and SQLAlchemy's prepared statement caches."""
+    if not database_url.startswith("postgresql+asyncpg"):
+        return {}
+    return {
+        "statement_cache_size": statement_cache_size,
+        "prepared_statement_cache_size": statement_cache_size,
+    }
+
+
+async_engine = create_async_engine(
+    settings.database_url,
+    echo=settings.debug,
+    connect_args=_build_connect_args(
+        settings.database_url,
+        settings.database_statement_cache_size,
+    ),
+)
 
 AsyncSessionMaker = async_sessionmaker(
     async_engine,
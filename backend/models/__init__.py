@@ -5,6 +5,7 @@ from .dismissed_notification import DismissedNotification
 from .follow import Follow
 from .follow_request import FollowRequest
 from .like import Like
+from .notification_event import NotificationEvent
 from .post import Post
 from .refresh_token import RefreshToken
 from .saved_post import SavedPost
@@ -19,6 +20,7 @@ __all__ = [
     "Like",
     "Comment",
     "DismissedNotification",
+    "NotificationEvent",
     "RefreshToken",
     "SavedPost",
     "UserBlock",
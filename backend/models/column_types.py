@@ -0,0 +1,44 @@
+"""Shared column types for SQLModel tables."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import String
+from sqlalchemy.dialects.postgresql import BYTEA
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator, TypeEngine
+
+# User identifiers are canonical UUID strings in Python. PostgreSQL stores them
+# as native 16-byte uuid values; other backends (SQLite in tests) keep text.
+USER_ID_TYPE = String(36).with_variant(PG_UUID(as_uuid=False), "postgresql")
+
+
+class HexDigest(TypeDecorator[str]):
+    """Hex digest string in Python, raw bytes in PostgreSQL.
+
+    PostgreSQL stores the digest as bytea (half the width of its hex form, so
+    the unique index is smaller); other backends keep the hex text.
+    """
+
+    impl = String(128)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(BYTEA())
+        return dialect.type_descriptor(String(128))
+
+    def process_bind_param(self, value: str | None, dialect: Dialect) -> Any:
+        if value is None or dialect.name != "postgresql":
+            return value
+        return bytes.fromhex(value)
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> str | None:
+        if value is None or dialect.name != "postgresql":
+            return value
+        return bytes(value).hex()
+
+
+__all__ = ["USER_ID_TYPE", "HexDigest"]
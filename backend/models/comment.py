@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from datetime import datetime
-from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, Text, func
 from sqlmodel import Field, SQLModel
 
+from .column_types import USER_ID_TYPE
+
 
 class Comment(SQLModel, table=True):
     """Comments authored on posts."""
@@ -24,7 +26,7 @@ class Comment(SQLModel, table=True):
     )
     author_id: str = Field(
         sa_column=Column(
-            String(36),
+            USER_ID_TYPE,
             ForeignKey("users.id", ondelete="CASCADE"),
             nullable=False,
             index=True,
@@ -7,6 +7,8 @@ from datetime import datetime
 from sqlalchemy import Column, DateTime, ForeignKey, String, UniqueConstraint, func
 from sqlmodel import Field, SQLModel
 
+from .column_types import USER_ID_TYPE
+
 
 class DismissedNotification(SQLModel, table=True):
     """Tracks per-user dismissed notification identifiers."""
@@ -23,12 +25,14 @@ class DismissedNotification(SQLModel, table=True):
     id: int | None = Field(default=None, primary_key=True)
     user_id: str = Field(
         sa_column=Column(
-            String(36),
+            USER_ID_TYPE,
             ForeignKey("users.id", ondelete="CASCADE"),
             nullable=False,
             index=True,
         )
     )
+    # Identifiers embed post ids and user UUIDs (e.g. "like-<post>-<uuid>"), so
+    # they are not fixed width; VARCHAR only stores the actual length anyway.
     notification_id: str = Field(
         sa_column=Column(String(191), nullable=False)
     )
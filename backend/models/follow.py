@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from datetime import datetime
-from sqlalchemy import Column, DateTime, ForeignKey, Index, String, func
+from sqlalchemy import Column, DateTime, ForeignKey, Index, func
 from sqlmodel import Field, SQLModel
 
+from .column_types import USER_ID_TYPE
+
 
 class Follow(SQLModel, table=True):
     """Represents a follower/followee relationship."""
@@ -17,14 +19,14 @@ class Follow(SQLModel, table=True):
 
     follower_id: str = Field(
         sa_column=Column(
-            String(36),
+            USER_ID_TYPE,
             ForeignKey("users.id", ondelete="CASCADE"),
             primary_key=True,
         )
     )
     followee_id: str = Field(
         sa_column=Column(
-            String(36),
+            USER_ID_TYPE,
             ForeignKey("users.id", ondelete="CASCADE"),
             primary_key=True,
         )
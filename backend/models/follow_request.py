@@ -4,9 +4,11 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Index, String, func
+from sqlalchemy import Column, DateTime, ForeignKey, Index, func
 from sqlmodel import Field, SQLModel
 
+from .column_types import USER_ID_TYPE
+
 
 class FollowRequest(SQLModel, table=True):
     """Represents a pending request to follow a private account."""
@@ -18,18 +20,23 @@ class FollowRequest(SQLModel, table=True):
             "target_id",
             "created_at",
         ),
+        Index(
+            "ix_follow_requests_target_requester",
+            "target_id",
+            "requester_id",
+        ),
     )
 
     requester_id: str = Field(
         sa_column=Column(
-            String(36),
+            USER_ID_TYPE,
             ForeignKey("users.id", ondelete="CASCADE"),
             primary_key=True,
         )
     )
     target_id: str = Field(
         sa_column=Column(
-            String(36),
+            USER_ID_TYPE,
             ForeignKey("users.id", ondelete="CASCADE"),
             primary_key=True,
         )
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from datetime import datetime
-from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, func
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, func
 from sqlmodel import Field, SQLModel
 
+from .column_types import USER_ID_TYPE
+
 
 class Like(SQLModel, table=True):
     """Tracks which users liked which posts."""
@@ -18,7 +20,7 @@ class Like(SQLModel, table=True):
 
     user_id: str = Field(
         sa_column=Column(
-            String(36),
+            USER_ID_TYPE,
             ForeignKey("users.id", ondelete="CASCADE"),
             primary_key=True,
         )
@@ -0,0 +1,73 @@
+"""Denormalized notification feed model."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String
+from sqlmodel import Field, SQLModel
+
+from .column_types import USER_ID_TYPE
+
+
+class NotificationEvent(SQLModel, table=True):
+    """One comment or like notification addressed to a post author.
+
+    Rows are maintained by database triggers on ``comments`` and ``likes``
+    (see the 20261016_0021 migration), so Core-level inserts and deletes
+    stay in sync without going through the ORM.
+    """
+
+    __tablename__ = "notification_events"
+    __table_args__ = (
+        Index(
+            "ix_notification_events_recipient_sort",
+            "recipient_id",
+            "occurred_at",
+            "post_id",
+            "comment_id",
+            "actor_id",
+        ),
+        Index("ix_notification_events_post_actor", "post_id", "actor_id"),
+        Index("ix_notification_events_comment_id", "comment_id"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    recipient_id: str = Field(
+        sa_column=Column(
+            USER_ID_TYPE,
+            ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        )
+    )
+    kind: str = Field(sa_column=Column(String(16), nullable=False))
+    post_id: int = Field(
+        sa_column=Column(
+            Integer,
+            ForeignKey("posts.id", ondelete="CASCADE"),
+            nullable=False,
+        )
+    )
+    comment_id: int | None = Field(
+        default=None,
+        sa_column=Column(
+            Integer,
+            ForeignKey("comments.id", ondelete="CASCADE"),
+            nullable=True,
+        ),
+    )
+    actor_id: str = Field(
+        sa_column=Column(
+            USER_ID_TYPE,
+            ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        )
+    )
+    notification_id: str = Field(sa_column=Column(String(191), nullable=False))
+    # Likes were once dismissed by post alone ("like-<post>"); comments have none.
+    legacy_notification_id: str | None = Field(
+        default=None, sa_column=Column(String(191), nullable=True)
+    )
+    occurred_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False)
+    )
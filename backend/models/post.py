@@ -6,6 +6,8 @@ from datetime import datetime
 from sqlalchemy import Column, DateTime, ForeignKey, Index, String, Text, func
 from sqlmodel import Field, SQLModel
 
+from .column_types import USER_ID_TYPE
+
 
 class Post(SQLModel, table=True):
     """User generated photo post."""
@@ -16,7 +18,7 @@ class Post(SQLModel, table=True):
     id: int | None = Field(default=None, primary_key=True)
     author_id: str = Field(
         sa_column=Column(
-            String(36),
+            USER_ID_TYPE,
             ForeignKey("users.id", ondelete="CASCADE"),
             nullable=False,
             index=True,
@@ -3,26 +3,39 @@
 from __future__ import annotations
 
 from datetime import datetime
-from sqlalchemy import Column, DateTime, ForeignKey, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, text
 from sqlmodel import Field, SQLModel
 
+from .column_types import USER_ID_TYPE, HexDigest
+
 
 class RefreshToken(SQLModel, table=True):
     """Persisted refresh tokens for rotation and revocation."""
 
     __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        # Rotation only trims unrevoked rows, so revoked history stays out of
+        # the index the per-user limit walks.
+        Index(
+            "ix_refresh_tokens_user_active_issued_at",
+            "user_id",
+            "issued_at",
+            postgresql_where=text("revoked_at IS NULL"),
+            sqlite_where=text("revoked_at IS NULL"),
+        ),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     user_id: str = Field(
         sa_column=Column(
-            String(36),
+            USER_ID_TYPE,
             ForeignKey("users.id", ondelete="CASCADE"),
             nullable=False,
             index=True,
         )
     )
     token_hash: str = Field(
-        sa_column=Column(String(128), unique=True, nullable=False)
+        sa_column=Column(HexDigest(), unique=True, nullable=False)
     )
     issued_at: datetime = Field(
         sa_column=Column(DateTime(timezone=True), nullable=False)
@@ -8,13 +8,15 @@ from uuid import uuid4
 from sqlalchemy import Boolean, Column, DateTime, String, Text, func, text
 from sqlmodel import Field, SQLModel
 
+from .column_types import USER_ID_TYPE
+
 
 class User(SQLModel, table=True):
     """Registered application user."""
 
     __tablename__ = "users"
 
-    id: str = Field(default_factory=lambda: str(uuid4()), sa_column=Column(String(36), primary_key=True))
+    id: str = Field(default_factory=lambda: str(uuid4()), sa_column=Column(USER_ID_TYPE, primary_key=True))
     username: str = Field(
         sa_column=Column(String(30), unique=True, nullable=False, index=True)
     )
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import CheckConstraint, Column, DateTime, ForeignKey, Index, String, func
+from sqlalchemy import CheckConstraint, Column, DateTime, ForeignKey, Index, func
 from sqlmodel import Field, SQLModel
 
+from .column_types import USER_ID_TYPE
+
 
 class UserBlock(SQLModel, table=True):
     """Represents a blocker -> blocked relationship."""
@@ -19,14 +21,14 @@ class UserBlock(SQLModel, table=True):
 
     blocker_id: str = Field(
         sa_column=Column(
-            String(36),
+            USER_ID_TYPE,
             ForeignKey("users.id", ondelete="CASCADE"),
             primary_key=True,
         )
     )
     blocked_id: str = Field(
         sa_column=Column(
-            String(36),
+            USER_ID_TYPE,
             ForeignKey("users.id", ondelete="CASCADE"),
             primary_key=True,
         )
@@ -6,7 +6,6 @@ Usage:
 Environment overrides:
     DISMISSED_KEEP_LIMIT=500
     DISMISSED_USER_BATCH_SIZE=200
-    DISMISSED_PRUNE_BATCH_SIZE=500
     DISMISSED_MAX_USERS_PER_RUN=200
     DISMISSED_MAX_ROWS_PER_RUN=5000
     DISMISSED_MAX_ELAPSED_SECONDS=30
@@ -22,6 +21,7 @@ from time import perf_counter
 from typing import Any, cast
 
 from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import ColumnElement
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
@@ -32,13 +32,11 @@ from db.session import AsyncSessionMaker  # noqa: E402
 from models import DismissedNotification  # noqa: E402
 from services.notifications.dismissals import (  # noqa: E402
     MAX_DISMISSED_NOTIFICATIONS,
-    PRUNE_BATCH_SIZE,
-    prune_dismissed_notifications_for_user,
+    prune_dismissed_notifications_for_users,
 )
 
 KEEP_LIMIT_ENV = "DISMISSED_KEEP_LIMIT"
 USER_BATCH_SIZE_ENV = "DISMISSED_USER_BATCH_SIZE"
-PRUNE_BATCH_SIZE_ENV = "DISMISSED_PRUNE_BATCH_SIZE"
 MAX_USERS_PER_RUN_ENV = "DISMISSED_MAX_USERS_PER_RUN"
 MAX_ROWS_PER_RUN_ENV = "DISMISSED_MAX_ROWS_PER_RUN"
 MAX_ELAPSED_SECONDS_ENV = "DISMISSED_MAX_ELAPSED_SECONDS"
@@ -77,48 +75,34 @@ def _gt(column: Any, value: Any) -> ColumnElement[bool]:
 
 
 async def _load_users_exceeding_cap(
+    session: AsyncSession,
     *,
     keep_limit: int,
     user_batch_size: int,
     after_user_id: str | None,
 ) -> list[tuple[str, int]]:
-    async with AsyncSessionMaker() as session:
-        user_id_column = cast(ColumnElement[str], DismissedNotification.user_id)
-        id_column = cast(ColumnElement[int], DismissedNotification.id)
-        count_column = cast(Any, func.count(id_column))
-
-        stmt = (
-            select(user_id_column, count_column.label("dismissed_count"))
-            .group_by(user_id_column)
-            .having(count_column > keep_limit)
-            .order_by(user_id_column)
-            .limit(user_batch_size)
-        )
-        if after_user_id is not None:
-            stmt = stmt.where(_gt(user_id_column, after_user_id))
+    user_id_column = cast(ColumnElement[str], DismissedNotification.user_id)
+    # COUNT(*) only needs user_id, so the group scan can stay index-only on
+    # ix_dismissed_notifications_user_id instead of reading heap rows.
+    count_column = cast(Any, func.count())
+
+    stmt = (
+        select(user_id_column, count_column.label("dismissed_count"))
+        .group_by(user_id_column)
+        .having(count_column > keep_limit)
+        .order_by(user_id_column)
+        .limit(user_batch_size)
+    )
+    if after_user_id is not None:
+        stmt = stmt.where(_gt(user_id_column, after_user_id))
 
-        result = await session.execute(stmt)
-        rows: list[tuple[str, int]] = []
-        for user_id, dismissed_count in result.all():
-            rows.append((user_id, int(dismissed_count)))
-        return rows
-
-
-async def _prune_user(
-    user_id: str,
-    *,
-    keep_limit: int,
-    prune_batch_size: int,
-    max_deleted: int | None = None,
-) -> int:
-    async with AsyncSessionMaker() as session:
-        return await prune_dismissed_notifications_for_user(
-            session,
-            user_id,
-            keep_limit=keep_limit,
-            batch_size=prune_batch_size,
-            max_deleted=max_deleted,
-        )
+    result = await session.execute(stmt)
+    rows: list[tuple[str, int]] = []
+    for user_id, dismissed_count in result.all():
+        rows.append((user_id, int(dismissed_count)))
+    # End the read transaction so the long-lived scan session never idles in it.
+    await session.commit()
+    return rows
 
 
 async def run() -> None:
@@ -132,11 +116,6 @@ async def run() -> None:
         default=DEFAULT_USER_BATCH_SIZE,
         label=USER_BATCH_SIZE_ENV,
     )
-    prune_batch_size = _parse_positive_int(
-        os.getenv(PRUNE_BATCH_SIZE_ENV),
-        default=PRUNE_BATCH_SIZE,
-        label=PRUNE_BATCH_SIZE_ENV,
-    )
     max_users_per_run = _parse_positive_int(
         os.getenv(MAX_USERS_PER_RUN_ENV),
         default=DEFAULT_MAX_USERS_PER_RUN,
@@ -157,64 +136,69 @@ async def run() -> None:
     users_scanned = 0
     users_pruned = 0
     rows_deleted = 0
-    after_user_id: str | None = None
     stop_reason = "completed"
 
-    while True:
-        if users_scanned >= max_users_per_run:
-            stop_reason = "max_users"
-            break
-        if rows_deleted >= max_rows_per_run:
-            stop_reason = "max_rows"
-            break
-        elapsed_seconds = perf_counter() - started_at
-        if elapsed_seconds >= max_elapsed_seconds:
-            stop_reason = "max_elapsed_seconds"
-            break
-
+    # One session scans for over-cap users while the other deletes, so the
+    # next page lookup can overlap the current wave without sharing a session.
+    async with AsyncSessionMaker() as scan_session, AsyncSessionMaker() as prune_session:
         user_batch = await _load_users_exceeding_cap(
+            scan_session,
             keep_limit=keep_limit,
             user_batch_size=user_batch_size,
-            after_user_id=after_user_id,
+            after_user_id=None,
         )
-        if not user_batch:
-            stop_reason = "completed"
-            break
-
-        for user_id, dismissed_count in user_batch:
+        while True:
             if users_scanned >= max_users_per_run:
                 stop_reason = "max_users"
                 break
-            remaining_row_budget = max_rows_per_run - rows_deleted
-            if remaining_row_budget <= 0:
+            if rows_deleted >= max_rows_per_run:
                 stop_reason = "max_rows"
                 break
             elapsed_seconds = perf_counter() - started_at
             if elapsed_seconds >= max_elapsed_seconds:
                 stop_reason = "max_elapsed_seconds"
                 break
+            if not user_batch:
+                stop_reason = "completed"
+                break
 
-            users_scanned += 1
-            deleted_rows = await _prune_user(
-                user_id,
+            user_wave = user_batch[: max_users_per_run - users_scanned]
+            users_scanned += len(user_wave)
+            prune_wave = prune_dismissed_notifications_for_users(
+                prune_session,
+                [user_id for user_id, _dismissed_count in user_wave],
                 keep_limit=keep_limit,
-                prune_batch_size=prune_batch_size,
-                max_deleted=remaining_row_budget,
+                max_deleted=max_rows_per_run - rows_deleted,
+            )
+            has_next_page = (
+                len(user_batch) == user_batch_size and users_scanned < max_users_per_run
             )
-            if deleted_rows > 0:
-                users_pruned += 1
-                rows_deleted += deleted_rows
-                print(
-                    f"Pruned {deleted_rows} dismissed notifications for user {user_id} "
-                    f"(had {dismissed_count})"
+            if has_next_page:
+                # The next page only holds users after this wave, so it can be
+                # fetched on its own session while the wave is being pruned.
+                deleted_by_user, next_user_batch = await asyncio.gather(
+                    prune_wave,
+                    _load_users_exceeding_cap(
+                        scan_session,
+                        keep_limit=keep_limit,
+                        user_batch_size=user_batch_size,
+                        after_user_id=user_wave[-1][0],
+                    ),
                 )
-            if rows_deleted >= max_rows_per_run:
-                stop_reason = "max_rows"
-                break
-
-        if stop_reason != "completed":
-            break
-        after_user_id = user_batch[-1][0]
+            else:
+                deleted_by_user = await prune_wave
+                next_user_batch = []
+
+            for user_id, dismissed_count in user_wave:
+                deleted_rows = deleted_by_user.get(user_id, 0)
+                if deleted_rows > 0:
+                    users_pruned += 1
+                    rows_deleted += deleted_rows
+                    print(
+                        f"Pruned {deleted_rows} dismissed notifications for user {user_id} "
+                        f"(had {dismissed_count})"
+                    )
+            user_batch = next_user_batch
 
     elapsed_ms = int((perf_counter() - started_at) * 1000)
     print(
@@ -6,6 +6,9 @@ Usage:
 Optional media directory override:
     SEED_MEDIA_DIR=/absolute/path/to/media uv run python scripts/seed.py
 
+Optional upload concurrency override (default 16):
+    SEED_MINIO_CONCURRENCY=32 uv run python scripts/seed.py
+
 Media directory layout:
     <seed-media-dir>/<image-file>
     <seed-media-dir>/<username>/<image-file>
@@ -17,19 +20,24 @@ If no local media is provided, placeholder images are uploaded automatically.
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
 import mimetypes
 import os
 import re
+import struct
 import sys
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from itertools import chain
 from io import BytesIO
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, NamedTuple, cast
+from uuid import uuid4
 
 from minio.error import S3Error
-from PIL import Image
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, select, tuple_, update
 from sqlalchemy.sql import ColumnElement
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
@@ -37,7 +45,7 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.append(str(ROOT_DIR))
 
 from core import settings  # noqa: E402
-from core.security import hash_password  # noqa: E402
+from core.security import hash_password, needs_rehash, verify_password  # noqa: E402
 from db.session import AsyncSessionMaker  # noqa: E402
 from models import Comment, Follow, FollowRequest, Like, Post, SavedPost, User  # noqa: E402
 from services.auth import (  # noqa: E402
@@ -45,7 +53,6 @@ from services.auth import (  # noqa: E402
     sync_default_avatar_asset,
 )
 from services.storage import ensure_bucket, get_minio_client  # noqa: E402
-from db.query_helpers import _eq  # noqa: E402
 
 
 @dataclass(frozen=True)
@@ -70,6 +77,7 @@ class SeedPost:
 @dataclass(frozen=True)
 class SeedPlan:
     users: list[SeedUser]
+    users_by_username: list[SeedUser]
     posts: list[SeedPost]
     follows: list[tuple[str, str]]
     follow_requests: list[tuple[str, str]]
@@ -333,7 +341,20 @@ EDGE_SAVED_POSTS: Sequence[tuple[str, str, str]] = [
 
 DEFAULT_MEDIA_DIR = ROOT_DIR / "scripts" / "seed_media"
 SEED_MEDIA_DIR_ENV = "SEED_MEDIA_DIR"
+SEED_MEDIA_KEY_PREFIX = "demo/"
+SEED_MEDIA_MARKER_PREFIX = f"{SEED_MEDIA_KEY_PREFIX}.seed-complete."
+MISSING_OBJECT_CODES = frozenset({"NoSuchKey", "NoSuchObject", "ResourceNotFound"})
+SEED_MINIO_CONCURRENCY_ENV = "SEED_MINIO_CONCURRENCY"
+DEFAULT_SEED_MINIO_CONCURRENCY = 16
+# Below this many new rows a bulk INSERT is as fast as COPY and keeps RETURNING.
+SEED_COPY_THRESHOLD = 100
+# Objects up to one part go out as a single PUT; larger local media uses
+# 16 MiB parts instead of the 5 MiB minimum.
+SEED_MEDIA_PART_SIZE = 16 * 1024 * 1024
 SUPPORTED_IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp"}
+_NON_USERNAME_CHARS_RE = re.compile(r"[^a-z0-9_]+")
+_REPEATED_UNDERSCORES_RE = re.compile(r"_+")
+_CAPTION_SEPARATORS = str.maketrans("_-", "  ")
 PLACEHOLDER_COLORS: Sequence[tuple[int, int, int]] = [
     (243, 189, 80),
     (109, 163, 224),
@@ -359,8 +380,8 @@ SEED_COMMENT_TEMPLATES: Sequence[str] = [
 
 
 def _sanitize_username(raw: str) -> str:
-    normalized = re.sub(r"[^a-z0-9_]+", "_", raw.strip().lower())
-    normalized = re.sub(r"_+", "_", normalized).strip("_")
+    normalized = _NON_USERNAME_CHARS_RE.sub("_", raw.strip().lower())
+    normalized = _REPEATED_UNDERSCORES_RE.sub("_", normalized).strip("_")
     return normalized
 
 
@@ -369,7 +390,7 @@ def _title_from_username(username: str) -> str:
 
 
 def _caption_from_filename(path: Path) -> str:
-    label = path.stem.replace("_", " ").replace("-", " ").strip()
+    label = path.stem.translate(_CAPTION_SEPARATORS).strip()
     if not label:
         return "New post."
     return f"{label.capitalize()}."
@@ -392,19 +413,27 @@ def _build_seed_follows(usernames: Sequence[str]) -> list[tuple[str, str]]:
     if len(usernames) < 2:
         return []
 
-    relationships: set[tuple[str, str]] = set()
     total_users = len(usernames)
-    for index, follower in enumerate(usernames):
-        first = usernames[(index + 1) % total_users]
-        if first != follower:
-            relationships.add((follower, first))
+    offsets = (1, 2) if total_users > 3 else (1,)
+    # Insertion-ordered dict keys dedupe the edges without a set + sort pass.
+    relationships = dict.fromkeys(
+        (follower, usernames[(index + offset) % total_users])
+        for index, follower in enumerate(usernames)
+        for offset in offsets
+        if usernames[(index + offset) % total_users] != follower
+    )
+    return list(relationships)
+
 
-        if total_users > 3:
-            second = usernames[(index + 2) % total_users]
-            if second != follower:
-                relationships.add((follower, second))
+def _has_supported_image_suffix(file_name: str) -> bool:
+    return os.path.splitext(file_name)[1].lower() in SUPPORTED_IMAGE_SUFFIXES
 
-    return sorted(relationships)
+
+def _sorted_dir_entries(path: str | Path) -> list[os.DirEntry[str]]:
+    # DirEntry caches the file type from the directory read, so the is_file /
+    # is_dir checks below do not stat each entry again.
+    with os.scandir(path) as entries:
+        return sorted(entries, key=lambda entry: entry.name)
 
 
 def _discover_media_seed(
@@ -418,16 +447,16 @@ def _discover_media_seed(
     discovered_posts: list[SeedPost] = []
     root_level_images: list[Path] = []
 
-    for media_path in sorted(media_dir.iterdir()):
-        if media_path.is_file():
-            if media_path.suffix.lower() in SUPPORTED_IMAGE_SUFFIXES:
-                root_level_images.append(media_path)
+    for media_entry in _sorted_dir_entries(media_dir):
+        if media_entry.is_file():
+            if _has_supported_image_suffix(media_entry.name):
+                root_level_images.append(Path(media_entry.path))
             continue
 
-        if not media_path.is_dir():
+        if not media_entry.is_dir():
             continue
 
-        username = _sanitize_username(media_path.name)
+        username = _sanitize_username(media_entry.name)
         if not username:
             continue
 
@@ -440,17 +469,20 @@ def _discover_media_seed(
             purpose="Imported from local media directory for image rendering checks.",
         )
 
-        for image_path in sorted(media_path.iterdir()):
-            if (
-                not image_path.is_file()
-                or image_path.suffix.lower() not in SUPPORTED_IMAGE_SUFFIXES
+        for image_entry in _sorted_dir_entries(media_entry.path):
+            if not image_entry.is_file() or not _has_supported_image_suffix(
+                image_entry.name
             ):
                 continue
+            image_path = Path(image_entry.path)
 
             discovered_posts.append(
                 SeedPost(
                     username=username,
-                    image_key=f"demo/{username}/{_safe_object_name(image_path)}",
+                    image_key=(
+                        f"{SEED_MEDIA_KEY_PREFIX}{username}/"
+                        f"{_safe_object_name(image_path)}"
+                    ),
                     caption=_caption_from_filename(image_path),
                     source_path=image_path,
                 )
@@ -468,7 +500,10 @@ def _discover_media_seed(
             discovered_posts.append(
                 SeedPost(
                     username=username,
-                    image_key=f"demo/{username}/{_safe_object_name(image_path)}",
+                    image_key=(
+                        f"{SEED_MEDIA_KEY_PREFIX}{username}/"
+                        f"{_safe_object_name(image_path)}"
+                    ),
                     caption=_caption_from_filename(image_path),
                     source_path=image_path,
                 )
@@ -491,12 +526,13 @@ def build_seed_plan() -> SeedPlan:
     baseline_follow_graph = _build_seed_follows(
         [user.username for user in users if user.username not in edge_usernames]
     )
-    follows = sorted(set([*baseline_follow_graph, *EDGE_FOLLOWS]))
-    follow_requests = sorted(set(EDGE_FOLLOW_REQUESTS))
+    follows = list(dict.fromkeys(chain(baseline_follow_graph, EDGE_FOLLOWS)))
+    follow_requests = list(dict.fromkeys(EDGE_FOLLOW_REQUESTS))
     saved_posts = list(EDGE_SAVED_POSTS)
 
     return SeedPlan(
         users=users,
+        users_by_username=sorted(users, key=lambda user: user.username),
         posts=posts,
         follows=follows,
         follow_requests=follow_requests,
@@ -506,12 +542,133 @@ def build_seed_plan() -> SeedPlan:
     )
 
 
+def _jpeg_segment(marker: int, payload: bytes) -> bytes:
+    return struct.pack(">HH", marker, len(payload) + 2) + payload
+
+
+def _encode_placeholder_jpeg(color: tuple[int, int, int]) -> bytes:
+    """Assemble a flat 8x8 baseline JPEG without an image library.
+
+    A flat block only carries a DC coefficient, so with a unit quantization
+    table, twelve 4-bit DC codes and a 1-bit end-of-block code, the whole scan
+    is a few bytes per component. Browsers stretch it to the post frame.
+    """
+    red, green, blue = color
+    samples = (
+        0.299 * red + 0.587 * green + 0.114 * blue,
+        128 - 0.168736 * red - 0.331264 * green + 0.5 * blue,
+        128 + 0.5 * red - 0.418688 * green - 0.081312 * blue,
+    )
+    bits: list[str] = []
+    for sample in samples:
+        dc = round(8 * (sample - 128))
+        category = abs(dc).bit_length()
+        bits.append(format(category, "04b"))
+        if category:
+            amplitude = dc if dc > 0 else dc + (1 << category) - 1
+            bits.append(format(amplitude, f"0{category}b"))
+        bits.append("0")
+    scan_bits = "".join(bits)
+    scan_bits += "1" * (-len(scan_bits) % 8)
+    scan = bytes(
+        int(scan_bits[offset : offset + 8], 2) for offset in range(0, len(scan_bits), 8)
+    ).replace(b"\xff", b"\xff\x00")
+
+    dc_code_lengths = bytes([0, 0, 0, 12] + [0] * 12)
+    ac_code_lengths = bytes([1] + [0] * 15)
+    return b"".join(
+        [
+            b"\xff\xd8",  # SOI
+            _jpeg_segment(0xFFE0, b"JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00"),
+            _jpeg_segment(0xFFDB, b"\x00" + b"\x01" * 64),  # unit quantization
+            # SOF0: 8-bit, 8x8, three 1x1-sampled components on table 0.
+            _jpeg_segment(
+                0xFFC0,
+                b"\x08\x00\x08\x00\x08\x03\x01\x11\x00\x02\x11\x00\x03\x11\x00",
+            ),
+            _jpeg_segment(0xFFC4, b"\x00" + dc_code_lengths + bytes(range(12))),
+            _jpeg_segment(0xFFC4, b"\x10" + ac_code_lengths + b"\x00"),
+            _jpeg_segment(0xFFDA, b"\x03\x01\x00\x02\x00\x03\x00\x00\x3f\x00"),
+            scan,
+            b"\xff\xd9",  # EOI
+        ]
+    )
+
+
+# Built once at import; upload threads share these immutable payloads.
+PLACEHOLDER_JPEGS: tuple[bytes, ...] = tuple(
+    _encode_placeholder_jpeg(color) for color in PLACEHOLDER_COLORS
+)
+
+
 def _build_placeholder_jpeg(seed_index: int) -> bytes:
-    color = PLACEHOLDER_COLORS[seed_index % len(PLACEHOLDER_COLORS)]
-    image = Image.new("RGB", (1080, 1080), color)
-    buffer = BytesIO()
-    image.save(buffer, format="JPEG", quality=88)
-    return buffer.getvalue()
+    return PLACEHOLDER_JPEGS[seed_index % len(PLACEHOLDER_JPEGS)]
+
+
+def _seed_media_concurrency() -> int:
+    raw_value = os.getenv(SEED_MINIO_CONCURRENCY_ENV)
+    if raw_value is None or raw_value.strip() == "":
+        return DEFAULT_SEED_MINIO_CONCURRENCY
+    try:
+        parsed = int(raw_value)
+    except ValueError as exc:
+        raise ValueError(f"{SEED_MINIO_CONCURRENCY_ENV} must be an integer") from exc
+    if parsed <= 0:
+        raise ValueError(f"{SEED_MINIO_CONCURRENCY_ENV} must be positive")
+    return parsed
+
+
+def _upload_seed_post_media(
+    client,
+    bucket_name: str,
+    post: SeedPost,
+    seed_index: int,
+    *,
+    check_exists: bool = False,
+) -> None:
+    object_key = post.image_key
+    if check_exists and _object_exists(client, bucket_name, object_key):
+        return
+    source_path = post.source_path
+    if source_path and source_path.exists():
+        content_type = mimetypes.guess_type(source_path.name)[0]
+        # Hand MinIO the open file so it streams parts instead of holding a copy.
+        with source_path.open("rb") as media_file:
+            client.put_object(
+                bucket_name,
+                object_key,
+                data=media_file,
+                length=os.fstat(media_file.fileno()).st_size,
+                part_size=SEED_MEDIA_PART_SIZE,
+                content_type=content_type or "application/octet-stream",
+            )
+        return
+
+    payload = _build_placeholder_jpeg(seed_index)
+    client.put_object(
+        bucket_name,
+        object_key,
+        data=BytesIO(payload),
+        length=len(payload),
+        part_size=SEED_MEDIA_PART_SIZE,
+        content_type="image/jpeg",
+    )
+
+
+def _seed_media_marker_key(posts: Sequence[SeedPost]) -> str:
+    """Return the marker object key fingerprinting the planned seed media."""
+    entries = sorted(
+        (
+            post.image_key,
+            str(post.source_path or ""),
+            post.source_path.stat().st_size
+            if post.source_path and post.source_path.exists()
+            else 0,
+        )
+        for post in posts
+    )
+    digest = hashlib.blake2b(repr(entries).encode(), digest_size=16).hexdigest()
+    return f"{SEED_MEDIA_MARKER_PREFIX}{digest}"
 
 
 def _object_exists(client, bucket_name: str, object_key: str) -> bool:
@@ -519,20 +676,11 @@ def _object_exists(client, bucket_name: str, object_key: str) -> bool:
         client.stat_object(bucket_name, object_key)
         return True
     except S3Error as exc:
-        if exc.code in {"NoSuchKey", "NoSuchObject", "ResourceNotFound"}:
+        if exc.code in MISSING_OBJECT_CODES:
             return False
         raise
 
 
-def _read_media_payload(post: SeedPost, seed_index: int) -> tuple[bytes, str]:
-    if post.source_path and post.source_path.exists():
-        payload = post.source_path.read_bytes()
-        content_type = mimetypes.guess_type(post.source_path.name)[0]
-        return payload, content_type or "application/octet-stream"
-
-    return _build_placeholder_jpeg(seed_index), "image/jpeg"
-
-
 def ensure_seed_post_media(posts: Sequence[SeedPost]) -> None:
     """Best-effort media seeding so demo posts render immediately."""
     try:
@@ -543,144 +691,332 @@ def ensure_seed_post_media(posts: Sequence[SeedPost]) -> None:
         print(f"⚠️ Could not initialize MinIO for seed media: {exc}")
         return
 
-    for index, post in enumerate(posts):
-        object_key = post.image_key
-        try:
-            if _object_exists(client, bucket_name, object_key):
-                continue
+    # A reseed of an unchanged plan costs a single HEAD on the marker object.
+    marker_key = _seed_media_marker_key(posts)
+    try:
+        if _object_exists(client, bucket_name, marker_key):
+            return
+    except Exception as exc:
+        print(f"⚠️ Could not check seed media marker: {exc}")
 
-            payload, content_type = _read_media_payload(post, index)
-            client.put_object(
-                bucket_name,
-                object_key,
-                data=BytesIO(payload),
-                length=len(payload),
-                content_type=content_type,
+    # One listing of the seed prefix replaces a HEAD request per planned object.
+    # If the listing is refused, each upload worker falls back to its own HEAD.
+    existing_keys: set[str] | None
+    try:
+        existing_keys = {
+            item.object_name
+            for item in client.list_objects(
+                bucket_name, prefix=SEED_MEDIA_KEY_PREFIX, recursive=True
             )
-        except Exception as exc:
-            print(f"⚠️ Failed to seed media object '{object_key}': {exc}")
-
-
-async def get_or_create_user(session, payload: SeedUser) -> User:
-    result = await session.execute(select(User).where(_eq(User.username, payload.username)))
-    user = result.scalar_one_or_none()
-    if user:
-        user.email = payload.email
-        user.name = payload.name
-        user.bio = payload.bio
-        user.password_hash = hash_password(payload.password)
-        user.is_private = payload.is_private
-        if not user.avatar_key:
-            user.avatar_key = DEFAULT_AVATAR_OBJECT_KEY
-        session.add(user)
-        await session.flush()
-        return user
-
-    user = User(
-        username=payload.username,
-        email=payload.email,
-        name=payload.name,
-        bio=payload.bio,
-        password_hash=hash_password(payload.password),
-        avatar_key=DEFAULT_AVATAR_OBJECT_KEY,
-        is_private=payload.is_private,
+        }
+    except Exception as exc:
+        print(f"⚠️ Could not list existing seed media, checking each object: {exc}")
+        existing_keys = None
+    pending = [
+        (index, post)
+        for index, post in enumerate(posts)
+        if existing_keys is None or post.image_key not in existing_keys
+    ]
+    check_exists = existing_keys is None
+
+    # The MinIO client is thread-safe and releases the GIL on network I/O, so a
+    # small pool overlaps the per-object round-trips. The pool never starts
+    # more workers than there are uploads, and none at all on a full reseed.
+    failed = False
+    if pending:
+        max_workers = min(_seed_media_concurrency(), len(pending))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (
+                    post.image_key,
+                    executor.submit(
+                        _upload_seed_post_media,
+                        client,
+                        bucket_name,
+                        post,
+                        index,
+                        check_exists=check_exists,
+                    ),
+                )
+                for index, post in pending
+            ]
+            for object_key, future in futures:
+                upload_error = future.exception()
+                if upload_error is not None:
+                    failed = True
+                    print(
+                        f"⚠️ Failed to seed media object '{object_key}': {upload_error}"
+                    )
+
+    # Only mark the plan as synced once every object is known to be present.
+    if failed:
+        return
+    try:
+        client.put_object(
+            bucket_name,
+            marker_key,
+            data=BytesIO(b""),
+            length=0,
+            content_type="text/plain",
+        )
+    except Exception as exc:
+        print(f"⚠️ Could not write seed media marker: {exc}")
+
+
+@functools.cache
+def _hash_seed_password(password: str) -> str:
+    # Argon2 dominates seeding CPU; seed users share a handful of passwords.
+    return hash_password(password)
+
+
+@functools.cache
+def _seed_password_hash_is_current(password: str, password_hash: str) -> bool:
+    return verify_password(password, password_hash) and not needs_rehash(password_hash)
+
+
+def _seed_password_hash(password: str, current_hash: str | None = None) -> str:
+    if current_hash and _seed_password_hash_is_current(password, current_hash):
+        return current_hash
+    return _hash_seed_password(password)
+
+
+class SeedUserRef(NamedTuple):
+    id: str
+    username: str
+
+
+async def ensure_users(
+    session, payloads: Sequence[SeedUser]
+) -> dict[str, SeedUserRef]:
+    usernames = [payload.username for payload in payloads]
+    username_column = cast(ColumnElement[str], User.username)
+    # Plain column rows: the seed never needs hydrated User instances.
+    existing_result = await session.execute(
+        select(
+            cast(ColumnElement[str], User.id),
+            username_column,
+            cast(ColumnElement[str], User.password_hash),
+            cast(ColumnElement[str | None], User.avatar_key),
+        ).where(username_column.in_(usernames))
+    )
+    existing = {row.username: row for row in existing_result.all()}
+
+    users: dict[str, SeedUserRef] = {}
+    rows_to_insert: list[dict[str, Any]] = []
+    rows_to_update: list[dict[str, Any]] = []
+    for payload in payloads:
+        row: dict[str, Any] = {
+            "email": payload.email,
+            "name": payload.name,
+            "bio": payload.bio,
+            "is_private": payload.is_private,
+        }
+        user = existing.get(payload.username)
+        row["password_hash"] = _seed_password_hash(
+            payload.password, user.password_hash if user is not None else None
+        )
+        if user is None:
+            row["id"] = str(uuid4())
+            row["username"] = payload.username
+            row["avatar_key"] = DEFAULT_AVATAR_OBJECT_KEY
+            rows_to_insert.append(row)
+        else:
+            row["id"] = user.id
+            row["avatar_key"] = user.avatar_key or DEFAULT_AVATAR_OBJECT_KEY
+            rows_to_update.append(row)
+        users[payload.username] = SeedUserRef(id=row["id"], username=payload.username)
+
+    # One executemany per statement instead of a SELECT + flush per user. New
+    # ids are generated here, so nothing has to be read back afterwards.
+    if rows_to_update:
+        await session.execute(update(User), rows_to_update)
+    if rows_to_insert:
+        await session.execute(insert(User), rows_to_insert)
+    return users
+
+
+async def _copy_records(
+    session,
+    table_name: str,
+    columns: Sequence[str],
+    records: Sequence[tuple[Any, ...]],
+) -> bool:
+    """COPY large batches straight into PostgreSQL; return False when skipped."""
+    if len(records) < SEED_COPY_THRESHOLD:
+        return False
+    connection = await session.connection()
+    if connection.dialect.driver != "asyncpg":
+        return False
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        table_name,
+        records=records,
+        columns=list(columns),
+    )
+    return True
+
+
+async def _load_existing_pairs(
+    session,
+    first_column: Any,
+    second_column: Any,
+    pairs: Collection[tuple[Any, Any]],
+) -> set[tuple[Any, Any]]:
+    if not pairs:
+        return set()
+    result = await session.execute(
+        select(first_column, second_column).where(
+            tuple_(first_column, second_column).in_(list(pairs))
+        )
     )
-    session.add(user)
-    await session.flush()
-    return user
+    return {(first, second) for first, second in result.all()}
+
+
+def _resolve_user_id_pairs(
+    users: dict[str, SeedUserRef],
+    username_pairs: Sequence[tuple[str, str]],
+) -> dict[tuple[str, str], None]:
+    id_pairs: dict[tuple[str, str], None] = {}
+    for first_username, second_username in username_pairs:
+        first = users[first_username]
+        second = users[second_username]
+        if first.id is None or second.id is None:
+            raise ValueError("Seed users missing identifiers")
+        id_pairs[(first.id, second.id)] = None
+    return id_pairs
 
 
-async def ensure_posts(session, users: dict[str, User], posts: Sequence[SeedPost]) -> None:
+async def ensure_posts(
+    session,
+    users: dict[str, SeedUserRef],
+    posts: Sequence[SeedPost],
+) -> dict[str, list[int]]:
+    """Insert missing seed posts and return every planned post id by author."""
+    planned: dict[tuple[str, str], SeedPost] = {}
     for post in posts:
         author = users[post.username]
         if author.id is None:
             raise ValueError("Author missing identifier during seeding")
+        planned.setdefault((author.id, post.image_key), post)
+    if not planned:
+        return {}
 
-        result = await session.execute(
-            select(Post).where(
-                _eq(Post.author_id, author.id),
-                _eq(Post.image_key, post.image_key),
-            )
+    post_id_column = cast(ColumnElement[int], Post.id)
+    post_author_id = cast(ColumnElement[str], Post.author_id)
+    post_image_key = cast(ColumnElement[str], Post.image_key)
+    existing_result = await session.execute(
+        select(post_id_column, post_author_id, post_image_key).where(
+            tuple_(post_author_id, post_image_key).in_(list(planned))
         )
-        if result.scalar_one_or_none():
-            continue
-
-        session.add(
-            Post(
-                author_id=author.id,
-                image_key=post.image_key,
-                caption=post.caption,
+    )
+    post_rows = list(existing_result.all())
+    existing = {(author_id, image_key) for _post_id, author_id, image_key in post_rows}
+    rows = [
+        {"author_id": author_id, "image_key": image_key, "caption": post.caption}
+        for (author_id, image_key), post in planned.items()
+        if (author_id, image_key) not in existing
+    ]
+    if rows and await _copy_records(
+        session,
+        Post.__tablename__,
+        ["author_id", "image_key", "caption"],
+        [(row["author_id"], row["image_key"], row["caption"]) for row in rows],
+    ):
+        copied_keys = [(row["author_id"], row["image_key"]) for row in rows]
+        copied_result = await session.execute(
+            select(post_id_column, post_author_id, post_image_key).where(
+                tuple_(post_author_id, post_image_key).in_(copied_keys)
             )
         )
+        post_rows.extend(copied_result.all())
+    elif rows:
+        inserted_result = await session.execute(
+            insert(Post).returning(post_id_column, post_author_id, post_image_key),
+            rows,
+        )
+        post_rows.extend(inserted_result.all())
+
+    posts_by_author: dict[str, list[int]] = {}
+    post_rows.sort(key=lambda row: (row[1], row[0]))
+    for post_id, author_id, _image_key in post_rows:
+        posts_by_author.setdefault(author_id, []).append(post_id)
+    return posts_by_author
 
 
 async def ensure_follows(
     session,
-    users: dict[str, User],
+    users: dict[str, SeedUserRef],
     follows: Sequence[tuple[str, str]],
 ) -> None:
-    for follower_username, followee_username in follows:
-        follower = users[follower_username]
-        followee = users[followee_username]
-
-        if follower.id is None or followee.id is None:
-            raise ValueError("Seed users missing identifiers")
+    pairs = _resolve_user_id_pairs(users, follows)
+    if not pairs:
+        return
 
-        await session.execute(
-            delete(FollowRequest).where(
-                _eq(FollowRequest.requester_id, follower.id),
-                _eq(FollowRequest.target_id, followee.id),
-            )
+    await session.execute(
+        delete(FollowRequest).where(
+            tuple_(
+                cast(ColumnElement[str], FollowRequest.requester_id),
+                cast(ColumnElement[str], FollowRequest.target_id),
+            ).in_(list(pairs))
         )
-        result = await session.execute(
-            select(Follow).where(
-                _eq(Follow.follower_id, follower.id),
-                _eq(Follow.followee_id, followee.id),
-            )
-        )
-        if result.scalar_one_or_none():
-            continue
-
-        session.add(Follow(follower_id=follower.id, followee_id=followee.id))
+    )
+    existing = await _load_existing_pairs(
+        session, Follow.follower_id, Follow.followee_id, pairs
+    )
+    rows = [
+        {"follower_id": follower_id, "followee_id": followee_id}
+        for follower_id, followee_id in pairs
+        if (follower_id, followee_id) not in existing
+    ]
+    if rows and not await _copy_records(
+        session,
+        Follow.__tablename__,
+        ["follower_id", "followee_id"],
+        [(row["follower_id"], row["followee_id"]) for row in rows],
+    ):
+        await session.execute(insert(Follow), rows)
 
 
 async def ensure_follow_requests(
     session,
-    users: dict[str, User],
+    users: dict[str, SeedUserRef],
     follow_requests: Sequence[tuple[str, str]],
 ) -> None:
-    for requester_username, target_username in follow_requests:
-        requester = users[requester_username]
-        target = users[target_username]
-
-        if requester.id is None or target.id is None:
-            raise ValueError("Seed users missing identifiers")
-        if requester.id == target.id:
-            continue
+    pairs = {
+        (requester_id, target_id): None
+        for requester_id, target_id in _resolve_user_id_pairs(users, follow_requests)
+        if requester_id != target_id
+    }
+    if not pairs:
+        return
 
-        await session.execute(
-            delete(Follow).where(
-                _eq(Follow.follower_id, requester.id),
-                _eq(Follow.followee_id, target.id),
-            )
+    await session.execute(
+        delete(Follow).where(
+            tuple_(
+                cast(ColumnElement[str], Follow.follower_id),
+                cast(ColumnElement[str], Follow.followee_id),
+            ).in_(list(pairs))
         )
-        result = await session.execute(
-            select(FollowRequest).where(
-                _eq(FollowRequest.requester_id, requester.id),
-                _eq(FollowRequest.target_id, target.id),
-            )
-        )
-        if result.scalar_one_or_none():
-            continue
-
-        session.add(FollowRequest(requester_id=requester.id, target_id=target.id))
+    )
+    existing = await _load_existing_pairs(
+        session, FollowRequest.requester_id, FollowRequest.target_id, pairs
+    )
+    rows = [
+        {"requester_id": requester_id, "target_id": target_id}
+        for requester_id, target_id in pairs
+        if (requester_id, target_id) not in existing
+    ]
+    if rows:
+        await session.execute(insert(FollowRequest), rows)
 
 
 async def ensure_saved_posts(
     session,
-    users: dict[str, User],
+    users: dict[str, SeedUserRef],
     saved_posts: Sequence[tuple[str, str, str]],
 ) -> None:
+    post_keys: dict[tuple[str, str], tuple[str, str]] = {}
+    saver_keys: list[tuple[str, tuple[str, str]]] = []
     for saver_username, author_username, image_key in saved_posts:
         saver = users[saver_username]
         author = users[author_username]
@@ -688,59 +1024,51 @@ async def ensure_saved_posts(
         if saver.id is None or author.id is None:
             raise ValueError("Seed users missing identifiers")
 
-        post_id_column = cast(ColumnElement[int], Post.id)
-        post_id_result = await session.execute(
-            select(post_id_column).where(
-                _eq(Post.author_id, author.id),
-                _eq(Post.image_key, image_key),
-            )
+        post_key = (author.id, image_key)
+        post_keys.setdefault(post_key, (author_username, image_key))
+        saver_keys.append((saver.id, post_key))
+    if not saver_keys:
+        return
+
+    post_id_column = cast(ColumnElement[int], Post.id)
+    post_author_id = cast(ColumnElement[str], Post.author_id)
+    post_image_key = cast(ColumnElement[str], Post.image_key)
+    post_id_result = await session.execute(
+        select(post_id_column, post_author_id, post_image_key).where(
+            tuple_(post_author_id, post_image_key).in_(list(post_keys))
         )
-        post_id = post_id_result.scalar_one_or_none()
-        if post_id is None:
+    )
+    post_ids: dict[tuple[str, str], int] = {}
+    for post_id, author_id, image_key in post_id_result.all():
+        post_ids.setdefault((author_id, image_key), post_id)
+    for post_key, (author_username, image_key) in post_keys.items():
+        if post_key not in post_ids:
             raise ValueError(
                 f"Seed post not found for saved link: {author_username}:{image_key}"
             )
 
-        existing_saved = await session.execute(
-            select(SavedPost).where(
-                _eq(SavedPost.user_id, saver.id),
-                _eq(SavedPost.post_id, post_id),
-            )
-        )
-        if existing_saved.scalar_one_or_none():
-            continue
-
-        session.add(SavedPost(user_id=saver.id, post_id=post_id))
+    pairs = {(saver_id, post_ids[post_key]): None for saver_id, post_key in saver_keys}
+    existing = await _load_existing_pairs(
+        session, SavedPost.user_id, SavedPost.post_id, pairs
+    )
+    rows = [
+        {"user_id": user_id, "post_id": post_id}
+        for user_id, post_id in pairs
+        if (user_id, post_id) not in existing
+    ]
+    if rows:
+        await session.execute(insert(SavedPost), rows)
 
 
 async def ensure_engagement(
     session,
-    users: dict[str, User],
+    users: dict[str, SeedUserRef],
     follows: Sequence[tuple[str, str]],
+    posts_by_author: dict[str, list[int]],
 ) -> tuple[int, int]:
     """Seed deterministic likes/comments so notification panels have real data."""
-    user_ids = [user.id for user in users.values() if user.id is not None]
-    if not user_ids:
-        return 0, 0
-
-    post_entity = cast(Any, Post)
-    post_author_id = cast(ColumnElement[str], Post.author_id)
-    post_id_column = cast(ColumnElement[int], Post.id)
-    posts_result = await session.execute(
-        select(post_entity)
-        .where(post_author_id.in_(user_ids))
-        .order_by(post_author_id, post_id_column)
-    )
-
-    posts_by_author: dict[str, list[Post]] = {}
-    for post in posts_result.scalars().all():
-        posts_by_author.setdefault(post.author_id, []).append(post)
-
-    likes_created = 0
-    comments_created = 0
-    like_entity = cast(Any, Like)
-    comment_entity = cast(Any, Comment)
-
+    planned_likes: dict[tuple[str, int], None] = {}
+    planned_comments: dict[tuple[str, int, str], None] = {}
     for index, (follower_username, followee_username) in enumerate(follows):
         follower = users[follower_username]
         followee = users[followee_username]
@@ -752,43 +1080,69 @@ async def ensure_engagement(
         if not followee_posts:
             continue
 
-        target_post = followee_posts[index % len(followee_posts)]
-        if target_post.id is None:
-            continue
+        target_post_id = followee_posts[index % len(followee_posts)]
+        comment_text = SEED_COMMENT_TEMPLATES[index % len(SEED_COMMENT_TEMPLATES)]
+        planned_likes[(follower.id, target_post_id)] = None
+        planned_comments[(follower.id, target_post_id, comment_text)] = None
 
-        like_exists = await session.execute(
-            select(like_entity).where(
-                _eq(Like.user_id, follower.id),
-                _eq(Like.post_id, target_post.id),
+    existing_likes = await _load_existing_pairs(
+        session, Like.user_id, Like.post_id, planned_likes
+    )
+    like_rows = [
+        {"user_id": user_id, "post_id": post_id}
+        for user_id, post_id in planned_likes
+        if (user_id, post_id) not in existing_likes
+    ]
+    if like_rows:
+        await session.execute(insert(Like), like_rows)
+
+    existing_comments: set[tuple[str, int, str]] = set()
+    if planned_comments:
+        comment_author_id = cast(ColumnElement[str], Comment.author_id)
+        comment_post_id = cast(ColumnElement[int], Comment.post_id)
+        comment_text_column = cast(ColumnElement[str], Comment.text)
+        comment_targets = {
+            (author_id, post_id): None for author_id, post_id, _text in planned_comments
+        }
+        comments_result = await session.execute(
+            select(comment_author_id, comment_post_id, comment_text_column).where(
+                tuple_(comment_author_id, comment_post_id).in_(list(comment_targets))
             )
         )
-        if like_exists.scalar_one_or_none() is None:
-            session.add(Like(user_id=follower.id, post_id=target_post.id))
-            likes_created += 1
-
-        comment_text = SEED_COMMENT_TEMPLATES[index % len(SEED_COMMENT_TEMPLATES)]
-        comment_exists = await session.execute(
-            select(comment_entity).where(
-                _eq(Comment.author_id, follower.id),
-                _eq(Comment.post_id, target_post.id),
-                _eq(Comment.text, comment_text),
-            )
+        existing_comments = {
+            (author_id, post_id, text) for author_id, post_id, text in comments_result.all()
+        }
+    comment_rows = [
+        {"author_id": author_id, "post_id": post_id, "text": text}
+        for author_id, post_id, text in planned_comments
+        if (author_id, post_id, text) not in existing_comments
+    ]
+    if comment_rows:
+        await session.execute(insert(Comment), comment_rows)
+
+    return len(like_rows), len(comment_rows)
+
+
+async def _seed_database(plan: SeedPlan) -> tuple[int, int]:
+    # Seed rows go out as explicit bulk statements, so nothing relies on
+    # autoflush.
+    # The whole pass is one transaction: it commits once or rolls back entirely.
+    async with (
+        AsyncSessionMaker(autoflush=False, expire_on_commit=False) as session,
+        session.begin(),
+    ):
+        users = await ensure_users(session, plan.users)
+        posts_by_author = await ensure_posts(session, users, plan.posts)
+        await ensure_follows(session, users, plan.follows)
+        await ensure_follow_requests(session, users, plan.follow_requests)
+        await ensure_saved_posts(session, users, plan.saved_posts)
+        likes_created, comments_created = await ensure_engagement(
+            session, users, plan.follows, posts_by_author
         )
-        if comment_exists.scalar_one_or_none() is None:
-            session.add(
-                Comment(
-                    author_id=follower.id,
-                    post_id=target_post.id,
-                    text=comment_text,
-                )
-            )
-            comments_created += 1
-
     return likes_created, comments_created
 
 
-async def seed() -> None:
-    plan = build_seed_plan()
+def _sync_default_avatar() -> None:
     try:
         sync_status = sync_default_avatar_asset()
         print(
@@ -799,52 +1153,53 @@ async def seed() -> None:
     except Exception as exc:
         print(f"WARNING: Could not sync default avatar asset: {exc}")
 
-    ensure_seed_post_media(plan.posts)
 
-    async with AsyncSessionMaker() as session:
-        users: dict[str, User] = {}
-        for payload in plan.users:
-            user = await get_or_create_user(session, payload)
-            users[user.username] = user
-
-        await ensure_posts(session, users, plan.posts)
-        await ensure_follows(session, users, plan.follows)
-        await ensure_follow_requests(session, users, plan.follow_requests)
-        await ensure_saved_posts(session, users, plan.saved_posts)
-        await session.flush()
-        likes_created, comments_created = await ensure_engagement(
-            session, users, plan.follows
-        )
-        await session.commit()
-
-    print("✅ Seed data inserted.")
-    print("   Users:", ", ".join(user.username for user in plan.users))
-    print("   Default password:", DEFAULT_PASSWORD)
-    print("   Posts:", len(plan.posts))
-    print("   Follows:", len(plan.follows))
-    print("   Follow requests:", len(plan.follow_requests))
-    print("   Saved links:", len(plan.saved_posts))
-    print("   Likes added:", likes_created)
-    print("   Comments added:", comments_created)
+async def seed() -> None:
+    plan = build_seed_plan()
+    # Object storage sync is blocking network I/O that no database row depends
+    # on, so it runs on worker threads while the database pass proceeds.
+    storage_sync = asyncio.gather(
+        asyncio.to_thread(_sync_default_avatar),
+        asyncio.to_thread(ensure_seed_post_media, plan.posts),
+    )
+    try:
+        likes_created, comments_created = await _seed_database(plan)
+    finally:
+        await storage_sync
+
+    # The report is written in one call rather than one locked write per line.
+    lines = [
+        "✅ Seed data inserted.",
+        f"   Users: {', '.join(user.username for user in plan.users)}",
+        f"   Default password: {DEFAULT_PASSWORD}",
+        f"   Posts: {len(plan.posts)}",
+        f"   Follows: {len(plan.follows)}",
+        f"   Follow requests: {len(plan.follow_requests)}",
+        f"   Saved links: {len(plan.saved_posts)}",
+        f"   Likes added: {likes_created}",
+        f"   Comments added: {comments_created}",
+    ]
     if plan.discovered_media_posts > 0:
-        print(
+        lines.append(
             f"   Local media loaded: {plan.discovered_media_posts} "
             f"(from {plan.media_dir})"
         )
     else:
-        print(
+        lines.append(
             "   Local media loaded: 0 "
             f"(put files in {plan.media_dir}/<username>/ to use real images)"
         )
 
-    print("\n🔐 Seed credentials and scenarios")
-    for account in sorted(plan.users, key=lambda user: user.username):
+    lines.append("\n🔐 Seed credentials and scenarios")
+    for account in plan.users_by_username:
         display_name = account.name if account.name else "(no display name)"
         visibility = "private" if account.is_private else "public"
-        print(
+        lines.append(
             f"   - {account.username} | password={account.password} | "
             f"name={display_name} | {visibility} | {account.purpose}"
         )
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
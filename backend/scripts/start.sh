@@ -7,6 +7,7 @@ HOST="${UVICORN_HOST:-0.0.0.0}"
 PORT="${UVICORN_PORT:-8000}"
 RELOAD="${UVICORN_RELOAD:-false}"
 PRUNE_ON_STARTUP="${DISMISSED_PRUNE_ON_STARTUP:-true}"
+PRUNE_INTERVAL_SECONDS="${DISMISSED_PRUNE_INTERVAL_SECONDS:-900}"
 SYNC_DEFAULT_AVATARS_ON_STARTUP="${SYNC_DEFAULT_AVATARS_ON_STARTUP:-true}"
 MIGRATION_MAX_RETRIES="${MIGRATION_MAX_RETRIES:-5}"
 MIGRATION_RETRY_DELAY_SECONDS="${MIGRATION_RETRY_DELAY_SECONDS:-2}"
@@ -18,6 +19,13 @@ case "$MIGRATION_MAX_RETRIES" in
     ;;
 esac
 
+case "$PRUNE_INTERVAL_SECONDS" in
+  ''|*[!0-9]*)
+    echo "[startup] WARNING: DISMISSED_PRUNE_INTERVAL_SECONDS must be numeric, defaulting to 900"
+    PRUNE_INTERVAL_SECONDS=900
+    ;;
+esac
+
 case "$MIGRATION_RETRY_DELAY_SECONDS" in
   ''|*[!0-9]*)
     echo "[startup] WARNING: MIGRATION_RETRY_DELAY_SECONDS must be numeric, defaulting to 2"
@@ -54,11 +62,25 @@ else
 fi
 
 if [ "$PRUNE_ON_STARTUP" = "true" ]; then
-  echo "[startup] Launching dismissed-notification prune in background..."
+  # Dismissals no longer prune on the request path; this sweep keeps each
+  # backlog near the cap. An interval of 0 runs a single pass.
+  echo "[startup] Launching dismissed-notification prune in background (interval=${PRUNE_INTERVAL_SECONDS}s)..."
   (
-    if ! uv run python scripts/prune_dismissed_notifications.py; then
-      echo "[startup] WARNING: dismissed-notification prune failed, continuing startup"
-    fi
+    prune_pass=1
+    while :; do
+      if ! uv run python scripts/prune_dismissed_notifications.py; then
+        if [ "$prune_pass" -eq 1 ]; then
+          echo "[startup] WARNING: dismissed-notification prune failed, continuing startup"
+        else
+          echo "[prune] WARNING: dismissed-notification prune pass ${prune_pass} failed; retrying in ${PRUNE_INTERVAL_SECONDS}s"
+        fi
+      fi
+      if [ "$PRUNE_INTERVAL_SECONDS" -eq 0 ]; then
+        break
+      fi
+      sleep "$PRUNE_INTERVAL_SECONDS"
+      prune_pass=$((prune_pass + 1))
+    done
   ) &
 else
   echo "[startup] Skipping dismissed-notification prune (DISMISSED_PRUNE_ON_STARTUP=${PRUNE_ON_STARTUP})"
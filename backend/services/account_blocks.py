@@ -5,37 +5,53 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import cast
 
-from sqlalchemy import and_, delete, exists, or_, select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import and_, delete, exists, literal, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import ColumnElement
 
-from db.errors import is_unique_violation
-from db.query_helpers import _eq
+from db.query_helpers import _eq, insert_ignoring_conflicts
 from models import Follow, FollowRequest, UserBlock
 
 
+def build_block_between_predicate(
+    first_user_id: str | ColumnElement[str],
+    second_user_id: str | ColumnElement[str],
+) -> ColumnElement[bool]:
+    """Return predicate matching a block row between two users either way."""
+    return or_(
+        and_(
+            _eq(UserBlock.blocker_id, first_user_id),
+            _eq(UserBlock.blocked_id, second_user_id),
+        ),
+        and_(
+            _eq(UserBlock.blocker_id, second_user_id),
+            _eq(UserBlock.blocked_id, first_user_id),
+        ),
+    )
+
+
 def build_not_blocked_either_direction_filter(
     *,
-    viewer_id: str,
+    viewer_id: str | ColumnElement[str],
     candidate_user_id_column: ColumnElement[str],
 ) -> ColumnElement[bool]:
     """Return SQL predicate ensuring viewer/candidate pair has no block either way."""
-    block_exists = exists(
+    # One EXISTS per direction lets each probe use its own index (the primary
+    # key, and ix_user_blocks_blocked_blocker for the reverse) instead of a
+    # BitmapOr over a single OR'ed subquery.
+    blocked_by_viewer = exists(
         select(1).where(
-            or_(
-                and_(
-                    _eq(UserBlock.blocker_id, viewer_id),
-                    _eq(UserBlock.blocked_id, candidate_user_id_column),
-                ),
-                and_(
-                    _eq(UserBlock.blocker_id, candidate_user_id_column),
-                    _eq(UserBlock.blocked_id, viewer_id),
-                ),
-            )
+            _eq(UserBlock.blocker_id, viewer_id),
+            _eq(UserBlock.blocked_id, candidate_user_id_column),
         )
     )
-    return cast(ColumnElement[bool], ~block_exists)
+    blocked_by_candidate = exists(
+        select(1).where(
+            _eq(UserBlock.blocker_id, candidate_user_id_column),
+            _eq(UserBlock.blocked_id, viewer_id),
+        )
+    )
+    return cast(ColumnElement[bool], ~or_(blocked_by_viewer, blocked_by_candidate))
 
 
 @dataclass(slots=True)
@@ -53,42 +69,22 @@ async def get_block_state(
     if viewer_id == target_id:
         return BlockState(is_blocked=False, is_blocked_by=False)
 
+    # Both directions come back as two booleans in one row; no UserBlock rows
+    # are loaded into the session.
     result = await session.execute(
-        select(UserBlock).where(
-            or_(
-                and_(
-                    _eq(UserBlock.blocker_id, viewer_id),
-                    _eq(UserBlock.blocked_id, target_id),
-                ),
-                and_(
-                    _eq(UserBlock.blocker_id, target_id),
-                    _eq(UserBlock.blocked_id, viewer_id),
-                ),
-            )
+        select(
+            exists().where(
+                _eq(UserBlock.blocker_id, viewer_id),
+                _eq(UserBlock.blocked_id, target_id),
+            ),
+            exists().where(
+                _eq(UserBlock.blocker_id, target_id),
+                _eq(UserBlock.blocked_id, viewer_id),
+            ),
         )
     )
-    rows = result.scalars().all()
-    is_blocked = any(
-        row.blocker_id == viewer_id and row.blocked_id == target_id for row in rows
-    )
-    is_blocked_by = any(
-        row.blocker_id == target_id and row.blocked_id == viewer_id for row in rows
-    )
-    return BlockState(is_blocked=is_blocked, is_blocked_by=is_blocked_by)
-
-
-async def are_users_blocked(
-    session: AsyncSession,
-    *,
-    user_id: str,
-    other_user_id: str,
-) -> bool:
-    state = await get_block_state(
-        session,
-        viewer_id=user_id,
-        target_id=other_user_id,
-    )
-    return state.is_blocked or state.is_blocked_by
+    is_blocked, is_blocked_by = result.one()
+    return BlockState(is_blocked=bool(is_blocked), is_blocked_by=bool(is_blocked_by))
 
 
 async def apply_user_block(
@@ -104,38 +100,27 @@ async def apply_user_block(
     if blocker_id == blocked_id:
         raise ValueError("Cannot block yourself")
 
-    existing = await session.execute(
-        select(UserBlock).where(
-            _eq(UserBlock.blocker_id, blocker_id),
-            _eq(UserBlock.blocked_id, blocked_id),
+    # The conflict-ignoring INSERT reports through RETURNING whether the block
+    # is new, so no existence SELECT or unique-violation retry is needed.
+    insert_block = insert_ignoring_conflicts(
+        session.get_bind().dialect.name,
+        UserBlock,
+        index_elements=["blocker_id", "blocked_id"],
+    )
+    inserted = await session.execute(
+        insert_block.values(blocker_id=blocker_id, blocked_id=blocked_id).returning(
+            cast(ColumnElement[str], UserBlock.blocker_id)
         )
     )
-    already_blocked = existing.scalar_one_or_none() is not None
+    created = inserted.scalar_one_or_none() is not None
 
     await _delete_relationship_edges(
         session,
         first_user_id=blocker_id,
         second_user_id=blocked_id,
     )
-
-    if not already_blocked:
-        session.add(UserBlock(blocker_id=blocker_id, blocked_id=blocked_id))
-
-    try:
-        await session.commit()
-    except IntegrityError as exc:
-        await session.rollback()
-        if not is_unique_violation(exc):
-            raise
-        await _delete_relationship_edges(
-            session,
-            first_user_id=blocker_id,
-            second_user_id=blocked_id,
-        )
-        await session.commit()
-        return False
-
-    return not already_blocked
+    await session.commit()
+    return created
 
 
 async def remove_user_block(
@@ -168,31 +153,43 @@ async def _delete_relationship_edges(
     first_user_id: str,
     second_user_id: str,
 ) -> None:
-    await session.execute(
-        delete(Follow).where(
-            or_(
-                and_(
-                    _eq(Follow.follower_id, first_user_id),
-                    _eq(Follow.followee_id, second_user_id),
-                ),
-                and_(
-                    _eq(Follow.follower_id, second_user_id),
-                    _eq(Follow.followee_id, first_user_id),
-                ),
-            )
+    delete_follows = delete(Follow).where(
+        or_(
+            and_(
+                _eq(Follow.follower_id, first_user_id),
+                _eq(Follow.followee_id, second_user_id),
+            ),
+            and_(
+                _eq(Follow.follower_id, second_user_id),
+                _eq(Follow.followee_id, first_user_id),
+            ),
         )
     )
-    await session.execute(
-        delete(FollowRequest).where(
-            or_(
-                and_(
-                    _eq(FollowRequest.requester_id, first_user_id),
-                    _eq(FollowRequest.target_id, second_user_id),
-                ),
-                and_(
-                    _eq(FollowRequest.requester_id, second_user_id),
-                    _eq(FollowRequest.target_id, first_user_id),
-                ),
-            )
+    delete_requests = delete(FollowRequest).where(
+        or_(
+            and_(
+                _eq(FollowRequest.requester_id, first_user_id),
+                _eq(FollowRequest.target_id, second_user_id),
+            ),
+            and_(
+                _eq(FollowRequest.requester_id, second_user_id),
+                _eq(FollowRequest.target_id, first_user_id),
+            ),
         )
     )
+
+    if session.get_bind().dialect.name != "postgresql":
+        await session.execute(delete_follows)
+        await session.execute(delete_requests)
+        return
+
+    # PostgreSQL runs both DELETEs as data-modifying CTEs of one statement.
+    follows_cte = delete_follows.returning(
+        cast(ColumnElement[str], Follow.follower_id)
+    ).cte("deleted_follows")
+    requests_cte = delete_requests.returning(
+        cast(ColumnElement[str], FollowRequest.requester_id)
+    ).cte("deleted_follow_requests")
+    await session.execute(
+        select(literal(1)).add_cte(follows_cte).add_cte(requests_cte)
+    )
@@ -2,42 +2,69 @@
 
 from __future__ import annotations
 
-from sqlalchemy import select
+from dataclasses import dataclass
+
+from sqlalchemy import exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db.query_helpers import _eq
 from models import Follow, FollowRequest, User
-from services.account_blocks import are_users_blocked
+from services.account_blocks import build_block_between_predicate
+
+
+@dataclass(slots=True)
+class FollowState:
+    is_following: bool
+    is_requested: bool
 
 
-async def is_following(
+async def get_follow_state(
     session: AsyncSession,
     *,
     follower_id: str,
     followee_id: str,
-) -> bool:
+) -> FollowState:
+    """Return follow and pending-request flags for a pair in one round trip."""
     result = await session.execute(
-        select(Follow).where(
-            _eq(Follow.follower_id, follower_id),
-            _eq(Follow.followee_id, followee_id),
+        select(
+            exists().where(
+                _eq(Follow.follower_id, follower_id),
+                _eq(Follow.followee_id, followee_id),
+            ),
+            exists().where(
+                _eq(FollowRequest.requester_id, follower_id),
+                _eq(FollowRequest.target_id, followee_id),
+            ),
         )
     )
-    return result.scalar_one_or_none() is not None
+    following, requested = result.one()
+    return FollowState(is_following=bool(following), is_requested=bool(requested))
+
+
+@dataclass(slots=True)
+class ViewerAccessState:
+    is_blocked: bool
+    is_following: bool
 
 
-async def is_follow_request_pending(
+async def get_viewer_access_state(
     session: AsyncSession,
     *,
-    requester_id: str,
+    viewer_id: str,
     target_id: str,
-) -> bool:
+) -> ViewerAccessState:
+    """Return block (either direction) and follow flags for a pair in one round trip."""
     result = await session.execute(
-        select(FollowRequest).where(
-            _eq(FollowRequest.requester_id, requester_id),
-            _eq(FollowRequest.target_id, target_id),
+        select(
+            exists().where(build_block_between_predicate(viewer_id, target_id)),
+            exists().where(
+                _eq(Follow.follower_id, viewer_id),
+                _eq(Follow.followee_id, target_id),
+            ),
         )
     )
-    return result.scalar_one_or_none() is not None
+    blocked, following = result.one()
+    return ViewerAccessState(is_blocked=bool(blocked), is_following=bool(following))
 
 
 async def can_view_account_content(
@@ -52,16 +79,14 @@ async def can_view_account_content(
 
     if viewer_id == target_id:
         return True
-    if await are_users_blocked(
+    access = await get_viewer_access_state(
         session,
-        user_id=viewer_id,
-        other_user_id=target_id,
-    ):
+        viewer_id=viewer_id,
+        target_id=target_id,
+    )
+    if access.is_blocked:
         return False
     if not account.is_private:
         return True
-    return await is_following(
-        session,
-        follower_id=viewer_id,
-        followee_id=target_id,
-    )
+    return access.is_following
+
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
-from typing import Literal
+from functools import lru_cache
+from typing import Literal, TypedDict
 
 from fastapi import Response
 
@@ -13,54 +13,55 @@ ACCESS_COOKIE = "access_token"
 REFRESH_COOKIE = "refresh_token"
 COOKIE_PATH = "/"
 COOKIE_SAMESITE: Literal["lax", "strict", "none"] = "lax"
-COOKIE_SECURE = (
-    settings.app_env.strip().lower() not in {"local", "test"}
-    and not settings.allow_insecure_http_cookies
-)
 
 
-def _access_token_ttl() -> timedelta:
-    return timedelta(minutes=settings.access_token_expire_minutes)
+class _CookieAttributes(TypedDict):
+    httponly: bool
+    secure: bool
+    samesite: Literal["lax", "strict", "none"]
+    path: str
 
 
-def _refresh_token_ttl() -> timedelta:
-    return timedelta(minutes=settings.refresh_token_expire_minutes)
+@lru_cache(maxsize=1)
+def _cookie_attributes() -> _CookieAttributes:
+    """Return the attributes shared by every auth cookie set/delete call."""
+    # Built on first use rather than at import; the environment does not
+    # change for the life of the process.
+    secure = (
+        settings.app_env.strip().lower() not in {"local", "test"}
+        and not settings.allow_insecure_http_cookies
+    )
+    return _CookieAttributes(
+        httponly=True,
+        secure=secure,
+        samesite=COOKIE_SAMESITE,
+        path=COOKIE_PATH,
+    )
 
 
-def set_token_cookies(response: Response, access_token: str, refresh_token: str) -> None:
-    access_max_age = int(_access_token_ttl().total_seconds())
-    refresh_max_age = int(_refresh_token_ttl().total_seconds())
+@lru_cache(maxsize=8)
+def _max_age_seconds(expire_minutes: int) -> int:
+    # Keyed on the configured minutes, so a settings override still applies.
+    return expire_minutes * 60
 
+
+def set_token_cookies(response: Response, access_token: str, refresh_token: str) -> None:
+    attributes = _cookie_attributes()
     response.set_cookie(
         key=ACCESS_COOKIE,
         value=access_token,
-        httponly=True,
-        secure=COOKIE_SECURE,
-        samesite=COOKIE_SAMESITE,
-        max_age=access_max_age,
-        path=COOKIE_PATH,
+        max_age=_max_age_seconds(settings.access_token_expire_minutes),
+        **attributes,
     )
     response.set_cookie(
         key=REFRESH_COOKIE,
         value=refresh_token,
-        httponly=True,
-        secure=COOKIE_SECURE,
-        samesite=COOKIE_SAMESITE,
-        max_age=refresh_max_age,
-        path=COOKIE_PATH,
+        max_age=_max_age_seconds(settings.refresh_token_expire_minutes),
+        **attributes,
     )
 
 
 def clear_token_cookies(response: Response) -> None:
-    response.delete_cookie(
-        key=ACCESS_COOKIE,
-        path=COOKIE_PATH,
-        secure=COOKIE_SECURE,
-        samesite=COOKIE_SAMESITE,
-    )
-    response.delete_cookie(
-        key=REFRESH_COOKIE,
-        path=COOKIE_PATH,
-        secure=COOKIE_SECURE,
-        samesite=COOKIE_SAMESITE,
-    )
+    attributes = _cookie_attributes()
+    response.delete_cookie(key=ACCESS_COOKIE, **attributes)
+    response.delete_cookie(key=REFRESH_COOKIE, **attributes)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
 
 from minio import Minio
@@ -21,8 +23,18 @@ DEFAULT_AVATAR_ASSET_PATH = (
 MISSING_OBJECT_CODES = frozenset({"NoSuchKey", "NoSuchObject", "ResourceNotFound"})
 
 
+@lru_cache(maxsize=1)
+def _load_default_avatar_payload() -> bytes | None:
+    # The bundled PNG is a few KB; reading it once removes the stat/open work
+    # from every later sync.
+    try:
+        return DEFAULT_AVATAR_ASSET_PATH.read_bytes()
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+
+
 def has_default_avatar_asset() -> bool:
-    return DEFAULT_AVATAR_ASSET_PATH.exists() and DEFAULT_AVATAR_ASSET_PATH.is_file()
+    return _load_default_avatar_payload() is not None
 
 
 def _object_exists(client: Minio, object_key: str) -> bool:
@@ -36,7 +48,8 @@ def _object_exists(client: Minio, object_key: str) -> bool:
 
 
 def sync_default_avatar_asset(client: Minio | None = None) -> str:
-    if not has_default_avatar_asset():
+    payload = _load_default_avatar_payload()
+    if payload is None:
         raise FileNotFoundError(
             f"Missing default avatar asset: {DEFAULT_AVATAR_ASSET_PATH}"
         )
@@ -47,12 +60,11 @@ def sync_default_avatar_asset(client: Minio | None = None) -> str:
     if _object_exists(minio_client, object_key):
         return "existing"
 
-    with DEFAULT_AVATAR_ASSET_PATH.open("rb") as file_handle:
-        minio_client.put_object(
-            settings.minio_bucket,
-            object_key,
-            data=file_handle,
-            length=DEFAULT_AVATAR_ASSET_PATH.stat().st_size,
-            content_type="image/png",
-        )  # pragma: no cover - network call
+    minio_client.put_object(
+        settings.minio_bucket,
+        object_key,
+        data=BytesIO(payload),
+        length=len(payload),
+        content_type="image/png",
+    )  # pragma: no cover - network call
     return "uploaded"
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterable
 from typing import Any, Callable, cast
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import case, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core import verify_password
@@ -22,12 +22,14 @@ def normalize_email(value: str) -> str:
 
 
 def resolve_user_from_candidates(
-    candidates: Sequence[User],
+    candidates: Iterable[User],
     *,
     password: str,
     preferred_identifier: str | None = None,
     identifier_getter: Callable[[User], str | None] | None = None,
 ) -> User | None:
+    # Candidates may be a lazy result; verification stops at the first match,
+    # so later rows are never pulled unless a reorder is requested.
     ordered_candidates = candidates
     if preferred_identifier is not None and identifier_getter is not None:
         ordered_candidates = sorted(
@@ -78,46 +80,37 @@ async def resolve_login_user(
 ) -> User | None:
     if "@" in identifier:
         lowered_identifier = normalize_email(identifier)
-        lowered_email_column = cast(Any, func.lower(cast(Any, User.email)))
-        email_result = await session.execute(
+        email_column = cast(Any, User.email)
+        lowered_email_column = cast(Any, func.lower(email_column))
+        email_alias_column = cast(Any, User.email_login_alias)
+        username_column = cast(Any, User.username)
+        lowered_username_column = cast(Any, func.lower(username_column))
+        # One query returns every candidate in verification order: email
+        # matches, then legacy login aliases, then email-like usernames, each
+        # preferring the exact-case identifier and then the oldest account.
+        match_rank = case(
+            (_eq(email_column, identifier), 0),
+            (_eq(lowered_email_column, lowered_identifier), 1),
+            (_eq(email_alias_column, lowered_identifier), 2),
+            (_eq(username_column, identifier), 3),
+            else_=4,
+        )
+        candidates_result = await session.execute(
             select(User)
-            .where(_eq(lowered_email_column, lowered_identifier))
-            .order_by(_asc(User.created_at), _asc(User.id))
+            .where(
+                or_(
+                    _eq(lowered_email_column, lowered_identifier),
+                    _eq(email_alias_column, lowered_identifier),
+                    _eq(lowered_username_column, lowered_identifier),
+                )
+            )
+            .order_by(match_rank, _asc(User.created_at), _asc(User.id))
         )
-        user = resolve_user_from_candidates(
-            email_result.scalars().all(),
+        return resolve_user_from_candidates(
+            candidates_result.scalars(),
             password=password,
-            preferred_identifier=identifier,
-            identifier_getter=lambda candidate: candidate.email,
         )
 
-        if user is None:
-            alias_result = await session.execute(
-                select(User)
-                .where(_eq(User.email_login_alias, lowered_identifier))
-                .order_by(_asc(User.created_at), _asc(User.id))
-            )
-            user = resolve_user_from_candidates(
-                alias_result.scalars().all(),
-                password=password,
-                preferred_identifier=lowered_identifier,
-                identifier_getter=lambda candidate: candidate.email_login_alias,
-            )
-
-        if user is None:
-            legacy_result = await session.execute(
-                select(User)
-                .where(_eq(func.lower(cast(Any, User.username)), lowered_identifier))
-                .order_by(_asc(User.created_at), _asc(User.id))
-            )
-            user = resolve_user_from_candidates(
-                legacy_result.scalars().all(),
-                password=password,
-                preferred_identifier=identifier,
-                identifier_getter=lambda candidate: candidate.username,
-            )
-        return user
-
     result = await session.execute(select(User).where(_eq(User.username, identifier)).limit(1))
     user = result.scalar_one_or_none()
     if user is not None and not verify_password(password, user.password_hash):
@@ -7,7 +7,7 @@ from datetime import datetime, timezone
 from typing import Any, Callable, cast
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import Delete, Insert, delete, insert, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import ColumnElement
 
@@ -19,8 +19,14 @@ MAX_ACTIVE_REFRESH_TOKENS = 5
 DecodeTokenFn = Callable[[str], dict[str, Any]]
 
 
+# hashlib.sha256 is OpenSSL's EVP implementation, which already dispatches to
+# SHA-NI / ARMv8 SHA instructions where the CPU has them. Stored digests must
+# stay SHA-256 hex, so only the constructor lookup is hoisted.
+_sha256 = hashlib.sha256
+
+
 def hash_refresh_token(token: str) -> str:
-    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+    return _sha256(token.encode("utf-8")).hexdigest()
 
 
 def ensure_aware(dt: datetime) -> datetime:
@@ -29,29 +35,67 @@ def ensure_aware(dt: datetime) -> datetime:
     return dt.astimezone(timezone.utc)
 
 
+def _build_surplus_refresh_token_delete(user_id: str, *, keep_newest: int) -> Delete:
+    revoked_column = cast(Any, RefreshToken.revoked_at)
+    issued_at_column = cast(Any, RefreshToken.issued_at)
+    id_column = cast(ColumnElement[int], RefreshToken.id)
+    active_filter = (
+        _eq(RefreshToken.user_id, user_id),
+        cast(ColumnElement[bool], revoked_column.is_(None)),
+    )
+
+    # The newest rows are picked server-side, so surplus tokens go in one
+    # DELETE instead of being loaded and removed one by one.
+    newest_subquery = (
+        select(id_column.label("id"))
+        .where(*active_filter)
+        .order_by(issued_at_column.desc(), id_column.desc())
+        .limit(keep_newest)
+        .subquery("newest_active_refresh_tokens")
+    )
+    newest_ids = select(cast(ColumnElement[int], newest_subquery.c.id))
+    return delete(RefreshToken).where(*active_filter, id_column.not_in(newest_ids))
+
+
 async def enforce_refresh_token_limit(
     session: AsyncSession,
     user_id: str,
     *,
     max_active_tokens: int = MAX_ACTIVE_REFRESH_TOKENS,
 ) -> None:
-    revoked_column = cast(Any, RefreshToken.revoked_at)
-    issued_at_column = cast(Any, RefreshToken.issued_at)
+    await session.execute(
+        _build_surplus_refresh_token_delete(user_id, keep_newest=max_active_tokens)
+    )
 
-    result = await session.execute(
-        select(RefreshToken)
-        .where(
-            _eq(RefreshToken.user_id, user_id),
-            cast(ColumnElement[bool], revoked_column.is_(None)),
+
+def _build_trimming_refresh_token_insert(
+    user_id: str,
+    token_hash: str,
+    *,
+    issued_at: datetime,
+    expires_at: datetime,
+    max_active_tokens: int,
+) -> Insert:
+    # PostgreSQL trims the surplus in a data-modifying CTE of the INSERT. The
+    # CTE cannot see the row being inserted, so it keeps one slot for it.
+    trimmed_cte = (
+        _build_surplus_refresh_token_delete(
+            user_id, keep_newest=max_active_tokens - 1
         )
-        .order_by(issued_at_column.desc())
+        .returning(cast(ColumnElement[int], RefreshToken.id))
+        .cte("trimmed_refresh_tokens")
+    )
+    return (
+        insert(RefreshToken)
+        .values(
+            user_id=user_id,
+            token_hash=token_hash,
+            issued_at=issued_at,
+            expires_at=expires_at,
+        )
+        .returning(RefreshToken)
+        .add_cte(trimmed_cte)
     )
-    tokens = result.scalars().all()
-    surplus = tokens[max_active_tokens:]
-    for token_obj in surplus:
-        await session.delete(token_obj)
-    if surplus:
-        await session.flush()
 
 
 async def store_refresh_token(
@@ -63,20 +107,36 @@ async def store_refresh_token(
     decode_token_fn: DecodeTokenFn = decode_token,
 ) -> RefreshToken:
     payload = decode_token_fn(token)
-    token_obj = RefreshToken(
-        user_id=user_id,
-        token_hash=hash_refresh_token(token),
-        issued_at=datetime.fromtimestamp(payload["iat"], tz=timezone.utc),
-        expires_at=datetime.fromtimestamp(payload["exp"], tz=timezone.utc),
-    )
-    session.add(token_obj)
-    await session.flush()
-    await enforce_refresh_token_limit(
-        session,
-        user_id,
-        max_active_tokens=max_active_tokens,
+    token_hash = hash_refresh_token(token)
+    issued_at = datetime.fromtimestamp(payload["iat"], tz=timezone.utc)
+    expires_at = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
+
+    if session.get_bind().dialect.name != "postgresql" or max_active_tokens <= 0:
+        token_obj = RefreshToken(
+            user_id=user_id,
+            token_hash=token_hash,
+            issued_at=issued_at,
+            expires_at=expires_at,
+        )
+        session.add(token_obj)
+        await session.flush()
+        await enforce_refresh_token_limit(
+            session,
+            user_id,
+            max_active_tokens=max_active_tokens,
+        )
+        return token_obj
+
+    result = await session.execute(
+        _build_trimming_refresh_token_insert(
+            user_id,
+            token_hash,
+            issued_at=issued_at,
+            expires_at=expires_at,
+            max_active_tokens=max_active_tokens,
+        )
     )
-    return token_obj
+    return result.scalar_one()
 
 
 async def get_refresh_token(
@@ -86,9 +146,13 @@ async def get_refresh_token(
     lock_for_update: bool = False,
 ) -> RefreshToken:
     hashed = hash_refresh_token(token)
-    stmt = select(RefreshToken).where(_eq(RefreshToken.token_hash, hashed))
+    # Every refresh runs this lookup; the lambda form caches the built
+    # statement and only rebinds ``hashed`` on later calls.
+    stmt = lambda_stmt(
+        lambda: select(RefreshToken).where(_eq(RefreshToken.token_hash, hashed))
+    )
     if lock_for_update:
-        stmt = stmt.with_for_update()
+        stmt += lambda s: s.with_for_update()
     result = await session.execute(stmt)
     token_obj = result.scalar_one_or_none()
     if token_obj is None:
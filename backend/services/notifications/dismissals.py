@@ -2,26 +2,22 @@
 
 from __future__ import annotations
 
-import logging
-from time import perf_counter
+from collections import Counter
 from typing import Any, cast
 
-from sqlalchemy import delete, select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import delete, func, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import ColumnElement
 
-from db.errors import is_unique_violation
+from db.query_helpers import insert_ignoring_conflicts
 from models import DismissedNotification
 
 from .common import desc, eq
-from .ids import is_supported_notification_id
+from .ids import are_supported_notification_ids, is_supported_notification_id
 from .schemas import MAX_NOTIFICATION_ID_LENGTH, DismissNotificationResponse
 
 MAX_DISMISSED_NOTIFICATIONS = 500
-PRUNE_BATCH_SIZE = 100
 MAX_BULK_DISMISS_NOTIFICATIONS = 64
-logger = logging.getLogger(__name__)
 
 
 async def list_dismissed_notification_ids(
@@ -45,128 +41,72 @@ async def list_dismissed_notification_ids(
     return [row[0] for row in result.all()]
 
 
-async def _prune_dismissed_notifications_once(
-    session: AsyncSession,
-    user_id: str,
-) -> int:
-    return await _delete_stale_dismissed_notifications_batch(
-        session,
-        user_id=user_id,
-        keep_limit=MAX_DISMISSED_NOTIFICATIONS,
-        batch_size=PRUNE_BATCH_SIZE,
-        stale_subquery_name="stale_dismissed_notifications",
-    )
-
-
-async def _delete_stale_dismissed_notifications_batch(
+async def prune_dismissed_notifications_for_users(
     session: AsyncSession,
+    user_ids: list[str],
     *,
-    user_id: str,
-    keep_limit: int,
-    batch_size: int,
-    stale_subquery_name: str,
-) -> int:
+    keep_limit: int = MAX_DISMISSED_NOTIFICATIONS,
+    max_deleted: int | None = None,
+) -> dict[str, int]:
+    """Prune several users' dismissed notifications with one set-based delete.
+
+    At most ``max_deleted`` rows are removed. Returns the number of deleted
+    rows per user id (users with no deletions are omitted).
+    """
     if keep_limit < 0:
         raise ValueError("keep_limit must be non-negative")
-    if batch_size <= 0:
-        raise ValueError("batch_size must be positive")
+    if max_deleted is not None and max_deleted < 0:
+        raise ValueError("max_deleted must be non-negative")
+    if not user_ids or max_deleted == 0:
+        return {}
 
+    user_id_column = cast(ColumnElement[str], DismissedNotification.user_id)
     dismissed_at_column = cast(ColumnElement[Any], DismissedNotification.dismissed_at)
     dismissed_id_column = cast(ColumnElement[int], DismissedNotification.id)
-    stale_ids_subquery = (
-        select(dismissed_id_column)
-        .where(
-            eq(DismissedNotification.user_id, user_id),
-        )
-        .order_by(
-            desc(cast(Any, dismissed_at_column)),
-            desc(cast(Any, dismissed_id_column)),
+    ranked_subquery = (
+        select(
+            dismissed_id_column.label("id"),
+            func.row_number()
+            .over(
+                partition_by=user_id_column,
+                order_by=(
+                    desc(cast(Any, dismissed_at_column)),
+                    desc(cast(Any, dismissed_id_column)),
+                ),
+            )
+            .label("recency_rank"),
         )
-        .offset(keep_limit)
-        .limit(batch_size)
-        .subquery(stale_subquery_name)
+        .where(user_id_column.in_(user_ids))
+        .subquery("ranked_dismissed_notifications")
+    )
+    # The wave is ranked once; the run budget bounds the single DELETE instead
+    # of re-ranking every remaining row for each small batch.
+    stale_ids = select(cast(ColumnElement[int], ranked_subquery.c.id)).where(
+        cast(ColumnElement[int], ranked_subquery.c.recency_rank) > keep_limit
     )
+    if max_deleted is not None:
+        stale_ids = stale_ids.limit(max_deleted)
 
-    stale_id_column = cast(ColumnElement[int], stale_ids_subquery.c.id)
     delete_result = await session.execute(
-        delete(DismissedNotification).where(
-            cast(ColumnElement[int], DismissedNotification.id).in_(
-                select(stale_id_column)
-            )
-        )
+        delete(DismissedNotification)
+        .where(dismissed_id_column.in_(stale_ids))
+        .returning(user_id_column)
     )
-    deleted_rows = int(cast(Any, delete_result).rowcount or 0)
-    if deleted_rows > 0:
+    deleted_by_user = Counter(row[0] for row in delete_result.all())
+    if deleted_by_user:
         await session.commit()
-    return deleted_rows
-
-
-async def _run_best_effort_prune(
-    session: AsyncSession,
-    user_id: str,
-) -> None:
-    started_at = perf_counter()
-    try:
-        pruned_rows = await _prune_dismissed_notifications_once(session, user_id)
-    except Exception as prune_error:
-        await session.rollback()
-        logger.warning(
-            "Failed to prune dismissed notifications",
-            extra={"user_id": user_id},
-            exc_info=prune_error,
-        )
-        return
-
-    if pruned_rows <= 0:
-        return
-
-    elapsed_ms = int((perf_counter() - started_at) * 1000)
-    logger.info(
-        "Pruned dismissed notifications",
-        extra={"user_id": user_id, "pruned_rows": pruned_rows, "elapsed_ms": elapsed_ms},
-    )
-
-
-async def prune_dismissed_notifications_for_user(
-    session: AsyncSession,
-    user_id: str,
-    *,
-    keep_limit: int = MAX_DISMISSED_NOTIFICATIONS,
-    batch_size: int = PRUNE_BATCH_SIZE,
-    max_deleted: int | None = None,
-) -> int:
-    """Prune a user's dismissed notifications down to the keep limit."""
-    if keep_limit < 0:
-        raise ValueError("keep_limit must be non-negative")
-    if batch_size <= 0:
-        raise ValueError("batch_size must be positive")
-    if max_deleted is not None and max_deleted < 0:
-        raise ValueError("max_deleted must be non-negative")
-    if max_deleted == 0:
-        return 0
+    return dict(deleted_by_user)
 
-    total_deleted = 0
-    while True:
-        remaining_delete_budget = None
-        if max_deleted is not None:
-            remaining_delete_budget = max_deleted - total_deleted
-            if remaining_delete_budget <= 0:
-                return total_deleted
 
-        effective_batch_size = batch_size
-        if remaining_delete_budget is not None:
-            effective_batch_size = min(effective_batch_size, remaining_delete_budget)
-
-        deleted_rows = await _delete_stale_dismissed_notifications_batch(
-            session,
-            user_id=user_id,
-            keep_limit=keep_limit,
-            batch_size=effective_batch_size,
-            stale_subquery_name="maintenance_stale_dismissed_notifications",
+def _validate_notification_id(normalized_notification_id: str) -> None:
+    if not normalized_notification_id:
+        raise ValueError("notification_id must not be empty")
+    if len(normalized_notification_id) > MAX_NOTIFICATION_ID_LENGTH:
+        raise ValueError(
+            f"notification_id must be at most {MAX_NOTIFICATION_ID_LENGTH} characters"
         )
-        if deleted_rows <= 0:
-            return total_deleted
-        total_deleted += deleted_rows
+    if not is_supported_notification_id(normalized_notification_id):
+        raise ValueError("notification_id format is invalid")
 
 
 async def dismiss_notification_for_user(
@@ -176,63 +116,47 @@ async def dismiss_notification_for_user(
     notification_id: str,
 ) -> DismissNotificationResponse:
     normalized_notification_id = notification_id.strip()
-    if not normalized_notification_id:
-        raise ValueError("notification_id must not be empty")
-    if len(normalized_notification_id) > MAX_NOTIFICATION_ID_LENGTH:
-        raise ValueError(
-            f"notification_id must be at most {MAX_NOTIFICATION_ID_LENGTH} characters"
-        )
-    if not is_supported_notification_id(normalized_notification_id):
-        raise ValueError("notification_id format is invalid")
+    _validate_notification_id(normalized_notification_id)
 
-    existing_result = await session.execute(
-        select(DismissedNotification)
-        .where(
-            eq(DismissedNotification.user_id, user_id),
-            eq(DismissedNotification.notification_id, normalized_notification_id),
-        )
-        .limit(1)
+    # New dismissals come back from the INSERT itself; only a repeat dismissal
+    # (the conflict path) needs a second statement to read the stored row.
+    dismissed_at_column = cast(ColumnElement[Any], DismissedNotification.dismissed_at)
+    insert_dismissed = insert_ignoring_conflicts(
+        session.get_bind().dialect.name,
+        DismissedNotification,
+        index_elements=["user_id", "notification_id"],
     )
-    existing = existing_result.scalar_one_or_none()
-    if existing is not None:
-        return DismissNotificationResponse(
-            notification_id=existing.notification_id,
-            dismissed_at=existing.dismissed_at,
-        )
-
-    dismissed = DismissedNotification(
-        user_id=user_id,
-        notification_id=normalized_notification_id,
+    inserted_result = await session.execute(
+        insert_dismissed.values(
+            user_id=user_id,
+            notification_id=normalized_notification_id,
+        ).returning(dismissed_at_column)
     )
-    session.add(dismissed)
-    try:
-        await session.commit()
-    except IntegrityError as exc:
-        await session.rollback()
-        if not is_unique_violation(exc):
-            raise
-
-        duplicate_result = await session.execute(
-            select(DismissedNotification)
-            .where(
-                eq(DismissedNotification.user_id, user_id),
-                eq(DismissedNotification.notification_id, normalized_notification_id),
+    dismissed_at = inserted_result.scalar_one_or_none()
+    if dismissed_at is None:
+        existing_result = await session.execute(
+            lambda_stmt(
+                lambda: select(dismissed_at_column)
+                .where(
+                    eq(DismissedNotification.user_id, user_id),
+                    eq(
+                        DismissedNotification.notification_id,
+                        normalized_notification_id,
+                    ),
+                )
+                .limit(1)
             )
-            .limit(1)
         )
-        duplicate = duplicate_result.scalar_one_or_none()
-        if duplicate is None:  # pragma: no cover - defensive
-            raise
+        await session.commit()
         return DismissNotificationResponse(
-            notification_id=duplicate.notification_id,
-            dismissed_at=duplicate.dismissed_at,
+            notification_id=normalized_notification_id,
+            dismissed_at=existing_result.scalar_one(),
         )
 
-    await session.refresh(dismissed)
-    await _run_best_effort_prune(session, user_id)
+    await session.commit()
     return DismissNotificationResponse(
-        notification_id=dismissed.notification_id,
-        dismissed_at=dismissed.dismissed_at,
+        notification_id=normalized_notification_id,
+        dismissed_at=dismissed_at,
     )
 
 
@@ -249,63 +173,30 @@ async def dismiss_notifications_for_user(
             f"notification_ids must contain at most {MAX_BULK_DISMISS_NOTIFICATIONS} items"
         )
 
-    seen_ids: set[str] = set()
-    normalized_ids: list[str] = []
-    for raw_notification_id in notification_ids:
-        normalized_notification_id = raw_notification_id.strip()
-        if not normalized_notification_id:
-            raise ValueError("notification_id must not be empty")
-        if len(normalized_notification_id) > MAX_NOTIFICATION_ID_LENGTH:
-            raise ValueError(
-                f"notification_id must be at most {MAX_NOTIFICATION_ID_LENGTH} characters"
-            )
-        if not is_supported_notification_id(normalized_notification_id):
-            raise ValueError("notification_id format is invalid")
-        if normalized_notification_id in seen_ids:
-            continue
-        seen_ids.add(normalized_notification_id)
-        normalized_ids.append(normalized_notification_id)
-
-    existing_notification_id_column = cast(
-        ColumnElement[str], DismissedNotification.notification_id
+    normalized_ids = [raw_id.strip() for raw_id in notification_ids]
+    # One pass of the compiled pattern clears the usual all-valid batch; the
+    # per-id checks only run to report which rule the first bad id breaks.
+    if max(map(len, normalized_ids)) > MAX_NOTIFICATION_ID_LENGTH or not (
+        are_supported_notification_ids(normalized_ids)
+    ):
+        for normalized_notification_id in normalized_ids:
+            _validate_notification_id(normalized_notification_id)
+    normalized_ids = list(dict.fromkeys(normalized_ids))
+
+    # Already-dismissed and concurrently inserted ids are skipped by the
+    # conflict clause, so the batch is one idempotent statement.
+    insert_dismissed = insert_ignoring_conflicts(
+        session.get_bind().dialect.name,
+        DismissedNotification,
+        index_elements=["user_id", "notification_id"],
     )
-    existing_result = await session.execute(
-        select(existing_notification_id_column).where(
-            eq(DismissedNotification.user_id, user_id),
-            cast(ColumnElement[str], DismissedNotification.notification_id).in_(normalized_ids),
-        )
-    )
-    existing_notification_ids = {row[0] for row in existing_result.all()}
-    missing_notification_ids = [
-        notification_id
-        for notification_id in normalized_ids
-        if notification_id not in existing_notification_ids
-    ]
-
-    if missing_notification_ids:
-        session.add_all(
+    await session.execute(
+        insert_dismissed.values(
             [
-                DismissedNotification(
-                    user_id=user_id,
-                    notification_id=notification_id,
-                )
-                for notification_id in missing_notification_ids
+                {"user_id": user_id, "notification_id": notification_id}
+                for notification_id in normalized_ids
             ]
         )
-        try:
-            await session.commit()
-        except IntegrityError as exc:
-            await session.rollback()
-            if not is_unique_violation(exc):
-                raise
-            # Concurrent inserts are idempotent; retry through the single-item path.
-            for notification_id in missing_notification_ids:
-                await dismiss_notification_for_user(
-                    session,
-                    user_id,
-                    notification_id=notification_id,
-                )
-        else:
-            await _run_best_effort_prune(session, user_id)
-
+    )
+    await session.commit()
     return len(normalized_ids)
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, NamedTuple, cast
 from urllib.parse import quote
 
-from sqlalchemy import Integer, String, and_, literal, or_, select, union_all
+from sqlalchemy import Integer, Select, and_, bindparam, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 from sqlalchemy.sql import ColumnElement
 
-from models import Comment, DismissedNotification, FollowRequest, Like, Post, User
+from models import DismissedNotification, FollowRequest, NotificationEvent, User
+from models.column_types import USER_ID_TYPE
 from services.account_blocks import build_not_blocked_either_direction_filter
 
 from .common import desc, eq
@@ -19,10 +22,7 @@ from .ids import (
     build_comment_notification_id,
     build_follow_notification_id,
     build_like_notification_id,
-    comment_notification_id_expression,
     follow_notification_id_expression,
-    legacy_like_notification_id_expression,
-    like_notification_id_expression,
 )
 from .schemas import FollowStreamItem, NotificationStreamItem, NotificationStreamResponse
 
@@ -31,6 +31,12 @@ DEFAULT_STREAM_NOTIFICATIONS = 16
 MAX_STREAM_FOLLOW_ITEMS = 32
 DEFAULT_STREAM_FOLLOW_ITEMS = 8
 
+# The stream statements are built once with these placeholders; each request
+# only binds values, and the compiled SQL is reused from SQLAlchemy's cache.
+_VIEWER_ID = bindparam("viewer_id", type_=USER_ID_TYPE)
+_ROW_LIMIT = bindparam("row_limit", type_=Integer())
+
+
 class NotificationEventRow(NamedTuple):
     kind: str
     post_id: int
@@ -40,144 +46,87 @@ class NotificationEventRow(NamedTuple):
     occurred_at: datetime | None
 
 
-def _build_comment_events_visible_subquery(
-    user_id: str,
-    limit: int,
-) -> Any:
-    comment_id_column = cast(ColumnElement[int], Comment.id)
-    comment_post_id_column = cast(ColumnElement[int], Comment.post_id)
-    comment_author_id_column = cast(ColumnElement[str], Comment.author_id)
-    comment_created_at_column = cast(ColumnElement[datetime], Comment.created_at)
-    comment_author_username_column = cast(ColumnElement[str | None], User.username)
-    comment_notification_id_column = comment_notification_id_expression(
-        comment_post_id_column,
-        comment_id_column,
-    )
-    dismissed_comment = aliased(DismissedNotification)
-    dismissed_comment_id_column = cast(ColumnElement[int | None], dismissed_comment.id)
-    dismissed_comment_notification_id_column = cast(
-        ColumnElement[str], dismissed_comment.notification_id
-    )
-
-    return (
-        select(
-            comment_post_id_column.label("post_id"),
-            comment_id_column.label("comment_id"),
-            comment_author_username_column.label("username"),
-            comment_created_at_column.label("occurred_at"),
-        )
-        .join(Post, eq(Post.id, Comment.post_id))
-        .join(User, eq(User.id, Comment.author_id))
-        .outerjoin(
-            dismissed_comment,
-            and_(
-                eq(dismissed_comment.user_id, user_id),
-                eq(
-                    dismissed_comment_notification_id_column,
-                    comment_notification_id_column,
-                ),
-            ),
-        )
-        .where(
-            eq(Post.author_id, user_id),
-            comment_author_id_column != user_id,
-            build_not_blocked_either_direction_filter(
-                viewer_id=user_id,
-                candidate_user_id_column=comment_author_id_column,
-            ),
-            dismissed_comment_id_column.is_(None),
-        )
-        .order_by(
-            desc(cast(Any, Comment.created_at)),
-            desc(cast(Any, Comment.id)),
-        )
-        .limit(limit)
-        .subquery("comment_events_visible")
-    )
-
-
-def _build_like_events_visible_subquery(
-    user_id: str,
-    limit: int,
-) -> Any:
-    like_post_id_column = cast(ColumnElement[int], Like.post_id)
-    like_user_id_column = cast(ColumnElement[str], Like.user_id)
-    like_updated_at_column = cast(ColumnElement[datetime], Like.updated_at)
-    like_username_column = cast(ColumnElement[str | None], User.username)
-    like_event_time_column = like_updated_at_column
-    like_notification_id_column = like_notification_id_expression(
-        like_post_id_column,
-        like_user_id_column,
-    )
-    legacy_like_notification_id_column = legacy_like_notification_id_expression(
-        like_post_id_column
-    )
-    dismissed_like_exact = aliased(DismissedNotification)
-    dismissed_like_legacy = aliased(DismissedNotification)
-    dismissed_like_exact_notification_id_column = cast(
-        ColumnElement[str], dismissed_like_exact.notification_id
-    )
-    dismissed_like_legacy_notification_id_column = cast(
-        ColumnElement[str], dismissed_like_legacy.notification_id
+@lru_cache(maxsize=1)
+def _notification_events_statement() -> Select[Any]:
+    # Comment and like events are kept in ``notification_events`` by triggers,
+    # so the stream is one backward scan of ix_notification_events_recipient_sort
+    # (which holds the whole ORDER BY) instead of a UNION over the comment and
+    # like tables.
+    kind_column = cast(ColumnElement[str], NotificationEvent.kind)
+    post_id_column = cast(ColumnElement[int], NotificationEvent.post_id)
+    comment_id_column = cast(ColumnElement[int | None], NotificationEvent.comment_id)
+    actor_id_column = cast(ColumnElement[str], NotificationEvent.actor_id)
+    occurred_at_column = cast(ColumnElement[datetime], NotificationEvent.occurred_at)
+    actor_username_column = cast(ColumnElement[str | None], User.username)
+    dismissed_exact = aliased(DismissedNotification)
+    dismissed_legacy = aliased(DismissedNotification)
+    dismissed_exact_at_column = cast(
+        ColumnElement[datetime | None], dismissed_exact.dismissed_at
     )
-    dismissed_like_exact_at_column = cast(
-        ColumnElement[datetime | None], dismissed_like_exact.dismissed_at
-    )
-    dismissed_like_legacy_at_column = cast(
-        ColumnElement[datetime | None], dismissed_like_legacy.dismissed_at
+    dismissed_legacy_at_column = cast(
+        ColumnElement[datetime | None], dismissed_legacy.dismissed_at
     )
 
     return (
         select(
-            like_post_id_column.label("post_id"),
-            like_user_id_column.label("liker_user_id"),
-            like_username_column.label("username"),
-            like_event_time_column.label("occurred_at"),
+            kind_column,
+            post_id_column,
+            comment_id_column,
+            actor_id_column,
+            actor_username_column,
+            occurred_at_column,
         )
-        .join(Post, eq(Post.id, Like.post_id))
-        .join(User, eq(User.id, Like.user_id))
+        .join(User, eq(User.id, NotificationEvent.actor_id))
         .outerjoin(
-            dismissed_like_exact,
+            dismissed_exact,
             and_(
-                eq(dismissed_like_exact.user_id, user_id),
+                eq(dismissed_exact.user_id, _VIEWER_ID),
                 eq(
-                    dismissed_like_exact_notification_id_column,
-                    like_notification_id_column,
+                    cast(ColumnElement[str], dismissed_exact.notification_id),
+                    cast(ColumnElement[str], NotificationEvent.notification_id),
                 ),
             ),
         )
         .outerjoin(
-            dismissed_like_legacy,
+            dismissed_legacy,
             and_(
-                eq(dismissed_like_legacy.user_id, user_id),
+                eq(dismissed_legacy.user_id, _VIEWER_ID),
                 eq(
-                    dismissed_like_legacy_notification_id_column,
-                    legacy_like_notification_id_column,
+                    cast(ColumnElement[str], dismissed_legacy.notification_id),
+                    cast(
+                        ColumnElement[str | None],
+                        NotificationEvent.legacy_notification_id,
+                    ),
                 ),
             ),
         )
         .where(
-            eq(Post.author_id, user_id),
-            like_user_id_column != user_id,
+            eq(NotificationEvent.recipient_id, _VIEWER_ID),
             build_not_blocked_either_direction_filter(
-                viewer_id=user_id,
-                candidate_user_id_column=like_user_id_column,
+                viewer_id=_VIEWER_ID,
+                candidate_user_id_column=actor_id_column,
             ),
+            # A dismissed comment stays hidden; a dismissed like reappears
+            # once the same user likes the post again.
             or_(
-                dismissed_like_exact_at_column.is_(None),
-                dismissed_like_exact_at_column < like_event_time_column,
+                dismissed_exact_at_column.is_(None),
+                and_(
+                    kind_column == "like",
+                    dismissed_exact_at_column < occurred_at_column,
+                ),
             ),
             or_(
-                dismissed_like_legacy_at_column.is_(None),
-                dismissed_like_legacy_at_column < like_event_time_column,
+                dismissed_legacy_at_column.is_(None),
+                dismissed_legacy_at_column < occurred_at_column,
             ),
         )
         .order_by(
-            desc(cast(Any, Like.updated_at)),
-            desc(cast(Any, Like.post_id)),
+            desc(cast(Any, NotificationEvent.occurred_at)),
+            desc(cast(Any, NotificationEvent.post_id)),
+            desc(cast(Any, NotificationEvent.comment_id)),
+            desc(cast(Any, NotificationEvent.actor_id)),
         )
-        .limit(limit)
-        .subquery("like_events_visible")
+        .limit(_ROW_LIMIT)
     )
 
 
@@ -186,83 +135,19 @@ async def _fetch_notification_event_rows(
     user_id: str,
     *,
     limit: int,
-) -> list[NotificationEventRow]:
-    comment_events_visible = _build_comment_events_visible_subquery(user_id, limit)
-    like_events_visible = _build_like_events_visible_subquery(user_id, limit)
-    null_user_id = literal(None, type_=String(length=36))
-    null_comment_id = literal(None, type_=Integer())
-
-    comment_events = select(
-        literal("comment").label("kind"),
-        cast(ColumnElement[int], comment_events_visible.c.post_id).label("post_id"),
-        cast(ColumnElement[int], comment_events_visible.c.comment_id).label(
-            "comment_id"
-        ),
-        null_user_id.label("liker_user_id"),
-        cast(ColumnElement[str | None], comment_events_visible.c.username).label(
-            "username"
-        ),
-        cast(
-            ColumnElement[datetime | None], comment_events_visible.c.occurred_at
-        ).label("occurred_at"),
-    )
-
-    like_events = select(
-        literal("like").label("kind"),
-        cast(ColumnElement[int], like_events_visible.c.post_id).label("post_id"),
-        null_comment_id.label("comment_id"),
-        cast(ColumnElement[str], like_events_visible.c.liker_user_id).label(
-            "liker_user_id"
-        ),
-        cast(ColumnElement[str | None], like_events_visible.c.username).label(
-            "username"
-        ),
-        cast(
-            ColumnElement[datetime | None], like_events_visible.c.occurred_at
-        ).label("occurred_at"),
-    )
-
-    notification_events = union_all(comment_events, like_events).subquery(
-        "notification_events"
-    )
-    event_kind_column = cast(ColumnElement[str], notification_events.c.kind)
-    event_post_id_column = cast(ColumnElement[int], notification_events.c.post_id)
-    event_comment_id_column = cast(
-        ColumnElement[int | None], notification_events.c.comment_id
-    )
-    event_liker_user_id_column = cast(
-        ColumnElement[str | None], notification_events.c.liker_user_id
-    )
-    event_username_column = cast(
-        ColumnElement[str | None], notification_events.c.username
-    )
-    event_occurred_at_column = cast(
-        ColumnElement[datetime | None], notification_events.c.occurred_at
-    )
-
+) -> Iterator[NotificationEventRow]:
     result = await session.execute(
-        select(
-            event_kind_column,
-            event_post_id_column,
-            event_comment_id_column,
-            event_liker_user_id_column,
-            event_username_column,
-            event_occurred_at_column,
-        )
-        .order_by(
-            desc(cast(Any, event_occurred_at_column)),
-            desc(cast(Any, event_post_id_column)),
-            desc(cast(Any, event_comment_id_column)),
-            desc(cast(Any, event_liker_user_id_column)),
-        )
-        .limit(limit)
+        _notification_events_statement(),
+        {"viewer_id": user_id, "row_limit": limit},
     )
-    return [
+    # Rows are wrapped lazily as the item builder consumes them, so the
+    # buffered result is walked once with no intermediate list.
+    return (
         NotificationEventRow(
             kind=kind,
             post_id=post_id,
             comment_id=comment_id,
-            liker_user_id=liker_user_id,
+            liker_user_id=actor_id if kind == "like" else None,
             username=username,
             occurred_at=occurred_at,
         )
@@ -270,15 +155,15 @@ async def _fetch_notification_event_rows(
             kind,
             post_id,
             comment_id,
-            liker_user_id,
+            actor_id,
             username,
             occurred_at,
-        ) in result.all()
-    ]
+        ) in result
+    )
 
 
 def _build_notification_stream_items(
-    rows: list[NotificationEventRow],
+    rows: Iterable[NotificationEventRow],
 ) -> list[NotificationStreamItem]:
     notifications: list[NotificationStreamItem] = []
     for kind, post_id, comment_id, liker_user_id, username, occurred_at in rows:
@@ -286,7 +171,7 @@ def _build_notification_stream_items(
             if comment_id is None:
                 continue
             notifications.append(
-                NotificationStreamItem(
+                NotificationStreamItem.model_construct(
                     id=build_comment_notification_id(post_id, comment_id),
                     kind="comment",
                     username=username,
@@ -299,7 +184,7 @@ def _build_notification_stream_items(
         if liker_user_id is None:
             continue
         notifications.append(
-            NotificationStreamItem(
+            NotificationStreamItem.model_construct(
                 id=build_like_notification_id(post_id, liker_user_id),
                 kind="like",
                 username=username,
@@ -324,12 +209,8 @@ async def _load_notification_stream_items(
     return _build_notification_stream_items(rows)
 
 
-async def _load_follow_stream_items(
-    session: AsyncSession,
-    user_id: str,
-    *,
-    limit: int,
-) -> list[FollowStreamItem]:
+@lru_cache(maxsize=1)
+def _follow_requests_statement() -> Select[Any]:
     follow_requester_id_column = cast(ColumnElement[str], FollowRequest.requester_id)
     follow_request_created_at_column = cast(
         ColumnElement[datetime], FollowRequest.created_at
@@ -347,7 +228,7 @@ async def _load_follow_stream_items(
         ColumnElement[datetime | None], dismissed_follow.dismissed_at
     )
 
-    result = await session.execute(
+    return (
         select(
             follow_requester_id_column,
             follow_request_created_at_column,
@@ -358,17 +239,17 @@ async def _load_follow_stream_items(
         .outerjoin(
             dismissed_follow,
             and_(
-                eq(dismissed_follow.user_id, user_id),
+                eq(dismissed_follow.user_id, _VIEWER_ID),
                 eq(
                     dismissed_follow_notification_id_column,
                     follow_request_notification_id_column,
                 ),
             ),
         )
-        .where(eq(FollowRequest.target_id, user_id))
+        .where(eq(FollowRequest.target_id, _VIEWER_ID))
         .where(
             build_not_blocked_either_direction_filter(
-                viewer_id=user_id,
+                viewer_id=_VIEWER_ID,
                 candidate_user_id_column=follow_requester_id_column,
             )
         )
@@ -382,7 +263,19 @@ async def _load_follow_stream_items(
             desc(cast(Any, FollowRequest.created_at)),
             desc(cast(Any, FollowRequest.requester_id)),
         )
-        .limit(limit)
+        .limit(_ROW_LIMIT)
+    )
+
+
+async def _load_follow_stream_items(
+    session: AsyncSession,
+    user_id: str,
+    *,
+    limit: int,
+) -> list[FollowStreamItem]:
+    result = await session.execute(
+        _follow_requests_statement(),
+        {"viewer_id": user_id, "row_limit": limit},
     )
 
     follow_items: list[FollowStreamItem] = []
@@ -390,7 +283,7 @@ async def _load_follow_stream_items(
         if not username:
             continue
         follow_items.append(
-            FollowStreamItem(
+            FollowStreamItem.model_construct(
                 id=build_follow_notification_id(requester_id),
                 username=username,
                 name=name or username,
@@ -408,13 +301,17 @@ async def load_notification_stream(
     limit: int,
     follow_limit: int,
 ) -> NotificationStreamResponse:
+    # Both reads share the request's connection: a second pooled connection
+    # per poll could exhaust the pool while requests hold their first one.
     visible_notifications = await _load_notification_stream_items(
         session, user_id, limit=limit
     )
     follow_items = await _load_follow_stream_items(
         session, user_id, limit=follow_limit
     )
-    return NotificationStreamResponse(
+    # Every field comes from typed columns and the id builders, so the
+    # stream models are assembled without re-running pydantic validation.
+    return NotificationStreamResponse.model_construct(
         notifications=visible_notifications,
         follow_requests=follow_items,
         total_count=len(visible_notifications) + len(follow_items),
@@ -0,0 +1,136 @@
+"""Short-lived Redis cache for rendered notification streams."""
+
+from __future__ import annotations
+
+import logging
+from typing import Protocol, runtime_checkable
+from uuid import uuid4
+
+from core import settings
+from services.rate_limiter import get_redis_client
+
+STREAM_CACHE_PREFIX = "notif-stream:v1"
+_VERSION_SEPARATOR = b"|"
+logger = logging.getLogger(__name__)
+
+
+@runtime_checkable
+class SupportsStreamCacheClient(Protocol):
+    async def mget(self, keys: list[str]) -> list[bytes | None]: ...
+
+    async def set(self, name: str, value: bytes, ex: int | None = None) -> object: ...
+
+
+class NotificationStreamCache:
+    """Caches serialized streams per user, versioned for invalidation.
+
+    Each entry is tagged with the user's version token at write time and
+    read together with the current token in one MGET. Invalidating stores a
+    fresh random token, so entries written before it (even by a request that
+    raced the invalidation) no longer match.
+    """
+
+    def __init__(
+        self,
+        redis_client: SupportsStreamCacheClient,
+        ttl_seconds: int,
+        prefix: str = STREAM_CACHE_PREFIX,
+    ) -> None:
+        self.redis = redis_client
+        self.ttl_seconds = max(ttl_seconds, 0)
+        self.prefix = prefix
+
+    def _version_key(self, user_id: str) -> str:
+        return f"{self.prefix}:{user_id}:version"
+
+    def _stream_key(self, user_id: str, limit: int, follow_limit: int) -> str:
+        return f"{self.prefix}:{user_id}:{limit}:{follow_limit}"
+
+    async def get(
+        self,
+        user_id: str,
+        *,
+        limit: int,
+        follow_limit: int,
+    ) -> tuple[bytes | None, bytes]:
+        """Return (cached JSON or None, version token to store a miss under)."""
+        if self.ttl_seconds == 0:
+            return None, b""
+        try:
+            version, entry = await self.redis.mget(
+                [
+                    self._version_key(user_id),
+                    self._stream_key(user_id, limit, follow_limit),
+                ]
+            )
+        except Exception as exc:  # pragma: no cover - defensive fallback for Redis outages
+            logger.warning("Notification stream cache read failed", exc_info=exc)
+            return None, b""
+
+        current_version = version or b"0"
+        if entry is None:
+            return None, current_version
+        entry_version, _, payload = entry.partition(_VERSION_SEPARATOR)
+        if entry_version != current_version:
+            return None, current_version
+        return payload, current_version
+
+    async def set(
+        self,
+        user_id: str,
+        *,
+        limit: int,
+        follow_limit: int,
+        version: bytes,
+        payload: bytes,
+    ) -> None:
+        if self.ttl_seconds == 0 or not version:
+            return
+        entry = version + _VERSION_SEPARATOR + payload
+        try:
+            await self.redis.set(
+                self._stream_key(user_id, limit, follow_limit),
+                entry,
+                ex=self.ttl_seconds,
+            )
+        except Exception as exc:  # pragma: no cover - defensive fallback for Redis outages
+            logger.warning("Notification stream cache write failed", exc_info=exc)
+
+    async def invalidate(self, *user_ids: str) -> None:
+        if self.ttl_seconds == 0:
+            return
+        for user_id in user_ids:
+            try:
+                # Tokens are never reused, so letting one expire with the
+                # entries it guards cannot resurrect an older entry.
+                await self.redis.set(
+                    self._version_key(user_id),
+                    uuid4().hex.encode(),
+                    ex=self.ttl_seconds,
+                )
+            except Exception as exc:  # pragma: no cover - defensive fallback for Redis outages
+                logger.warning(
+                    "Notification stream cache invalidation failed",
+                    extra={"user_id": user_id},
+                    exc_info=exc,
+                )
+
+
+_cached_stream_cache: NotificationStreamCache | None = None
+
+
+def get_notification_stream_cache() -> NotificationStreamCache:
+    """Singleton accessor for the shared notification stream cache."""
+    global _cached_stream_cache
+    if _cached_stream_cache is None:
+        _cached_stream_cache = NotificationStreamCache(
+            redis_client=get_redis_client(),  # type: ignore[arg-type]
+            ttl_seconds=settings.notification_stream_cache_ttl_seconds,
+        )
+    return _cached_stream_cache
+
+
+def set_notification_stream_cache(cache: NotificationStreamCache | None) -> None:
+    """Override the cached stream cache (primarily for tests)."""
+    global _cached_stream_cache
+    _cached_stream_cache = cache
@@ -2,29 +2,34 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
 from functools import lru_cache
 from ipaddress import ip_address, ip_network, IPv4Address, IPv4Network, IPv6Address, IPv6Network
 import hashlib
 import hmac
 import re
-from typing import Callable, Iterable, Protocol, runtime_checkable
+from typing import Any, Callable, Coroutine, Iterable, Protocol, runtime_checkable
 
 from fastapi import status
 from fastapi.responses import JSONResponse
 from redis.asyncio import Redis
+from redis.exceptions import NoScriptError
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from core import decode_token, settings
 
 
 @runtime_checkable
 class SupportsRateLimitClient(Protocol):
-    async def incr(self, key: str) -> int: ...
+    async def script_load(self, script: str) -> str: ...
 
-    async def expire(self, key: str, ttl: int) -> None: ...
+    async def evalsha(self, sha: str, numkeys: int, *keys_and_args: str) -> int: ...
 
 
 @runtime_checkable
@@ -36,10 +41,24 @@ ACCESS_COOKIE_NAME = "access_token"
 REFRESH_COOKIE_NAME = "refresh_token"
 SUPPORTED_TOKEN_TYPES = frozenset({"access", "refresh"})
 AUTH_PATH_PREFIX = "/api/v1/auth"
+OVERLAPPABLE_METHODS = frozenset({"GET", "HEAD"})
+CLIENT_IDENTIFIER_SCOPE_KEY = "rate_limit_client"
 FORWARDED_CLIENT_KEY_HEADER = "x-rate-limit-client"
 FORWARDED_CLIENT_SIGNATURE_HEADER = "x-rate-limit-signature"
 FORWARDED_CLIENT_KEY_PATTERN = re.compile(r"^[A-Za-z0-9_-]{16,128}$")
-FORWARDED_CLIENT_SIGNATURE_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+FORWARDED_CLIENT_SIGNATURE_LENGTH = hashlib.sha256().digest_size * 2
+MAX_TOKEN_LENGTH = 4096
+TOKEN_SUBJECT_CACHE_SIZE = 4096
+# Counting and arming the expiry in one script makes each check a single
+# round-trip, and no request can observe the key without its TTL.
+FIXED_WINDOW_INCR_SCRIPT = """
+local increment = tonumber(ARGV[2])
+local count = redis.call('INCRBY', KEYS[1], increment)
+if count == increment then
+    redis.call('PEXPIRE', KEYS[1], ARGV[1])
+end
+return count
+"""
 
 
 def _parse_networks() -> tuple[IPv4Network | IPv6Network, ...]:
@@ -57,6 +76,36 @@ def _trusted_proxy_networks() -> tuple[IPv4Network | IPv6Network, ...]:
     return _parse_networks()
 
 
+def _merge_network_ranges(
+    networks: Iterable[IPv4Network | IPv6Network],
+) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    starts: list[int] = []
+    ends: list[int] = []
+    for first, last in sorted(
+        (int(network.network_address), int(network.broadcast_address))
+        for network in networks
+    ):
+        if ends and first <= ends[-1] + 1:
+            ends[-1] = max(ends[-1], last)
+        else:
+            starts.append(first)
+            ends.append(last)
+    return tuple(starts), tuple(ends)
+
+
+@lru_cache
+def _trusted_proxy_ranges() -> dict[int, tuple[tuple[int, ...], tuple[int, ...]]]:
+    # Merged, sorted integer ranges per IP version; membership is one bisect
+    # instead of a containment test against every configured network.
+    networks = _trusted_proxy_networks()
+    return {
+        version: _merge_network_ranges(
+            network for network in networks if network.version == version
+        )
+        for version in (4, 6)
+    }
+
+
 def _extract_client_ip_from_headers(request: Request) -> str | None:
     for header in settings.rate_limit_ip_headers:
         value = request.headers.get(header)
@@ -74,7 +123,12 @@ def _extract_client_ip_from_headers(request: Request) -> str | None:
     return None
 
 
-def _extract_subject_from_token(token: str) -> str | None:
+# Verified subjects keyed by a digest of the token (raw tokens are not kept),
+# with the token's expiry; polling clients resend the same token repeatedly.
+_token_subject_cache: OrderedDict[bytes, tuple[str, float]] = OrderedDict()
+
+
+def _decode_subject_from_token(token: str) -> tuple[str, float | None] | None:
     try:
         payload = decode_token(token)
     except ValueError:
@@ -86,11 +140,46 @@ def _extract_subject_from_token(token: str) -> str | None:
 
     subject = payload.get("sub")
     if isinstance(subject, int):
-        return str(subject)
-    if isinstance(subject, str):
+        normalized = str(subject)
+    elif isinstance(subject, str):
         normalized = subject.strip()
-        return normalized or None
-    return None
+    else:
+        return None
+    if not normalized:
+        return None
+
+    expires_at = payload.get("exp")
+    if not isinstance(expires_at, (int, float)):
+        return normalized, None
+    return normalized, float(expires_at)
+
+
+def _extract_subject_from_token(token: str) -> str | None:
+    # Anything that is not three dot-separated JWT segments can be rejected
+    # without any signature work.
+    if len(token) > MAX_TOKEN_LENGTH or token.count(".") != 2:
+        return None
+
+    cache_key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    now = time.time()
+    cached = _token_subject_cache.get(cache_key)
+    if cached is not None:
+        cached_subject, cached_expires_at = cached
+        if cached_expires_at > now:
+            _token_subject_cache.move_to_end(cache_key)
+            return cached_subject
+        del _token_subject_cache[cache_key]
+
+    decoded = _decode_subject_from_token(token)
+    if decoded is None:
+        return None
+    subject, expires_at = decoded
+    # Tokens without an expiry are not cached; nothing would bound the entry.
+    if expires_at is not None:
+        _token_subject_cache[cache_key] = (subject, expires_at)
+        if len(_token_subject_cache) > TOKEN_SUBJECT_CACHE_SIZE:
+            _token_subject_cache.popitem(last=False)
+    return subject
 
 
 def _extract_bearer_token(request: Request) -> str | None:
@@ -127,6 +216,27 @@ def _extract_authenticated_client_identifier(request: Request) -> str | None:
     return None
 
 
+def _decode_hex_signature(signature: str) -> bytes | None:
+    # bytes.fromhex rejects non-hex digits in C; it tolerates spaces between
+    # byte pairs, so the decoded length is checked as well as the input's.
+    if len(signature) != FORWARDED_CLIENT_SIGNATURE_LENGTH:
+        return None
+    try:
+        decoded = bytes.fromhex(signature)
+    except ValueError:
+        return None
+    if len(decoded) * 2 != FORWARDED_CLIENT_SIGNATURE_LENGTH:
+        return None
+    return decoded
+
+
+@lru_cache(maxsize=1)
+def _keyed_proxy_signature_hmac(proxy_secret: str) -> hmac.HMAC:
+    # Keying HMAC hashes the padded secret twice; copying a keyed instance
+    # reuses that state for every signature.
+    return hmac.new(proxy_secret.encode("utf-8"), digestmod=hashlib.sha256)
+
+
 def _extract_forwarded_client_identifier(request: Request) -> str | None:
     proxy_secret = settings.rate_limit_proxy_secret.strip()
     if not proxy_secret:
@@ -140,42 +250,43 @@ def _extract_forwarded_client_identifier(request: Request) -> str | None:
         return None
 
     provided_signature = request.headers.get(FORWARDED_CLIENT_SIGNATURE_HEADER, "")
-    signature = provided_signature.strip().lower()
-    if not FORWARDED_CLIENT_SIGNATURE_PATTERN.fullmatch(signature):
+    signature = _decode_hex_signature(provided_signature.strip())
+    if signature is None:
         return None
 
-    expected_signature = hmac.new(
-        proxy_secret.encode("utf-8"),
-        normalized.encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
-    if not hmac.compare_digest(signature, expected_signature):
+    expected_signature = _keyed_proxy_signature_hmac(proxy_secret).copy()
+    expected_signature.update(normalized.encode("utf-8"))
+    if not hmac.compare_digest(signature, expected_signature.digest()):
         return None
 
     return f"proxy:{normalized}"
 
 
+@lru_cache(maxsize=4096)
+def _parse_remote_ip(host: str) -> IPv4Address | IPv6Address | None:
+    try:
+        return ip_address(host)
+    except ValueError:
+        return None
+
+
 def _remote_ip(request: Request) -> tuple[str | None, IPv4Address | IPv6Address | None]:
     host = request.client.host if request.client else None
     if not host:
         return None, None
-    try:
-        addr = ip_address(host)
-    except ValueError:
-        return host, None
-    return host, addr
+    return host, _parse_remote_ip(host)
 
 
 def _is_trusted_proxy(remote_ip: IPv4Address | IPv6Address | None) -> bool:
     if remote_ip is None:
         return False
-    return any(remote_ip in network for network in _trusted_proxy_networks())
-
+    starts, ends = _trusted_proxy_ranges()[remote_ip.version]
+    address = int(remote_ip)
+    position = bisect_right(starts, address) - 1
+    return position >= 0 and address <= ends[position]
 
-def default_client_identifier(request: Request) -> str:
-    """Resolve a stable client identifier for rate limiting."""
-    remote_host, remote_ip = _remote_ip(request)
 
+def _resolve_client_identifier(request: Request) -> str:
     # Signed forwarded identifiers are verified with HMAC and do not rely
     # on source IP trust assumptions.
     forwarded_identifier = _extract_forwarded_client_identifier(request)
@@ -186,6 +297,9 @@ def default_client_identifier(request: Request) -> str:
     if authenticated_identifier is not None:
         return authenticated_identifier
 
+    # The peer address is only parsed when neither identifier resolved.
+    remote_host, remote_ip = _remote_ip(request)
+
     # Only trust forwarded source IP headers from explicitly configured
     # proxy/load balancer networks.
     if _is_trusted_proxy(remote_ip):
@@ -199,8 +313,35 @@ def default_client_identifier(request: Request) -> str:
     return "anonymous"
 
 
+def default_client_identifier(request: Request) -> str:
+    """Resolve a stable client identifier for rate limiting.
+
+    The result is stored in the request scope under
+    ``CLIENT_IDENTIFIER_SCOPE_KEY`` so later consumers reuse it.
+    """
+    cached_identifier = request.scope.get(CLIENT_IDENTIFIER_SCOPE_KEY)
+    if isinstance(cached_identifier, str):
+        return cached_identifier
+    identifier = _resolve_client_identifier(request)
+    request.scope[CLIENT_IDENTIFIER_SCOPE_KEY] = identifier
+    return identifier
+
+
+@dataclass(slots=True)
+class _LocalWindowCount:
+    synced: int = 0
+    pending: int = 0
+
+
 class RateLimiter:
-    """Simple fixed-window rate limiter backed by Redis."""
+    """Simple fixed-window rate limiter backed by Redis.
+
+    With ``local_batch_size`` above 1, each process counts hits locally and
+    adds them to the shared Redis counter in batches, going to Redis on
+    every hit only once a client nears its limit. Up to
+    ``local_batch_size - 1`` hits per client, window and process can go
+    uncounted, so limits become approximate in exchange for fewer round-trips.
+    """
 
     def __init__(
         self,
@@ -208,11 +349,61 @@ class RateLimiter:
         limit: int,
         window_seconds: int,
         prefix: str = "rate-limit",
+        local_batch_size: int = 1,
     ) -> None:
         self.redis = redis_client
         self.limit = max(limit, 0)
         self.window_seconds = max(window_seconds, 0)
         self.prefix = prefix
+        self.local_batch_size = max(local_batch_size, 1)
+        self._script_sha: str | None = None
+        self._local_bucket: int | None = None
+        self._local_counts: dict[str, _LocalWindowCount] = {}
+
+    async def _incr_with_expiry(self, redis_key: str, increment: int = 1) -> int:
+        window_ms = str(self.window_seconds * 1000)
+        amount = str(increment)
+        if self._script_sha is None:
+            self._script_sha = await self.redis.script_load(FIXED_WINDOW_INCR_SCRIPT)
+        try:
+            return int(
+                await self.redis.evalsha(
+                    self._script_sha, 1, redis_key, window_ms, amount
+                )
+            )
+        except NoScriptError:
+            # The server's script cache was flushed (restart or SCRIPT FLUSH).
+            self._script_sha = await self.redis.script_load(FIXED_WINDOW_INCR_SCRIPT)
+            return int(
+                await self.redis.evalsha(
+                    self._script_sha, 1, redis_key, window_ms, amount
+                )
+            )
+
+    async def _allow_batched(self, redis_key: str, bucket: int) -> bool:
+        if bucket != self._local_bucket:
+            # Every key shares the window boundaries, so a new bucket retires
+            # all local counts at once.
+            self._local_bucket = bucket
+            self._local_counts = {}
+        local_count = self._local_counts.get(redis_key)
+        if local_count is None:
+            local_count = self._local_counts[redis_key] = _LocalWindowCount()
+        if local_count.synced > self.limit:
+            return False
+
+        local_count.pending += 1
+        if (
+            local_count.pending < self.local_batch_size
+            and local_count.synced + local_count.pending
+            <= self.limit - self.local_batch_size
+        ):
+            return True
+
+        increment, local_count.pending = local_count.pending, 0
+        count = await self._incr_with_expiry(redis_key, increment)
+        local_count.synced = max(local_count.synced, count)
+        return count <= self.limit
 
     async def allow(self, key: str) -> bool:
         """Return True when the request should be allowed, False if limited."""
@@ -222,9 +413,9 @@ class RateLimiter:
         bucket = int(time.time()) // self.window_seconds
         redis_key = f"{self.prefix}:{key}:{bucket}"
 
-        count = await self.redis.incr(redis_key)
-        if count == 1:
-            await self.redis.expire(redis_key, self.window_seconds)
+        if self.local_batch_size > 1:
+            return await self._allow_batched(redis_key, bucket)
+        count = await self._incr_with_expiry(redis_key)
         return count <= self.limit
 
 
@@ -245,6 +436,7 @@ def get_rate_limiter() -> RateLimiter:
             redis_client=get_redis_client(),
             limit=settings.rate_limit_requests,
             window_seconds=settings.rate_limit_window_seconds,
+            local_batch_size=settings.rate_limit_local_batch_size,
         )
     return _cached_rate_limiter
 
@@ -265,6 +457,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         exempt_paths: Iterable[str] | None = None,
         exempt_prefixes: Iterable[str] | None = None,
         client_identifier: Callable[[Request], str] | None = None,
+        overlap_safe_methods: bool = False,
     ) -> None:
         super().__init__(app)
         self._limiter: SupportsRateLimiter | None = None
@@ -272,19 +465,37 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         self.exempt_paths = set(exempt_paths or ())
         self.exempt_prefixes = tuple(exempt_prefixes or ())
         self.client_identifier = client_identifier or default_client_identifier
+        self.overlap_safe_methods = overlap_safe_methods
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            self.overlap_safe_methods
+            and scope["type"] == "http"
+            and scope["method"] in OVERLAPPABLE_METHODS
+        ):
+            request = Request(scope, receive)
+            limiter = self._resolve_limiter(request)
+            if limiter is not None and not self._is_exempt(request.url.path):
+                client_key = self.client_identifier(request) or "anonymous"
+                await _call_overlapped(
+                    self.app,
+                    scope,
+                    receive,
+                    send,
+                    _check_rate_limit(limiter, client_key, request.url.path),
+                )
+                return
+        await super().__call__(scope, receive, send)
 
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint):
         if request.scope["type"] != "http":
             return await call_next(request)
 
         path = request.url.path
-        if path in self.exempt_paths or any(
-            path.startswith(prefix) for prefix in self.exempt_prefixes
-        ):
+        if self._is_exempt(path):
             return await call_next(request)
 
-        override = getattr(request.app.state, "rate_limiter_override", None)
-        limiter = override if override is not None else self._get_limiter()
+        limiter = self._resolve_limiter(request)
 
         if limiter is None:
             if _is_auth_path(path):
@@ -295,23 +506,19 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             return await call_next(request)
 
         client_key = self.client_identifier(request) or "anonymous"
-        try:
-            is_allowed = await limiter.allow(client_key)
-        except Exception:  # pragma: no cover - defensive fallback for Redis outages
-            if _is_auth_path(path):
-                return JSONResponse(
-                    {"detail": "Service unavailable"},
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                )
-            return await call_next(request)
+        rejection = await _check_rate_limit(limiter, client_key, path)
+        if rejection is not None:
+            return rejection
+        return await call_next(request)
 
-        if not is_allowed:
-            return JSONResponse(
-                {"detail": "Too Many Requests"},
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            )
+    def _is_exempt(self, path: str) -> bool:
+        return path in self.exempt_paths or any(
+            path.startswith(prefix) for prefix in self.exempt_prefixes
+        )
 
-        return await call_next(request)
+    def _resolve_limiter(self, request: Request) -> SupportsRateLimiter | None:
+        override = getattr(request.app.state, "rate_limiter_override", None)
+        return override if override is not None else self._get_limiter()
 
     def _get_limiter(self) -> SupportsRateLimiter | None:
         if self._limiter is None:
@@ -322,5 +529,67 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         return self._limiter
 
 
+async def _call_overlapped(
+    app: ASGIApp,
+    scope: Scope,
+    receive: Receive,
+    send: Send,
+    limit_check_coro: Coroutine[Any, Any, JSONResponse | None],
+) -> None:
+    """Run the app alongside the limit check, cancelling it on rejection."""
+    # The Redis round-trip overlaps the handler. The app runs in its own task
+    # so a rejection can cancel it, and none of its response is sent before
+    # the check has passed.
+    limit_check = asyncio.create_task(limit_check_coro)
+
+    async def send_when_allowed(message: Message) -> None:
+        if await limit_check is None:
+            await send(message)
+
+    handler: asyncio.Future[None] = asyncio.ensure_future(
+        app(scope, receive, send_when_allowed)
+    )
+    try:
+        rejection = await limit_check
+        if rejection is None:
+            await handler
+            return
+        if not handler.done():
+            # A rejected read must not keep running its queries.
+            handler.cancel()
+            await asyncio.wait({handler})
+        if not handler.cancelled():
+            handler.exception()  # retrieved so it is not reported as unhandled
+    except BaseException:
+        limit_check.cancel()
+        handler.cancel()
+        raise
+    await rejection(scope, receive, send)
+
+
+async def _check_rate_limit(
+    limiter: SupportsRateLimiter,
+    client_key: str,
+    path: str,
+) -> JSONResponse | None:
+    """Return the rejection response for a limited request, or None to proceed."""
+    try:
+        is_allowed = await limiter.allow(client_key)
+    except Exception:  # pragma: no cover - defensive fallback for Redis outages
+        if _is_auth_path(path):
+            return JSONResponse(
+                {"detail": "Service unavailable"},
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+        return None
+
+    if not is_allowed:
+        return JSONResponse(
+            {"detail": "Too Many Requests"},
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        )
+    return None
+
+
 def _is_auth_path(path: str) -> bool:
     return path == AUTH_PATH_PREFIX or path.startswith(f"{AUTH_PATH_PREFIX}/")
@@ -5,11 +5,40 @@ from __future__ import annotations
 from datetime import timedelta
 from functools import lru_cache
 
+import urllib3
 from minio import Minio
 from minio.error import S3Error
 
 from core import settings
 
+# Idle connections kept per MinIO host. The default client keeps 10, which
+# parallel seed uploads outgrow and then re-handshake on every request.
+MINIO_HTTP_POOL_MAXSIZE = 64
+
+# MinIO's own defaults for its client, restated because a custom pool
+# replaces the one it would build.
+MINIO_HTTP_TIMEOUT_SECONDS = 300
+MINIO_HTTP_RETRIES = 5
+MINIO_HTTP_RETRY_BACKOFF_FACTOR = 0.2
+MINIO_HTTP_RETRY_STATUSES = (500, 502, 503, 504)
+
+
+def _build_minio_http_client() -> urllib3.PoolManager:
+    """Return the pooled HTTP client shared by every MinIO request."""
+    return urllib3.PoolManager(
+        timeout=urllib3.Timeout(
+            connect=MINIO_HTTP_TIMEOUT_SECONDS,
+            read=MINIO_HTTP_TIMEOUT_SECONDS,
+        ),
+        maxsize=MINIO_HTTP_POOL_MAXSIZE,
+        block=True,
+        retries=urllib3.Retry(
+            total=MINIO_HTTP_RETRIES,
+            backoff_factor=MINIO_HTTP_RETRY_BACKOFF_FACTOR,
+            status_forcelist=MINIO_HTTP_RETRY_STATUSES,
+        ),
+    )
+
 
 @lru_cache
 def get_minio_client() -> Minio:
@@ -25,6 +54,7 @@ def get_minio_client() -> Minio:
         access_key=access_key,
         secret_key=secret_key,
         secure=secure,
+        http_client=_build_minio_http_client(),
     )
 
 
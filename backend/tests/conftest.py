@@ -17,6 +17,10 @@ from api.deps import get_db
 from app import create_app
 from core.config import settings
 from services import RateLimiter, set_rate_limiter
+from services.notifications.stream_cache import (
+    NotificationStreamCache,
+    set_notification_stream_cache,
+)
 
 
 def _run_alembic_migrations(database_url: str) -> None:
@@ -106,17 +110,38 @@ async def db_session(session_maker) -> AsyncIterator[AsyncSession]:
         yield session
 
 
+class _InMemoryStreamCacheRedis:
+    async def mget(self, keys: list[str]) -> list[bytes | None]:  # pragma: no cover
+        return [None] * len(keys)
+
+    async def set(
+        self, name: str, value: bytes, ex: int | None = None
+    ) -> None:  # pragma: no cover
+        return None
+
+
 class _InMemoryRedis:
     def __init__(self) -> None:
         self.data: dict[str, int] = {}
 
-    async def incr(self, key: str) -> int:
-        value = self.data.get(key, 0) + 1
+    async def script_load(self, script: str) -> str:
+        return "in-memory-fixed-window"
+
+    async def evalsha(self, sha: str, numkeys: int, *keys_and_args: str) -> int:
+        key, _window_ms, increment = keys_and_args
+        value = self.data.get(key, 0) + int(increment)
         self.data[key] = value
         return value
 
-    async def expire(self, key: str, ttl: int) -> None:  # pragma: no cover - noop
-        return None
+
+@pytest.fixture(autouse=True)
+def _notification_stream_cache_stub() -> Iterator[None]:
+    # Tests write rows directly, bypassing the invalidation hooks.
+    set_notification_stream_cache(
+        NotificationStreamCache(_InMemoryStreamCacheRedis(), ttl_seconds=0)
+    )
+    yield
+    set_notification_stream_cache(None)
 
 
 @pytest.fixture(autouse=True)
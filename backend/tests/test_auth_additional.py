@@ -7,10 +7,13 @@ from datetime import datetime, timedelta, timezone
 import pytest
 from fastapi import Request, Response
 from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import IntegrityError
 
 from api.v1 import auth
+from core import settings
 from models import RefreshToken, User
+from services.auth import clear_token_cookies, set_token_cookies, token_store
 
 
 def _make_request_with_cookie(name: str, value: str) -> Request:
@@ -82,6 +85,27 @@ async def test_store_refresh_token_persists_record(db_session, monkeypatch):
     assert len(tokens) == 1
 
 
+def test_postgres_refresh_token_insert_trims_surplus_in_same_statement():
+    now = datetime.now(timezone.utc)
+    stmt = token_store._build_trimming_refresh_token_insert(
+        "user-pg",
+        "hash-pg",
+        issued_at=now,
+        expires_at=now + timedelta(days=1),
+        max_active_tokens=3,
+    )
+
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    sql = " ".join(str(compiled).split())
+
+    assert sql.startswith("WITH trimmed_refresh_tokens AS (DELETE FROM refresh_tokens")
+    assert "RETURNING refresh_tokens.id" in sql
+    assert "INSERT INTO refresh_tokens" in sql
+    assert "LIMIT" in sql
+    # One slot is left for the row being inserted.
+    assert 2 in compiled.params.values()
+
+
 def test_ensure_aware_adds_timezone():
     naive = datetime(2025, 1, 1, 12, 0, 0)
     aware = auth._ensure_aware(naive)
@@ -189,6 +213,33 @@ async def test_login_function_sets_cookies(db_session):
     assert any(header.startswith(f"{auth.ACCESS_COOKIE}=") for header in set_cookie_headers)
 
 
+def test_token_cookies_share_attributes_and_follow_ttl_settings(monkeypatch):
+    monkeypatch.setattr(settings, "access_token_expire_minutes", 7)
+    monkeypatch.setattr(settings, "refresh_token_expire_minutes", 90)
+
+    response = Response()
+    set_token_cookies(response, "access", "refresh")
+    access_header, refresh_header = response.headers.getlist("set-cookie")
+
+    assert access_header.startswith(f"{auth.ACCESS_COOKIE}=access;")
+    assert "Max-Age=420" in access_header
+    assert refresh_header.startswith(f"{auth.REFRESH_COOKIE}=refresh;")
+    assert "Max-Age=5400" in refresh_header
+    for header in (access_header, refresh_header):
+        assert "HttpOnly" in header
+        assert "Path=/" in header
+        assert "SameSite=lax" in header
+
+    cleared = Response()
+    clear_token_cookies(cleared)
+    cleared_headers = cleared.headers.getlist("set-cookie")
+    assert [header.split("=", 1)[0] for header in cleared_headers] == [
+        auth.ACCESS_COOKIE,
+        auth.REFRESH_COOKIE,
+    ]
+    assert all("Max-Age=0" in header for header in cleared_headers)
+
+
 @pytest.mark.asyncio
 async def test_refresh_flow_updates_token(db_session, monkeypatch):
     user = User(
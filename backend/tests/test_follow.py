@@ -361,6 +361,59 @@ async def test_private_follow_request_can_be_approved(async_client: AsyncClient)
     assert status_response.json()["is_requested"] is False
 
 
+@pytest.mark.asyncio
+async def test_resolving_missing_follow_request_returns_not_found(
+    async_client: AsyncClient,
+    db_session: AsyncSession,
+):
+    owner = make_user_payload("owner")
+    requester = make_user_payload("requester")
+
+    await async_client.post("/api/v1/auth/register", json=owner)
+    await async_client.post("/api/v1/auth/register", json=requester)
+
+    await async_client.post(
+        "/api/v1/auth/login",
+        json={"username": owner["username"], "password": owner["password"]},
+    )
+    await async_client.patch(
+        "/api/v1/me",
+        data={"is_private": "true"},
+    )
+    await async_client.post("/api/v1/auth/logout")
+
+    await async_client.post(
+        "/api/v1/auth/login",
+        json={"username": requester["username"], "password": requester["password"]},
+    )
+    await async_client.post(f"/api/v1/users/{owner['username']}/follow")
+    await async_client.post("/api/v1/auth/logout")
+
+    await async_client.post(
+        "/api/v1/auth/login",
+        json={"username": owner["username"], "password": owner["password"]},
+    )
+    decline_response = await async_client.delete(
+        f"/api/v1/users/{owner['username']}/follow-requests/{requester['username']}"
+    )
+    assert decline_response.status_code == 200
+    assert decline_response.json()["detail"] == "Follow request declined"
+
+    for response in (
+        await async_client.delete(
+            f"/api/v1/users/{owner['username']}/follow-requests/{requester['username']}"
+        ),
+        await async_client.post(
+            f"/api/v1/users/{owner['username']}/follow-requests/{requester['username']}/approve"
+        ),
+    ):
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Follow request not found"
+
+    follow_rows = (await db_session.execute(select(Follow))).scalars().all()
+    assert follow_rows == []
+
+
 @pytest.mark.asyncio
 async def test_block_clears_follow_edges_and_prevents_follow(
     async_client: AsyncClient,
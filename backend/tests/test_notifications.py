@@ -13,6 +13,10 @@ from sqlalchemy.sql import ColumnElement
 
 from models import Comment, DismissedNotification, FollowRequest, Like, Post, User
 from services.notifications import dismissals as notification_dismissals
+from services.notifications.stream_cache import (
+    NotificationStreamCache,
+    set_notification_stream_cache,
+)
 
 
 def make_user_payload(prefix: str) -> dict[str, str]:
@@ -342,12 +346,14 @@ async def test_dismiss_notification_rejects_malformed_like_and_follow_identifier
 
 
 @pytest.mark.asyncio
-async def test_dismissed_notifications_are_capped_per_user(
+async def test_dismissals_leave_pruning_to_the_maintenance_sweep(
     async_client: AsyncClient,
+    db_session: AsyncSession,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     payload = make_user_payload("notif_cap")
     await register_and_login(async_client, payload)
+    owner = await get_user_by_username(db_session, payload["username"])
 
     cap = 5
     monkeypatch.setattr(
@@ -364,50 +370,26 @@ async def test_dismissed_notifications_are_capped_per_user(
         )
         assert response.status_code == 200
 
-    listed = await async_client.get("/api/v1/notifications/dismissed")
+    listed = await async_client.get("/api/v1/notifications/dismissed?limit=30")
     assert listed.status_code == 200
-    listed_ids = listed.json()["notification_ids"]
-    assert len(listed_ids) == cap
-    assert set(listed_ids) == set(posted_ids[-cap:])
-
-
-@pytest.mark.asyncio
-async def test_dismissed_notifications_pruning_handles_large_backlog_without_errors(
-    async_client: AsyncClient,
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    payload = make_user_payload("notif_backlog")
-    await register_and_login(async_client, payload)
+    assert set(listed.json()["notification_ids"]) == set(posted_ids)
 
-    cap = 20
-    monkeypatch.setattr(
-        notification_dismissals,
-        "MAX_DISMISSED_NOTIFICATIONS",
-        cap,
-    )
-    monkeypatch.setattr(
-        notification_dismissals,
-        "PRUNE_BATCH_SIZE",
-        7,
+    deleted_by_user = await notification_dismissals.prune_dismissed_notifications_for_users(
+        db_session,
+        [owner.id],
+        keep_limit=cap,
     )
+    assert deleted_by_user == {owner.id: 3}
 
-    for idx in range(90):
-        response = await async_client.post(
-            "/api/v1/notifications/dismissed",
-            json={"notification_id": f"comment-2-{idx + 1}"},
-        )
-        assert response.status_code == 200
-
-    listed = await async_client.get("/api/v1/notifications/dismissed")
+    listed = await async_client.get("/api/v1/notifications/dismissed?limit=30")
     assert listed.status_code == 200
     listed_ids = listed.json()["notification_ids"]
     assert len(listed_ids) == cap
-    expected_ids = {f"comment-2-{idx + 1}" for idx in range(90 - cap, 90)}
-    assert set(listed_ids) == expected_ids
+    assert set(listed_ids) == set(posted_ids[-cap:])
 
 
 @pytest.mark.asyncio
-async def test_dismissed_notifications_request_path_pruning_is_bounded(
+async def test_dismissal_request_path_runs_no_prune_queries(
     async_client: AsyncClient,
     db_session: AsyncSession,
     monkeypatch: pytest.MonkeyPatch,
@@ -416,17 +398,10 @@ async def test_dismissed_notifications_request_path_pruning_is_bounded(
     await register_and_login(async_client, payload)
     owner = await get_user_by_username(db_session, payload["username"])
 
-    cap = 5
-    prune_batch_size = 3
     monkeypatch.setattr(
         notification_dismissals,
         "MAX_DISMISSED_NOTIFICATIONS",
-        cap,
-    )
-    monkeypatch.setattr(
-        notification_dismissals,
-        "PRUNE_BATCH_SIZE",
-        prune_batch_size,
+        5,
     )
 
     base_time = datetime(2026, 2, 14, 20, 0, 0, tzinfo=timezone.utc)
@@ -442,7 +417,7 @@ async def test_dismissed_notifications_request_path_pruning_is_bounded(
 
     bind = db_session.bind
     assert isinstance(bind, AsyncEngine)
-    bounded_query_count = 0
+    dismissal_query_count = 0
 
     def _before_cursor_execute(
         conn: object,
@@ -453,10 +428,10 @@ async def test_dismissed_notifications_request_path_pruning_is_bounded(
         executemany: bool,
     ) -> None:
         del conn, cursor, parameters, context, executemany
-        nonlocal bounded_query_count
+        nonlocal dismissal_query_count
         normalized = statement.lstrip().lower()
         if "dismissed_notifications" in normalized:
-            bounded_query_count += 1
+            dismissal_query_count += 1
 
     event.listen(bind.sync_engine, "before_cursor_execute", _before_cursor_execute)
     try:
@@ -468,7 +443,7 @@ async def test_dismissed_notifications_request_path_pruning_is_bounded(
         event.remove(bind.sync_engine, "before_cursor_execute", _before_cursor_execute)
 
     assert response.status_code == 200
-    assert bounded_query_count <= 8
+    assert dismissal_query_count == 1
 
     count_result = await db_session.execute(
         select(
@@ -481,7 +456,7 @@ async def test_dismissed_notifications_request_path_pruning_is_bounded(
         )
     )
     total = int(count_result.scalar_one() or 0)
-    assert total == 18
+    assert total == 21
 
 
 @pytest.mark.asyncio
@@ -504,13 +479,12 @@ async def test_maintenance_prune_reduces_user_backlog_to_cap(
         )
     await db_session.commit()
 
-    deleted_rows = await notification_dismissals.prune_dismissed_notifications_for_user(
+    deleted_by_user = await notification_dismissals.prune_dismissed_notifications_for_users(
         db_session,
-        owner.id,
+        [owner.id],
         keep_limit=7,
-        batch_size=4,
     )
-    assert deleted_rows == 18
+    assert deleted_by_user == {owner.id: 18}
 
     listed = await async_client.get("/api/v1/notifications/dismissed?limit=30")
     assert listed.status_code == 200
@@ -540,14 +514,13 @@ async def test_maintenance_prune_respects_max_deleted_budget(
         )
     await db_session.commit()
 
-    deleted_rows = await notification_dismissals.prune_dismissed_notifications_for_user(
+    deleted_by_user = await notification_dismissals.prune_dismissed_notifications_for_users(
         db_session,
-        owner.id,
+        [owner.id],
         keep_limit=7,
-        batch_size=10,
         max_deleted=5,
     )
-    assert deleted_rows == 5
+    assert deleted_by_user == {owner.id: 5}
 
     count_result = await db_session.execute(
         select(
@@ -561,6 +534,100 @@ async def test_maintenance_prune_respects_max_deleted_budget(
     assert total == 20
 
 
+@pytest.mark.asyncio
+async def test_maintenance_prune_for_users_trims_each_backlog_in_one_pass(
+    async_client: AsyncClient,
+    db_session: AsyncSession,
+) -> None:
+    first_payload = make_user_payload("notif_multi_a")
+    second_payload = make_user_payload("notif_multi_b")
+    await register_and_login(async_client, first_payload)
+    await register_and_login(async_client, second_payload)
+    first = await get_user_by_username(db_session, first_payload["username"])
+    second = await get_user_by_username(db_session, second_payload["username"])
+
+    base_time = datetime(2026, 2, 14, 22, 0, 0, tzinfo=timezone.utc)
+    for owner, backlog in ((first, 12), (second, 9)):
+        for idx in range(backlog):
+            db_session.add(
+                DismissedNotification(
+                    user_id=owner.id,
+                    notification_id=f"comment-6-{idx + 1}",
+                    dismissed_at=base_time + timedelta(seconds=idx),
+                )
+            )
+    await db_session.commit()
+
+    bind = db_session.bind
+    assert isinstance(bind, AsyncEngine)
+    prune_statements: list[str] = []
+
+    def _before_cursor_execute(
+        conn: object,
+        cursor: object,
+        statement: str,
+        parameters: object,
+        context: object,
+        executemany: bool,
+    ) -> None:
+        del conn, cursor, parameters, context, executemany
+        if "dismissed_notifications" in statement.lower():
+            prune_statements.append(statement)
+
+    event.listen(bind.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        deleted_by_user = await notification_dismissals.prune_dismissed_notifications_for_users(
+            db_session,
+            [first.id, second.id],
+            keep_limit=4,
+        )
+    finally:
+        event.remove(bind.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    assert deleted_by_user == {first.id: 8, second.id: 5}
+    assert len(prune_statements) == 1
+
+    remaining_result = await db_session.execute(
+        select(
+            cast(ColumnElement[str], DismissedNotification.user_id),
+            cast(ColumnElement[str], DismissedNotification.notification_id),
+        )
+    )
+    remaining: dict[str, set[str]] = {}
+    for user_id, notification_id in remaining_result.all():
+        remaining.setdefault(user_id, set()).add(notification_id)
+    assert remaining[first.id] == {f"comment-6-{idx + 1}" for idx in range(8, 12)}
+    assert remaining[second.id] == {f"comment-6-{idx + 1}" for idx in range(5, 9)}
+
+
+@pytest.mark.asyncio
+async def test_maintenance_prune_for_users_respects_max_deleted_budget(
+    async_client: AsyncClient,
+    db_session: AsyncSession,
+) -> None:
+    payload = make_user_payload("notif_multi_budget")
+    await register_and_login(async_client, payload)
+    owner = await get_user_by_username(db_session, payload["username"])
+
+    base_time = datetime(2026, 2, 14, 22, 30, 0, tzinfo=timezone.utc)
+    for idx in range(25):
+        db_session.add(
+            DismissedNotification(
+                user_id=owner.id,
+                notification_id=f"comment-7-{idx + 1}",
+                dismissed_at=base_time + timedelta(seconds=idx),
+            )
+        )
+    await db_session.commit()
+
+    deleted_by_user = await notification_dismissals.prune_dismissed_notifications_for_users(
+        db_session,
+        [owner.id],
+        keep_limit=7,
+        max_deleted=6,
+    )
+    assert deleted_by_user == {owner.id: 6}
+
+
 @pytest.mark.asyncio
 async def test_notification_stream_requires_auth(async_client: AsyncClient) -> None:
     response = await async_client.get("/api/v1/notifications/stream")
@@ -1227,3 +1294,218 @@ async def test_legacy_like_dismissal_id_remains_effective_for_new_like_ids(
         item["id"] == f"like-{post.id}-{liker.id}" and item["kind"] == "like"
         for item in visible_stream.json()["notifications"]
     )
+
+
+class _DictStreamCacheRedis:
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, name: str, value: bytes, ex: int | None = None) -> None:
+        del ex
+        self.data[name] = value
+
+
+@pytest.mark.asyncio
+async def test_notification_stream_cache_serves_hits_until_invalidated(
+    async_client: AsyncClient,
+    db_session: AsyncSession,
+) -> None:
+    commenter_payload = make_user_payload("cache_commenter")
+    owner_payload = make_user_payload("cache_owner")
+    await register_and_login(async_client, commenter_payload)
+    await async_client.post("/api/v1/auth/logout")
+    await register_and_login(async_client, owner_payload)
+    owner = await get_user_by_username(db_session, owner_payload["username"])
+    commenter = await get_user_by_username(db_session, commenter_payload["username"])
+
+    set_notification_stream_cache(
+        NotificationStreamCache(_DictStreamCacheRedis(), ttl_seconds=60)
+    )
+
+    empty_stream = await async_client.get("/api/v1/notifications/stream")
+    assert empty_stream.status_code == 200
+    assert empty_stream.json()["notifications"] == []
+
+    post = Post(
+        author_id=owner.id,
+        image_key=f"posts/{owner.id}/cache.jpg",
+        caption="cache",
+    )
+    db_session.add(post)
+    await db_session.commit()
+    await db_session.refresh(post)
+    if post.id is None:  # pragma: no cover - defensive
+        raise ValueError("Post record missing identifier")
+    comment = Comment(post_id=post.id, author_id=commenter.id, text="Salut")
+    db_session.add(comment)
+    await db_session.commit()
+    await db_session.refresh(comment)
+
+    cached_stream = await async_client.get("/api/v1/notifications/stream")
+    assert cached_stream.status_code == 200
+    assert cached_stream.json() == empty_stream.json()
+
+    notification_id = f"comment-{post.id}-{comment.id}"
+    dismiss_response = await async_client.post(
+        "/api/v1/notifications/dismissed",
+        json={"notification_id": notification_id},
+    )
+    assert dismiss_response.status_code == 200
+    # Drop the dismissal row behind the API so the next read shows whether
+    # the dismissal invalidated the cached (empty) stream.
+    await db_session.execute(
+        delete(DismissedNotification).where(
+            _eq(DismissedNotification.user_id, owner.id)
+        )
+    )
+    await db_session.commit()
+
+    fresh_stream = await async_client.get("/api/v1/notifications/stream")
+    assert fresh_stream.status_code == 200
+    assert [item["id"] for item in fresh_stream.json()["notifications"]] == [
+        notification_id
+    ]
+
+
+@pytest.mark.asyncio
+async def test_notification_stream_cache_is_invalidated_by_interactions(
+    async_client: AsyncClient,
+    db_session: AsyncSession,
+) -> None:
+    commenter_payload = make_user_payload("cache_actor")
+    owner_payload = make_user_payload("cache_target")
+    await register_and_login(async_client, commenter_payload)
+    await async_client.post("/api/v1/auth/logout")
+    await register_and_login(async_client, owner_payload)
+    owner = await get_user_by_username(db_session, owner_payload["username"])
+
+    set_notification_stream_cache(
+        NotificationStreamCache(_DictStreamCacheRedis(), ttl_seconds=60)
+    )
+
+    post = Post(
+        author_id=owner.id,
+        image_key=f"posts/{owner.id}/cache-interactions.jpg",
+        caption="cache",
+    )
+    db_session.add(post)
+    await db_session.commit()
+    await db_session.refresh(post)
+
+    empty_stream = await async_client.get("/api/v1/notifications/stream")
+    assert empty_stream.status_code == 200
+    assert empty_stream.json()["notifications"] == []
+
+    await async_client.post("/api/v1/auth/logout")
+    await login(async_client, commenter_payload)
+    follow_response = await async_client.post(
+        f"/api/v1/users/{owner_payload['username']}/follow"
+    )
+    assert follow_response.status_code == 200
+    comment_response = await async_client.post(
+        f"/api/v1/posts/{post.id}/comments",
+        json={"text": "Salut"},
+    )
+    assert comment_response.status_code == 201
+    like_response = await async_client.post(f"/api/v1/posts/{post.id}/likes")
+    assert like_response.status_code == 200
+
+    await async_client.post("/api/v1/auth/logout")
+    await login(async_client, owner_payload)
+    fresh_stream = await async_client.get("/api/v1/notifications/stream")
+    assert fresh_stream.status_code == 200
+    assert sorted(item["kind"] for item in fresh_stream.json()["notifications"]) == [
+        "comment",
+        "like",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_notification_stream_cache_is_invalidated_by_unblock(
+    async_client: AsyncClient,
+    db_session: AsyncSession,
+) -> None:
+    actor_payload = make_user_payload("cache_unblocked")
+    owner_payload = make_user_payload("cache_unblocker")
+    await register_and_login(async_client, actor_payload)
+    await async_client.post("/api/v1/auth/logout")
+    await register_and_login(async_client, owner_payload)
+    owner = await get_user_by_username(db_session, owner_payload["username"])
+    actor = await get_user_by_username(db_session, actor_payload["username"])
+
+    set_notification_stream_cache(
+        NotificationStreamCache(_DictStreamCacheRedis(), ttl_seconds=60)
+    )
+
+    post = Post(
+        author_id=owner.id,
+        image_key=f"posts/{owner.id}/cache-unblock.jpg",
+        caption="cache",
+    )
+    db_session.add(post)
+    await db_session.commit()
+    await db_session.refresh(post)
+    if post.id is None:  # pragma: no cover - defensive
+        raise ValueError("Post record missing identifier")
+    comment = Comment(post_id=post.id, author_id=actor.id, text="Salut")
+    db_session.add(comment)
+    await db_session.commit()
+    await db_session.refresh(comment)
+
+    block_response = await async_client.post(
+        f"/api/v1/users/{actor_payload['username']}/block"
+    )
+    assert block_response.status_code == 200
+    blocked_stream = await async_client.get("/api/v1/notifications/stream")
+    assert blocked_stream.status_code == 200
+    assert blocked_stream.json()["notifications"] == []
+
+    unblock_response = await async_client.delete(
+        f"/api/v1/users/{actor_payload['username']}/block"
+    )
+    assert unblock_response.status_code == 200
+    fresh_stream = await async_client.get("/api/v1/notifications/stream")
+    assert fresh_stream.status_code == 200
+    assert [item["id"] for item in fresh_stream.json()["notifications"]] == [
+        f"comment-{post.id}-{comment.id}"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_notification_stream_cache_is_invalidated_when_account_goes_public(
+    async_client: AsyncClient,
+) -> None:
+    requester_payload = make_user_payload("cache_requester")
+    owner_payload = make_user_payload("cache_private")
+    await register_and_login(async_client, owner_payload)
+    private_response = await async_client.patch(
+        "/api/v1/me", data={"is_private": "true"}
+    )
+    assert private_response.status_code == 200
+    await async_client.post("/api/v1/auth/logout")
+    await register_and_login(async_client, requester_payload)
+    request_response = await async_client.post(
+        f"/api/v1/users/{owner_payload['username']}/follow"
+    )
+    assert request_response.status_code == 200
+    await async_client.post("/api/v1/auth/logout")
+    await login(async_client, owner_payload)
+
+    set_notification_stream_cache(
+        NotificationStreamCache(_DictStreamCacheRedis(), ttl_seconds=60)
+    )
+
+    pending_stream = await async_client.get("/api/v1/notifications/stream")
+    assert pending_stream.status_code == 200
+    assert len(pending_stream.json()["follow_requests"]) == 1
+
+    public_response = await async_client.patch(
+        "/api/v1/me", data={"is_private": "false"}
+    )
+    assert public_response.status_code == 200
+    fresh_stream = await async_client.get("/api/v1/notifications/stream")
+    assert fresh_stream.status_code == 200
+    assert fresh_stream.json()["follow_requests"] == []
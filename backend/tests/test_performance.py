@@ -59,6 +59,22 @@ async def test_saved_posts_table_has_user_created_at_index(db_session: AsyncSess
     )
 
 
+@pytest.mark.asyncio
+async def test_follow_requests_table_has_target_requester_index(
+    db_session: AsyncSession,
+) -> None:
+    bind = db_session.bind
+    assert isinstance(bind, AsyncEngine)
+    async with bind.connect() as conn:
+        indexes = await conn.run_sync(
+            lambda sync_conn: inspect(sync_conn).get_indexes("follow_requests")
+        )
+    assert any(
+        index["name"] == "ix_follow_requests_target_requester"
+        for index in indexes
+    )
+
+
 @pytest.mark.asyncio
 async def test_feed_query_is_fast(async_client: AsyncClient, db_session: AsyncSession) -> None:
     viewer_payload = {
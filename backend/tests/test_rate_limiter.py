@@ -2,32 +2,70 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import hmac
 from collections.abc import Generator
+from ipaddress import ip_address
 
 import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
+from redis.exceptions import NoScriptError
 from starlette.requests import Request
 
 from core import create_access_token, create_refresh_token
 from core.config import settings
-from services import RateLimiter, set_rate_limiter
-from services.rate_limiter import RateLimitMiddleware, default_client_identifier
+from services import RateLimiter, rate_limiter, set_rate_limiter
+from services.rate_limiter import (
+    CLIENT_IDENTIFIER_SCOPE_KEY,
+    RateLimitMiddleware,
+    _is_trusted_proxy,
+    _trusted_proxy_networks,
+    _trusted_proxy_ranges,
+    default_client_identifier,
+)
 
 
 class InMemoryRedis:
     def __init__(self) -> None:
         self.data: dict[str, int] = {}
 
-    async def incr(self, key: str) -> int:  # pragma: no cover - simple helper
-        value = self.data.get(key, 0) + 1
+    async def script_load(self, script: str) -> str:  # pragma: no cover - simple helper
+        return "in-memory-fixed-window"
+
+    async def evalsha(self, sha: str, numkeys: int, *keys_and_args: str) -> int:  # pragma: no cover
+        key, _window_ms, increment = keys_and_args
+        value = self.data.get(key, 0) + int(increment)
         self.data[key] = value
         return value
 
-    async def expire(self, key: str, ttl: int) -> None:  # pragma: no cover - noop
-        return None
+
+class FlushedScriptCacheRedis(InMemoryRedis):
+    def __init__(self) -> None:
+        super().__init__()
+        self.loaded_scripts = 0
+        self.script_cache_flushed = True
+
+    async def script_load(self, script: str) -> str:
+        self.loaded_scripts += 1
+        self.script_cache_flushed = False
+        return await super().script_load(script)
+
+    async def evalsha(self, sha: str, numkeys: int, *keys_and_args: str) -> int:
+        if self.script_cache_flushed:
+            raise NoScriptError("No matching script")
+        return await super().evalsha(sha, numkeys, *keys_and_args)
+
+
+class CountingRedis(InMemoryRedis):
+    def __init__(self) -> None:
+        super().__init__()
+        self.round_trips = 0
+
+    async def evalsha(self, sha: str, numkeys: int, *keys_and_args: str) -> int:
+        self.round_trips += 1
+        return await super().evalsha(sha, numkeys, *keys_and_args)
 
 
 class FailingLimiter:
@@ -106,6 +144,42 @@ def test_default_client_identifier_uses_bearer_token_when_no_cookie() -> None:
     assert default_client_identifier(request) == "user:user-bearer"
 
 
+def test_default_client_identifier_is_stored_on_the_request_scope() -> None:
+    access_token = create_access_token("user-scoped")
+    request = _build_request(cookie_header=f"access_token={access_token}")
+
+    assert default_client_identifier(request) == "user:user-scoped"
+    assert request.scope[CLIENT_IDENTIFIER_SCOPE_KEY] == "user:user-scoped"
+
+    request.scope[CLIENT_IDENTIFIER_SCOPE_KEY] = "proxy:precomputed"
+    assert default_client_identifier(request) == "proxy:precomputed"
+
+
+def test_default_client_identifier_reuses_verified_token_subjects(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    access_token = create_access_token("user-cached")
+    decoded_tokens: list[str] = []
+    original_decode_token = rate_limiter.decode_token
+
+    def _counting_decode_token(token: str) -> dict[str, object]:
+        decoded_tokens.append(token)
+        return original_decode_token(token)
+
+    monkeypatch.setattr(rate_limiter, "decode_token", _counting_decode_token)
+    rate_limiter._token_subject_cache.clear()
+    try:
+        for _ in range(3):
+            request = _build_request(authorization=f"Bearer {access_token}")
+            assert default_client_identifier(request) == "user:user-cached"
+        request = _build_request(authorization="Bearer not-a-jwt")
+        assert default_client_identifier(request) == "10.0.0.12"
+    finally:
+        rate_limiter._token_subject_cache.clear()
+
+    assert decoded_tokens == [access_token]
+
+
 def test_default_client_identifier_uses_forwarded_proxy_key_for_trusted_proxies() -> None:
     client_key = "ABCDEFGHIJKLMNOP"
     request = _build_request(client_host="127.0.0.1")
@@ -130,6 +204,29 @@ def test_default_client_identifier_uses_signed_proxy_key_without_trusted_proxy()
     assert default_client_identifier(request) == f"proxy:{client_key}"
 
 
+def test_trusted_proxy_lookup_matches_overlapping_networks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        settings,
+        "rate_limit_trusted_proxies",
+        ["10.0.0.0/8", "10.1.0.0/16", "192.168.1.0/24", "192.168.2.0/24", "fd00::/8"],
+    )
+    _trusted_proxy_networks.cache_clear()
+    _trusted_proxy_ranges.cache_clear()
+    try:
+        assert _is_trusted_proxy(ip_address("10.1.2.3"))
+        assert _is_trusted_proxy(ip_address("10.255.255.255"))
+        assert _is_trusted_proxy(ip_address("192.168.2.0"))
+        assert _is_trusted_proxy(ip_address("fd12::1"))
+        assert not _is_trusted_proxy(ip_address("9.255.255.255"))
+        assert not _is_trusted_proxy(ip_address("192.168.3.1"))
+        assert not _is_trusted_proxy(ip_address("::ffff:10.1.2.3"))
+    finally:
+        _trusted_proxy_networks.cache_clear()
+        _trusted_proxy_ranges.cache_clear()
+
+
 def test_default_client_identifier_ignores_forwarded_proxy_key_without_signature() -> None:
     request = _build_request(client_host="10.0.0.12")
     request.scope["path"] = "/api/v1/auth/login"
@@ -163,6 +260,32 @@ async def test_rate_limiter_blocks_after_threshold(
         set_rate_limiter(None)
 
 
+@pytest.mark.asyncio
+async def test_rate_limiter_reloads_script_after_cache_flush() -> None:
+    redis_client = FlushedScriptCacheRedis()
+    limiter = RateLimiter(redis_client, limit=2, window_seconds=60)
+
+    assert await limiter.allow("client") is True
+    redis_client.script_cache_flushed = True
+    assert await limiter.allow("client") is True
+    assert await limiter.allow("client") is False
+    assert redis_client.loaded_scripts == 2
+
+
+@pytest.mark.asyncio
+async def test_batched_rate_limiter_counts_locally_until_near_the_limit() -> None:
+    redis_client = CountingRedis()
+    limiter = RateLimiter(redis_client, limit=10, window_seconds=60, local_batch_size=4)
+
+    decisions = [await limiter.allow("client") for _ in range(15)]
+
+    assert decisions == [True] * 10 + [False] * 5
+    # One batched INCRBY for the first four hits, then one per hit near the
+    # limit; hits after the limit is known to be exceeded stay local.
+    assert redis_client.round_trips == 6
+    assert list(redis_client.data.values()) == [11]
+
+
 @pytest.mark.asyncio
 async def test_rate_limiter_can_be_disabled(async_client: AsyncClient, app: FastAPI) -> None:
     limiter = RateLimiter(InMemoryRedis(), limit=0, window_seconds=60)
@@ -331,3 +454,41 @@ async def test_auth_login_rate_limit_uses_forwarded_client_key(
             del app.state.rate_limiter_override
 
     set_rate_limiter(None)
+
+
+@pytest.mark.asyncio
+async def test_overlapped_safe_methods_still_enforce_the_limit() -> None:
+    api = FastAPI()
+    limiter = RateLimiter(InMemoryRedis(), limit=1, window_seconds=60)
+    api.add_middleware(
+        RateLimitMiddleware,
+        limiter_factory=lambda: limiter,
+        overlap_safe_methods=True,
+    )
+    handled: list[str] = []
+
+    @api.get("/api/v1/health")
+    async def health_route() -> dict[str, str]:
+        # Stands in for query work that outlasts the limit check.
+        await asyncio.sleep(0.05)
+        handled.append("get")
+        return {"status": "ok"}
+
+    @api.post("/api/v1/health")
+    async def health_post_route() -> dict[str, str]:
+        handled.append("post")
+        return {"status": "ok"}
+
+    transport = ASGITransport(app=api)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        first = await client.get("/api/v1/health")
+        second = await client.get("/api/v1/health")
+        third = await client.post("/api/v1/health")
+
+    assert first.status_code == 200
+    assert second.status_code == 429
+    assert second.json()["detail"] == "Too Many Requests"
+    assert third.status_code == 429
+    # The rejected GET was cancelled before its handler finished, and the POST
+    # never reached its handler.
+    assert handled == ["get"]
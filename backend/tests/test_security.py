@@ -23,6 +23,11 @@ def test_hash_and_verify_password():
     assert not verify_password("wrong-password", hashed)
 
 
+@pytest.mark.parametrize("stored_hash", ["", "hash", "$2b$12$" + "a" * 53])
+def test_verify_password_rejects_non_argon2_hashes(stored_hash: str):
+    assert not verify_password("super-secret-password", stored_hash)
+
+
 def test_needs_rehash_for_valid_hash():
     hashed = hash_password("another-secret")
     assert needs_rehash(hashed) is False
@@ -63,6 +63,7 @@ def _run_start_script(
                 "FAKE_STARTUP_LOG": str(log_path),
                 "FAKE_UV_SHOULD_FAIL": "1" if uv_should_fail else "0",
                 "DISMISSED_PRUNE_ON_STARTUP": prune_on_startup,
+                "DISMISSED_PRUNE_INTERVAL_SECONDS": "0",
                 "SYNC_DEFAULT_AVATARS_ON_STARTUP": "false",
                 "UVICORN_RELOAD": "false",
             }
@@ -119,6 +120,15 @@ def test_start_script_supports_prune_opt_out() -> None:
     assert 'Skipping dismissed-notification prune' in script
 
 
+def test_start_script_repeats_prune_on_an_interval() -> None:
+    script = (_backend_root() / "scripts" / "start.sh").read_text(encoding="utf-8")
+
+    assert (
+        'PRUNE_INTERVAL_SECONDS="${DISMISSED_PRUNE_INTERVAL_SECONDS:-900}"' in script
+    )
+    assert 'sleep "$PRUNE_INTERVAL_SECONDS"' in script
+
+
 def test_start_script_keeps_startup_alive_when_prune_fails() -> None:
     completed, log_output = _run_start_script(
         prune_on_startup="true",
@@ -3,6 +3,7 @@
 from unittest.mock import MagicMock
 
 import pytest
+import urllib3
 
 from services import storage
 
@@ -20,7 +21,9 @@ def test_get_minio_client_uses_settings(monkeypatch):
 
     monkeypatch.setattr(storage.settings, "minio_secure", True)
 
-    def fake_minio(endpoint, access_key, secret_key, secure):
+    http_clients = []
+
+    def fake_minio(endpoint, access_key, secret_key, secure, http_client):
         created_clients.append(
             {
                 "endpoint": endpoint,
@@ -29,6 +32,7 @@ def test_get_minio_client_uses_settings(monkeypatch):
                 "secure": secure,
             }
         )
+        http_clients.append(http_client)
         return mock_client
 
     monkeypatch.setattr(storage, "Minio", fake_minio)
@@ -45,6 +49,13 @@ def test_get_minio_client_uses_settings(monkeypatch):
             "secure": storage.settings.minio_secure,
         }
     ]
+    assert len(http_clients) == 1
+    assert isinstance(http_clients[0], urllib3.PoolManager)
+    pool_kw = http_clients[0].connection_pool_kw
+    assert pool_kw["maxsize"] == storage.MINIO_HTTP_POOL_MAXSIZE
+    assert pool_kw["block"] is True
+    assert pool_kw["retries"].total == storage.MINIO_HTTP_RETRIES
+    assert pool_kw["timeout"].read_timeout == storage.MINIO_HTTP_TIMEOUT_SECONDS
 
 
 def test_ensure_bucket_existing(monkeypatch):